@@ -1,11 +1,23 @@
+import os
+
 from .src.comfymath.convert import NODE_CLASS_MAPPINGS as convert_NCM
 from .src.comfymath.bool import NODE_CLASS_MAPPINGS as bool_NCM
 from .src.comfymath.int import NODE_CLASS_MAPPINGS as int_NCM
 from .src.comfymath.float import NODE_CLASS_MAPPINGS as float_NCM
 from .src.comfymath.number import NODE_CLASS_MAPPINGS as number_NCM
 from .src.comfymath.vec import NODE_CLASS_MAPPINGS as vec_NCM
+from .src.comfymath.vec_array import NODE_CLASS_MAPPINGS as vec_array_NCM
+from .src.comfymath.tensor import NODE_CLASS_MAPPINGS as tensor_NCM
+from .src.comfymath.reduction import NODE_CLASS_MAPPINGS as reduction_NCM
+from .src.comfymath.sequence import NODE_CLASS_MAPPINGS as sequence_NCM
+from .src.comfymath.curve import NODE_CLASS_MAPPINGS as curve_NCM
+from .src.comfymath.rng import NODE_CLASS_MAPPINGS as rng_NCM
+from .src.comfymath.loader import NODE_CLASS_MAPPINGS as loader_NCM
 from .src.comfymath.control import NODE_CLASS_MAPPINGS as control_NCM
 from .src.comfymath.graphics import NODE_CLASS_MAPPINGS as graphics_NCM
+from .src.comfymath.expression import NODE_CLASS_MAPPINGS as expression_NCM
+from .src.comfymath.folding import CONSTANT_FOLDING_ENV, install_prompt_hook
+from .src.comfymath.profiling import PROFILING_ENV, enable_profiling
 
 
 NODE_CLASS_MAPPINGS = {
@@ -15,8 +27,16 @@ NODE_CLASS_MAPPINGS = {
     **float_NCM,
     **number_NCM,
     **vec_NCM,
+    **vec_array_NCM,
+    **tensor_NCM,
+    **reduction_NCM,
+    **sequence_NCM,
+    **curve_NCM,
+    **rng_NCM,
+    **loader_NCM,
     **control_NCM,
     **graphics_NCM,
+    **expression_NCM,
 }
 
 
@@ -27,3 +47,10 @@ def remove_cm_prefix(node_mapping: str) -> str:
 
 
 NODE_DISPLAY_NAME_MAPPINGS = {key: remove_cm_prefix(key) for key in NODE_CLASS_MAPPINGS}
+
+
+if os.environ.get(CONSTANT_FOLDING_ENV, "0") not in ("", "0"):
+    install_prompt_hook()
+
+if os.environ.get(PROFILING_ENV, "0") not in ("", "0"):
+    enable_profiling(NODE_CLASS_MAPPINGS)
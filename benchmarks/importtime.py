@@ -0,0 +1,70 @@
+"""Measure how long importing the node package takes, using python -X importtime.
+
+Run from the repository root:
+
+    python benchmarks/importtime.py
+"""
+
+import json
+import re
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "comfymath_nodes"
+
+LOAD_PACKAGE = f"""
+import importlib.util, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location(
+    {PACKAGE!r}, {str(ROOT / "__init__.py")!r},
+    submodule_search_locations=[{str(ROOT)!r}],
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules[{PACKAGE!r}] = module
+spec.loader.exec_module(module)
+elapsed_us = int((time.perf_counter() - start) * 1e6)
+numpy_loaded = "numpy._core" in sys.modules or "numpy.core" in sys.modules
+print(elapsed_us, len(module.NODE_CLASS_MAPPINGS), numpy_loaded)
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def _importtime(code: str) -> tuple[dict[str, int], str]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    cumulative: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match is not None:
+            cumulative[match.group(3)] = int(match.group(2))
+    return cumulative, process.stdout
+
+
+def measure_import(repeat: int = 5) -> dict[str, Any]:
+    runs = [_importtime(LOAD_PACKAGE) for _ in range(repeat)]
+    package_us = min(int(stdout.split()[0]) for _, stdout in runs)
+    _, node_classes, numpy_loaded = runs[-1][1].split()
+    heaviest = sorted(runs[-1][0].items(), key=lambda item: item[1], reverse=True)
+    numpy_us = min(_importtime("import numpy")[0]["numpy"] for _ in range(repeat))
+    return {
+        "package_import_us": package_us,
+        "node_classes": int(node_classes),
+        "numpy_loaded": numpy_loaded == "True",
+        "numpy_import_us": numpy_us,
+        "heaviest_imports_us": dict(heaviest[:5]),
+    }
+
+
+if __name__ == "__main__":
+    json.dump(measure_import(), sys.stdout, indent=2)
+    print()
@@ -0,0 +1,378 @@
+"""Benchmark every op table entry and every node class through its op() entry point.
+
+Run from the repository root:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --threshold 0.1
+"""
+
+import argparse
+import contextlib
+import functools
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import numpy
+
+from importtime import measure_import
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "comfymath_nodes"
+TABLE_MODULES = ("float", "int", "bool", "vec", "vec_array")
+TABLE_PREFIXES = ("FLOAT_", "INT_", "BOOL_", "VEC_", "MAT_")
+LIST_SIZE = 1000
+PATHOLOGICAL_INT_INPUTS = [
+    ("CM_IntBinaryOperation", {"op": "Pow", "a": 10, "b": 10_000_000}),
+    ("CM_IntBinaryOperation", {"op": "Shl", "a": 1, "b": 10**12}),
+    ("CM_IntUnaryOperation", {"op": "Factorial", "a": 10**7}),
+]
+# Scalar inputs for ops whose domain excludes the generic samples.
+OP_SAMPLES: Mapping[str, Any] = {"Acosh": 2.0}
+IMAGE_SHAPES = [(512, 512), (1344, 768), (768, 1344), (1920, 1080), (2048, 512)]
+
+
+def load_package() -> Any:
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class SyntheticImage:
+    def __init__(self, width: int, height: int) -> None:
+        self.shape = (1, height, width, 3)
+
+    def size(self) -> tuple[int, ...]:
+        return self.shape
+
+
+SAMPLE_VALUES: Mapping[str, Any] = {
+    "FLOAT": 0.5,
+    "NUMBER": 0.5,
+    "INT": 3,
+    "BOOLEAN": True,
+    "BOOL": True,
+    "BOOLEAN,BOOL": True,
+    "*": 0.5,
+    "VEC2": (0.3, -1.2),
+    "VEC3": (0.3, -1.2, 4.0),
+    "VEC4": (0.3, -1.2, 4.0, 0.1),
+    "MAT3": ((2.0, 0.5, 0.0), (0.0, 1.0, -0.5), (0.25, 0.0, 3.0)),
+    "MAT4": (
+        (2.0, 0.5, 0.0, 1.0),
+        (0.0, 1.0, -0.5, 2.0),
+        (0.25, 0.0, 3.0, 3.0),
+        (0.0, 0.0, 0.0, 1.0),
+    ),
+    "IMAGE": SyntheticImage(1920, 1080),
+    **{
+        f"VEC{d}_ARRAY": numpy.linspace(-1.0, 1.0, LIST_SIZE * d).reshape(-1, d)
+        for d in (2, 3, 4)
+    },
+}
+
+
+def _table_args(name: str, op: str) -> tuple:
+    if name.endswith("UFUNCS"):
+        values = numpy.linspace(0.25, 4.0, LIST_SIZE)
+        return (values,) if "UNARY" in name else (values, values[::-1].copy())
+    if name.startswith("VEC_ARRAY_"):
+        a = SAMPLE_VALUES["VEC3_ARRAY"]
+        if "SCALAR_OPERATION" in name:
+            return (a, 2.0)
+        return (a,) if "UNARY" in name else (a, a[::-1].copy())
+    if name.startswith("VEC_"):
+        a, b = numpy.array(SAMPLE_VALUES["VEC3"]), numpy.array((2.5, 0.75, -0.5))
+        if "SCALAR_OPERATION" in name:
+            return (a, 2.0)
+        return (a,) if "UNARY" in name else (a, b)
+    if name.startswith("MAT_"):
+        a = numpy.array(SAMPLE_VALUES["MAT4"])
+        return (a,) if "UNARY" in name else (a, a.T.copy())
+    sample = {"FLOAT_": (0.5, 0.25), "INT_": (7, 3), "BOOL_": (True, False)}
+    for prefix, values in sample.items():
+        if name.startswith(prefix):
+            if op in OP_SAMPLES:
+                values = (OP_SAMPLES[op],) + values[1:]
+            return values[:1] if "UNARY" in name else values
+    raise ValueError(f"No sample arguments for {name}")
+
+
+def table_cases(package: Any) -> Iterator[tuple[str, Callable[[], Any]]]:
+    for module_name in TABLE_MODULES:
+        module = importlib.import_module(f"{PACKAGE}.src.comfymath.{module_name}")
+        for name, table in vars(module).items():
+            if not name.startswith(TABLE_PREFIXES) or not isinstance(table, Mapping):
+                continue
+            if not all(callable(func) for func in table.values()):
+                continue
+            for op, func in table.items():
+                args = _table_args(name, op)
+                yield f"table/{name}/{op}", lambda func=func, args=args: func(*args)
+
+
+def node_input_overrides(
+    package: Any, data_dir: Path
+) -> Mapping[str, Mapping[str, Any]]:
+    # Inputs the generic samples get wrong: chunk indices past the end,
+    # unconnected Switch inputs, hidden inputs and files to load.
+    control = importlib.import_module(f"{PACKAGE}.src.comfymath.control")
+    arrays = data_dir / "arrays.npz"
+    numpy.savez(
+        arrays,
+        **{
+            f"vec{d}": numpy.linspace(-1.0, 1.0, LIST_SIZE * d).reshape(-1, d)
+            for d in (2, 3, 4)
+        },
+    )
+    chunked = {
+        class_name: {"chunk_index": 0}
+        for class_name, node_class in package.NODE_CLASS_MAPPINGS.items()
+        if "chunk_index" in node_class.INPUT_TYPES().get("required", {})
+    }
+    return {
+        **chunked,
+        "CM_Mat4LookAt": {"eye": (0.0, 0.0, 5.0)},
+        "CM_Switch": {"index": 0, "input_0": SAMPLE_VALUES["*"]},
+        "CM_WhileLoopOpen": {"unique_id": "1"},
+        "CM_WhileLoopClose": {
+            "loop": control.LoopState("1", 0, None),
+            "condition": False,
+        },
+        "CM_ForLoopOpen": {"unique_id": "1"},
+        "CM_ForLoopClose": {"loop": control.LoopState("1", 0, 1)},
+        "CM_LoadNumberArray": {"path": str(arrays), "key": "vec4"},
+        **{
+            f"CM_LoadVec{d}Array": {"path": str(arrays), "key": f"vec{d}"}
+            for d in (2, 3, 4)
+        },
+    }
+
+
+def _node_inputs(
+    node_class: Any, overrides: Mapping[str, Any]
+) -> Optional[list[tuple[str, dict[str, Any]]]]:
+    input_types = node_class.INPUT_TYPES()
+    fixed: dict[str, Any] = dict(overrides)
+    combos: dict[str, list] = {}
+    for name, spec in input_types.get("required", {}).items():
+        if name in overrides:
+            continue
+        if isinstance(spec[0], list):
+            combos[name] = spec[0]
+        elif isinstance(spec[0], str) and spec[0] in SAMPLE_VALUES:
+            fixed[name] = SAMPLE_VALUES[spec[0]]
+        elif len(spec) > 1 and "default" in spec[1]:
+            fixed[name] = spec[1]["default"]
+        else:
+            return None
+    variants: list[tuple[str, dict[str, Any]]] = [("", fixed)]
+    for name, options in combos.items():
+        variants = [
+            (f"{label},{option}" if label else str(option), {**inputs, name: option})
+            for label, inputs in variants
+            for option in options
+        ]
+    variants = [
+        (label, {**inputs, "a": OP_SAMPLES[inputs["op"]]})
+        if inputs.get("op") in OP_SAMPLES and "a" in inputs
+        else (label, inputs)
+        for label, inputs in variants
+    ]
+    if getattr(node_class, "INPUT_IS_LIST", False):
+        variants = [
+            (
+                label,
+                {
+                    name: [value]
+                    if name in combos or name in overrides
+                    else [value] * LIST_SIZE
+                    for name, value in inputs.items()
+                },
+            )
+            for label, inputs in variants
+        ]
+    return variants
+
+
+def _missing_inputs(class_name: str) -> None:
+    raise ValueError(f"No sample inputs for {class_name}")
+
+
+def node_cases(
+    package: Any, overrides: Mapping[str, Mapping[str, Any]]
+) -> Iterator[tuple[str, Callable[[], Any]]]:
+    for class_name, node_class in package.NODE_CLASS_MAPPINGS.items():
+        variants = _node_inputs(node_class, overrides.get(class_name, {}))
+        if variants is None:
+            yield f"node/{class_name}", functools.partial(_missing_inputs, class_name)
+            continue
+        for label, inputs in variants:
+            func = getattr(node_class(), node_class.FUNCTION)
+            name = f"node/{class_name}/{label}" if label else f"node/{class_name}"
+            yield name, functools.partial(func, **inputs)
+
+
+def resolution_cases(package: Any) -> Iterator[tuple[str, Callable[[], Any]]]:
+    graphics = importlib.import_module(f"{PACKAGE}.src.comfymath.graphics")
+    for class_name, node_class in package.NODE_CLASS_MAPPINGS.items():
+        if not issubclass(node_class, graphics.NearestResolution):
+            continue
+        node = node_class()
+        for width, height in IMAGE_SHAPES:
+            image: Any = SyntheticImage(width, height)
+            if getattr(node_class, "INPUT_IS_LIST", False):
+                image = [image] * LIST_SIZE
+            yield (
+                f"resolution/{class_name}/{width}x{height}",
+                lambda node=node, image=image: node.op(image),
+            )
+
+
+def _rejected(func: Callable[[], Any]) -> None:
+    try:
+        func()
+    except ValueError:
+        return
+    raise AssertionError("input was not rejected")
+
+
+def guard_cases(package: Any) -> Iterator[tuple[str, Callable[[], Any]]]:
+    for class_name, inputs in PATHOLOGICAL_INT_INPUTS:
+        node = package.NODE_CLASS_MAPPINGS[class_name]()
+        yield (
+            f"guard/{class_name}/{inputs['op']}",
+            functools.partial(_rejected, functools.partial(node.op, **inputs)),
+        )
+
+
+def measure(func: Callable[[], Any], min_time: float, repeat: int) -> float:
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(filter: str, min_time: float, repeat: int) -> dict[str, Any]:
+    package = load_package()
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        loader = importlib.import_module(f"{PACKAGE}.src.comfymath.loader")
+        os.environ[loader.ARRAY_DIRS_ENV] = data_dir
+        overrides = node_input_overrides(package, Path(data_dir))
+        for cases in (
+            table_cases,
+            functools.partial(node_cases, overrides=overrides),
+            resolution_cases,
+            guard_cases,
+        ):
+            for name, func in cases(package):
+                if filter not in name:
+                    continue
+                try:
+                    func()
+                except Exception as e:
+                    results[name] = {"error": f"{type(e).__name__}: {e}"}
+                    continue
+                results[name] = {"ns_per_call": measure(func, min_time, repeat) * 1e9}
+    if filter in "import/package":
+        results["import/package"] = measure_import()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Mapping[str, Any], baseline: Mapping[str, Any], threshold: float
+) -> list[str]:
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric in ("ns_per_call", "package_import_us"):
+            if metric not in result or metric not in previous:
+                continue
+            ratio = result[metric] / previous[metric]
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    f"{name} {metric}: {previous[metric]:.0f} -> "
+                    f"{result[metric]:.0f} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run(args.filter, args.min_time, args.repeat)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    errors = [
+        f"{name}: {result['error']}"
+        for name, result in results["results"].items()
+        if "error" in result
+    ]
+    for error in errors:
+        print(f"ERROR {error}", file=sys.stderr)
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Per-call cost of the Vec node kernels against the NumPy round-trip path.
+
+Run from the repository root:
+
+    python benchmarks/vec_kernels.py
+"""
+
+import sys
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import numpy  # noqa: E402
+
+from comfymath import smallvec, vec  # noqa: E402
+
+SAMPLES = {
+    2: ((0.3, -1.2), (2.5, 0.75)),
+    3: ((0.3, -1.2, 4.0), (2.5, 0.75, -0.5)),
+    4: ((0.3, -1.2, 4.0, 0.1), (2.5, 0.75, -0.5, 1.5)),
+}
+
+GROUPS = [
+    ("UNARY_KERNELS", vec.VEC_UNARY_OPERATIONS, 1, True),
+    ("TO_SCALAR_UNARY_KERNELS", vec.VEC_TO_SCALAR_UNARY_OPERATION, 1, False),
+    ("UNARY_CONDITION_KERNELS", vec.VEC_UNARY_CONDITIONS, 1, False),
+    ("BINARY_KERNELS", vec.VEC_BINARY_OPERATIONS, 2, True),
+    ("TO_SCALAR_BINARY_KERNELS", vec.VEC_TO_SCALAR_BINARY_OPERATION, 2, False),
+    ("BINARY_CONDITION_KERNELS", vec.VEC_BINARY_CONDITIONS, 2, False),
+    ("SCALAR_KERNELS", vec.VEC_SCALAR_OPERATION, 0, True),
+]
+
+
+def _best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int = 20000) -> None:
+    print(f"{'op':<24}{'numpy (us)':>12}{'kernel (us)':>13}{'speedup':>9}")
+    for dim, (a, b) in SAMPLES.items():
+        from_numpy = getattr(vec, f"_vec{dim}_from_numpy")
+        for group, table, arity, returns_vec in GROUPS:
+            kernels = getattr(smallvec, f"VEC{dim}_{group}")
+            for op, kernel in kernels.items():
+                reference = table[op]
+                convert = from_numpy if returns_vec else (lambda x: x)
+                if arity == 1:
+                    args: tuple = (a,)
+                    numpy_path = lambda: convert(reference(numpy.array(a)))
+                elif arity == 2:
+                    args = (a, b)
+                    numpy_path = lambda: convert(
+                        reference(numpy.array(a), numpy.array(b))
+                    )
+                else:
+                    args = (a, 2.0)
+                    numpy_path = lambda: convert(reference(numpy.array(a), 2.0))
+                numpy_time = _best(numpy_path, number)
+                kernel_time = _best(lambda: kernel(*args), number)
+                print(
+                    f"{f'Vec{dim} {op}':<24}"
+                    f"{numpy_time * 1e6:>12.3f}{kernel_time * 1e6:>13.3f}"
+                    f"{numpy_time / kernel_time:>8.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
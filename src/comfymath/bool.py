@@ -1,22 +1,40 @@
-from typing import Any, Callable, Mapping
+from typing import Any, Mapping
+
+from .registry import Operation, OperationTable, register
 
 DEFAULT_BOOL = ("BOOLEAN", {"default": False})
 
 
-BOOL_UNARY_OPERATIONS: Mapping[str, Callable[[bool], bool]] = {
-    "Not": lambda a: not a,
-}
+BOOL_UNARY_OPERATIONS = register(
+    OperationTable(
+        "bool_unary",
+        1,
+        "BOOLEAN",
+        "BOOLEAN",
+        [
+            Operation("Not", lambda a: not a),
+        ],
+    )
+)
 
-BOOL_BINARY_OPERATIONS: Mapping[str, Callable[[bool, bool], bool]] = {
-    "Nor": lambda a, b: not (a or b),
-    "Xor": lambda a, b: a ^ b,
-    "Nand": lambda a, b: not (a and b),
-    "And": lambda a, b: a and b,
-    "Xnor": lambda a, b: not (a ^ b),
-    "Or": lambda a, b: a or b,
-    "Eq": lambda a, b: a == b,
-    "Neq": lambda a, b: a != b,
-}
+BOOL_BINARY_OPERATIONS = register(
+    OperationTable(
+        "bool_binary",
+        2,
+        "BOOLEAN",
+        "BOOLEAN",
+        [
+            Operation("Nor", lambda a, b: not (a or b)),
+            Operation("Xor", lambda a, b: a ^ b),
+            Operation("Nand", lambda a, b: not (a and b)),
+            Operation("And", lambda a, b: a and b),
+            Operation("Xnor", lambda a, b: not (a ^ b)),
+            Operation("Or", lambda a, b: a or b),
+            Operation("Eq", lambda a, b: a == b),
+            Operation("Neq", lambda a, b: a != b),
+        ],
+    )
+)
 
 
 class BoolUnaryOperation:
@@ -1,3 +1,328 @@
-from typing import Any, Mapping
+import os
 
-NODE_CLASS_MAPPINGS: Mapping[str, Any] = {}
+from typing import Any, Mapping, NamedTuple, Optional
+
+from .cost import check_int_cost
+from .float import DEFAULT_FLOAT, FLOAT_BINARY_CONDITIONS, FLOAT_BINARY_OPERATIONS
+from .folding import is_link
+from .int import INT_BINARY_OPERATIONS
+
+ANY = "*"
+LAZY_ANY = (ANY, {"lazy": True})
+SWITCH_INPUTS = 8
+# The float and bool nodes output BOOLEAN, the int, number and vec condition
+# nodes BOOL, ComfyUI accepts either for a comma separated type.
+CONDITION_INPUT = ("BOOLEAN,BOOL", {"forceInput": True})
+
+MAX_LOOP_ITERATIONS_ENV = "COMFYMATH_MAX_LOOP_ITERATIONS"
+MAX_LOOP_ITERATIONS = int(os.environ.get(MAX_LOOP_ITERATIONS_ENV, 1000))
+LOOP_VALUES = 4
+LOOP_VALUE_NAMES = tuple(f"value_{i}" for i in range(LOOP_VALUES))
+LOOP_VALUE_INPUTS: Mapping[str, Any] = {name: (ANY,) for name in LOOP_VALUE_NAMES}
+LOOP_HIDDEN_INPUTS: Mapping[str, Any] = {
+    "dynprompt": "DYNPROMPT",
+    "unique_id": "UNIQUE_ID",
+}
+# Set by the close node on the copy of the open node it expands, the first
+# iteration leaves it unconnected.
+ITERATION_INPUT = ("INT", {"default": 0, "min": 0, "forceInput": True})
+
+
+def _pending(name: str, inputs: Mapping[str, Any]) -> list[str]:
+    # Lazy inputs that have not been evaluated yet are passed as None, inputs
+    # that are not connected at all are left out.
+    if name in inputs and inputs[name] is None:
+        return [name]
+    return []
+
+
+class If:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "condition": CONDITION_INPUT,
+                "on_true": LAZY_ANY,
+                "on_false": LAZY_ANY,
+            }
+        }
+
+    RETURN_TYPES = (ANY,)
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def check_lazy_status(
+        self, condition: bool, on_true: Any = None, on_false: Any = None
+    ) -> list[str]:
+        name = "on_true" if condition else "on_false"
+        return _pending(name, {"on_true": on_true, "on_false": on_false})
+
+    def op(self, condition: bool, on_true: Any, on_false: Any) -> tuple[Any]:
+        return (on_true if condition else on_false,)
+
+
+class Switch:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "index": ("INT", {"default": 0, "min": 0, "max": SWITCH_INPUTS - 1}),
+            },
+            "optional": {f"input_{i}": LAZY_ANY for i in range(SWITCH_INPUTS)},
+        }
+
+    RETURN_TYPES = (ANY,)
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def check_lazy_status(self, index: int, **inputs: Any) -> list[str]:
+        return _pending(f"input_{index}", inputs)
+
+    def op(self, index: int, **inputs: Any) -> tuple[Any]:
+        name = f"input_{index}"
+        if name not in inputs:
+            raise ValueError(
+                f"Switch index {index} selects {name}, which is not connected"
+            )
+        return (inputs[name],)
+
+
+class Select:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_BINARY_CONDITIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+                "b": DEFAULT_FLOAT,
+                "on_true": LAZY_ANY,
+                "on_false": LAZY_ANY,
+            }
+        }
+
+    RETURN_TYPES = (ANY, "BOOLEAN")
+    RETURN_NAMES = ("value", "condition")
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def check_lazy_status(
+        self,
+        op: str,
+        a: float,
+        b: float,
+        on_true: Any = None,
+        on_false: Any = None,
+    ) -> list[str]:
+        name = "on_true" if FLOAT_BINARY_CONDITIONS[op](a, b) else "on_false"
+        return _pending(name, {"on_true": on_true, "on_false": on_false})
+
+    def op(
+        self, op: str, a: float, b: float, on_true: Any, on_false: Any
+    ) -> tuple[Any, bool]:
+        condition = FLOAT_BINARY_CONDITIONS[op](a, b)
+        return (on_true if condition else on_false, condition)
+
+
+class LoopState(NamedTuple):
+    open_id: str
+    iteration: int
+    count: Optional[int]
+
+
+def _loop_values(values: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple(values.get(name) for name in LOOP_VALUE_NAMES)
+
+
+def _loop_body(dynprompt: Any, open_id: str, close_id: str) -> list[str]:
+    reaches_open: dict[str, bool] = {open_id: True}
+
+    def visit(node_id: str) -> bool:
+        if node_id not in reaches_open:
+            reaches_open[node_id] = False
+            parents = [
+                value[0]
+                for value in dynprompt.get_node(node_id)["inputs"].values()
+                if is_link(value)
+            ]
+            reaches_open[node_id] = any([visit(parent) for parent in parents])
+        return reaches_open[node_id]
+
+    visit(close_id)
+    return [node_id for node_id, inside in reaches_open.items() if inside]
+
+
+def _next_iteration(
+    loop: LoopState, dynprompt: Any, unique_id: str, values: Mapping[str, Any]
+) -> dict[str, Any]:
+    from comfy_execution.graph_utils import GraphBuilder
+
+    if loop.iteration + 1 >= MAX_LOOP_ITERATIONS:
+        raise ValueError(
+            f"Loop did not finish within {MAX_LOOP_ITERATIONS} iterations"
+            f" ({MAX_LOOP_ITERATIONS_ENV})"
+        )
+    body = _loop_body(dynprompt, loop.open_id, unique_id)
+    graph = GraphBuilder()
+    for node_id in body:
+        node = graph.node(dynprompt.get_node(node_id)["class_type"], node_id)
+        node.set_override_display_id(dynprompt.get_display_node_id(node_id))
+    for node_id in body:
+        node = graph.lookup_node(node_id)
+        for name, value in dynprompt.get_node(node_id)["inputs"].items():
+            if is_link(value) and value[0] in body:
+                value = graph.lookup_node(value[0]).out(value[1])
+            node.set_input(name, value)
+    open_node = graph.lookup_node(loop.open_id)
+    for name in LOOP_VALUE_NAMES:
+        open_node.set_input(name, values.get(name))
+    open_node.set_input("iteration", loop.iteration + 1)
+    close_node = graph.lookup_node(unique_id)
+    return {
+        "result": tuple(close_node.out(i) for i in range(LOOP_VALUES)),
+        "expand": graph.finalize(),
+    }
+
+
+class WhileLoopOpen:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {},
+            "optional": {**LOOP_VALUE_INPUTS, "iteration": ITERATION_INPUT},
+            "hidden": {"unique_id": "UNIQUE_ID"},
+        }
+
+    RETURN_TYPES = ("LOOP", "INT") + (ANY,) * LOOP_VALUES
+    RETURN_NAMES = ("loop", "iteration") + LOOP_VALUE_NAMES
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def op(self, unique_id: str, iteration: int = 0, **values: Any) -> tuple[Any, ...]:
+        return (LoopState(unique_id, iteration, None), iteration) + _loop_values(values)
+
+
+class WhileLoopClose:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "loop": ("LOOP",),
+                "condition": CONDITION_INPUT,
+            },
+            "optional": LOOP_VALUE_INPUTS,
+            "hidden": LOOP_HIDDEN_INPUTS,
+        }
+
+    RETURN_TYPES = (ANY,) * LOOP_VALUES
+    RETURN_NAMES = LOOP_VALUE_NAMES
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def op(
+        self,
+        loop: LoopState,
+        condition: bool,
+        dynprompt: Any = None,
+        unique_id: Optional[str] = None,
+        **values: Any,
+    ) -> Any:
+        if not condition:
+            return _loop_values(values)
+        return _next_iteration(loop, dynprompt, unique_id, values)
+
+
+class ForLoopOpen:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "count": ("INT", {"default": 1, "min": 1, "max": MAX_LOOP_ITERATIONS}),
+            },
+            "optional": {**LOOP_VALUE_INPUTS, "iteration": ITERATION_INPUT},
+            "hidden": {"unique_id": "UNIQUE_ID"},
+        }
+
+    RETURN_TYPES = ("LOOP", "INT") + (ANY,) * LOOP_VALUES
+    RETURN_NAMES = ("loop", "index") + LOOP_VALUE_NAMES
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def op(
+        self, count: int, unique_id: str, iteration: int = 0, **values: Any
+    ) -> tuple[Any, ...]:
+        return (LoopState(unique_id, iteration, count), iteration) + _loop_values(
+            values
+        )
+
+
+class ForLoopClose:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {"loop": ("LOOP",)},
+            "optional": LOOP_VALUE_INPUTS,
+            "hidden": LOOP_HIDDEN_INPUTS,
+        }
+
+    RETURN_TYPES = (ANY,) * LOOP_VALUES
+    RETURN_NAMES = LOOP_VALUE_NAMES
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def op(
+        self,
+        loop: LoopState,
+        dynprompt: Any = None,
+        unique_id: Optional[str] = None,
+        **values: Any,
+    ) -> Any:
+        if loop.count is None:
+            raise ValueError("ForLoopClose must be connected to a ForLoopOpen")
+        if loop.iteration + 1 >= loop.count:
+            return _loop_values(values)
+        return _next_iteration(loop, dynprompt, unique_id, values)
+
+
+ACCUMULATE_OPERATIONS = ("Add", "Sub", "Mul", "Min", "Max")
+
+
+def accumulate(op: str, accumulator: Any, value: Any) -> Any:
+    if isinstance(accumulator, tuple):
+        if not isinstance(value, tuple) or len(value) != len(accumulator):
+            raise ValueError("Cannot accumulate vectors of different sizes")
+        return tuple(accumulate(op, x, y) for x, y in zip(accumulator, value))
+    if isinstance(accumulator, int) and isinstance(value, int):
+        check_int_cost(op, accumulator, value)
+        return INT_BINARY_OPERATIONS[op](accumulator, value)
+    return FLOAT_BINARY_OPERATIONS[op](accumulator, value)
+
+
+class Accumulate:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(ACCUMULATE_OPERATIONS),),
+                "accumulator": (ANY,),
+                "value": (ANY,),
+            }
+        }
+
+    RETURN_TYPES = (ANY,)
+    FUNCTION = "op"
+    CATEGORY = "math/control"
+
+    def op(self, op: str, accumulator: Any, value: Any) -> tuple[Any]:
+        return (accumulate(op, accumulator, value),)
+
+
+NODE_CLASS_MAPPINGS: Mapping[str, Any] = {
+    "CM_If": If,
+    "CM_Switch": Switch,
+    "CM_Select": Select,
+    "CM_WhileLoopOpen": WhileLoopOpen,
+    "CM_WhileLoopClose": WhileLoopClose,
+    "CM_ForLoopOpen": ForLoopOpen,
+    "CM_ForLoopClose": ForLoopClose,
+    "CM_Accumulate": Accumulate,
+}
@@ -0,0 +1,154 @@
+import math
+import os
+
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
+
+INT_MAX_RESULT_BITS_ENV = "COMFYMATH_INT_MAX_RESULT_BITS"
+INT_MAX_COST_ENV = "COMFYMATH_INT_MAX_COST"
+DEFAULT_INT_MAX_RESULT_BITS = 1 << 22
+DEFAULT_INT_MAX_COST = 2 * 10**8
+
+# CPython stores big ints in 30 bit limbs, multiplies large ones with
+# Karatsuba and divides them with schoolbook long division, so costs are
+# counted in limb operations.
+LIMB_BITS = 30
+KARATSUBA_EXPONENT = math.log2(3)
+MAX_EXPONENT_BITS = 1000
+
+
+class IntCostExceeded(ValueError):
+    pass
+
+
+class IntCost(NamedTuple):
+    bits: float
+    cost: float
+
+
+class IntCostLimits(NamedTuple):
+    max_result_bits: float
+    max_cost: float
+
+
+INT_COST_LIMITS = IntCostLimits(
+    float(os.environ.get(INT_MAX_RESULT_BITS_ENV, DEFAULT_INT_MAX_RESULT_BITS)),
+    float(os.environ.get(INT_MAX_COST_ENV, DEFAULT_INT_MAX_COST)),
+)
+
+UNBOUNDED = IntCost(math.inf, math.inf)
+
+
+def _limbs(bits: float) -> float:
+    return max(bits / LIMB_BITS, 1.0)
+
+
+def _multiply(bits: float) -> IntCost:
+    return IntCost(bits, _limbs(bits) ** KARATSUBA_EXPONENT)
+
+
+def _cheap(a: int) -> IntCost:
+    return IntCost(max(a.bit_length(), 1), 1.0)
+
+
+def _pow(a: int, b: int) -> IntCost:
+    if b < 0 or abs(a) < 2:
+        return _cheap(a)
+    if b.bit_length() > MAX_EXPONENT_BITS:
+        return UNBOUNDED
+    return _multiply(b * math.log2(abs(a)))
+
+
+def _shl(a: int, b: int) -> IntCost:
+    if b < 0 or a == 0:
+        return _cheap(a)
+    if b.bit_length() > MAX_EXPONENT_BITS:
+        return UNBOUNDED
+    bits = a.bit_length() + b
+    return IntCost(bits, _limbs(bits))
+
+
+def _factorial(a: int) -> IntCost:
+    if a < 2:
+        return _cheap(1)
+    if a.bit_length() > MAX_EXPONENT_BITS:
+        return UNBOUNDED
+    bits = math.lgamma(a + 1) / math.log(2)
+    return IntCost(bits, 2 * _multiply(bits).cost)
+
+
+def _divide(a: int, b: int, remainder: bool = False) -> IntCost:
+    a_bits, b_bits = a.bit_length(), b.bit_length()
+    if b_bits == 0 or a_bits < b_bits:
+        return _cheap(a)
+    quotient_bits = a_bits - b_bits + 1
+    bits = b_bits if remainder else quotient_bits
+    return IntCost(bits, _limbs(b_bits) * _limbs(quotient_bits))
+
+
+def _prod(a: Sequence[int]) -> IntCost:
+    # math.prod multiplies into a running product, each step costing about
+    # one Karatsuba product per chunk of the product the size of the factor.
+    bits = 0.0
+    cost = 0.0
+    for value in a:
+        if value == 0:
+            return _cheap(0)
+        factor_bits = value.bit_length()
+        bits += factor_bits
+        cost += _limbs(bits) * _limbs(factor_bits) ** (KARATSUBA_EXPONENT - 1)
+    return IntCost(max(bits, 1), cost)
+
+
+INT_COST_ESTIMATORS: Mapping[str, Callable[..., IntCost]] = {
+    "Sqr": lambda a: _multiply(2 * a.bit_length()),
+    "Cube": lambda a: _multiply(3 * a.bit_length()),
+    "Factorial": _factorial,
+    "Mul": lambda a, b: _multiply(a.bit_length() + b.bit_length()),
+    "Pow": _pow,
+    "Shl": _shl,
+    "Div": _divide,
+    "FloorDiv": _divide,
+    "Mod": lambda a, b: _divide(a, b, remainder=True),
+    "Prod": _prod,
+}
+
+
+def _is_int(arg: Any) -> bool:
+    if isinstance(arg, (list, tuple)):
+        return all(isinstance(value, int) for value in arg)
+    return isinstance(arg, int)
+
+
+def estimate_int_cost(op: str, *args: Any) -> IntCost:
+    estimator = INT_COST_ESTIMATORS.get(op)
+    if estimator is None or not all(_is_int(arg) for arg in args):
+        return IntCost(0.0, 0.0)
+    return estimator(*args)
+
+
+def check_int_cost(
+    op: str, *args: Any, limits: IntCostLimits = INT_COST_LIMITS
+) -> IntCost:
+    estimate = estimate_int_cost(op, *args)
+    if estimate.bits > limits.max_result_bits:
+        raise IntCostExceeded(
+            f"{op} would produce a result of about {estimate.bits:.3g} bits, over "
+            f"the limit of {limits.max_result_bits:.3g} ({INT_MAX_RESULT_BITS_ENV})"
+        )
+    if estimate.cost > limits.max_cost:
+        raise IntCostExceeded(
+            f"{op} would take about {estimate.cost:.3g} limb operations, over "
+            f"the limit of {limits.max_cost:.3g} ({INT_MAX_COST_ENV})"
+        )
+    return estimate
+
+
+def bounded(op: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    if op not in INT_COST_ESTIMATORS:
+        return func
+
+    def call(*args: Any) -> Any:
+        check_int_cost(op, *args)
+        return func(*args)
+
+    return call
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import functools
+import math
+import re
+
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+from .lazy import lazy_import
+from .sequence import MAX_CHUNK_SIZE
+
+numpy = lazy_import("numpy")
+
+CURVE_CACHE_SIZE = 256
+EASING_LUT_SIZE = 4097
+DEFAULT_BEZIER = (0.25, 0.1, 0.25, 1.0)
+DEFAULT_KEYFRAMES = "0: 0.0\n24: 1.0"
+
+_BACK = 1.70158
+_BACK_IN_OUT = _BACK * 1.525
+
+
+def _bounce_out(t: numpy.ndarray) -> numpy.ndarray:
+    n, d = 7.5625, 2.75
+    return numpy.select(
+        [t < 1 / d, t < 2 / d, t < 2.5 / d],
+        [n * t * t, n * (t - 1.5 / d) ** 2 + 0.75, n * (t - 2.25 / d) ** 2 + 0.9375],
+        n * (t - 2.625 / d) ** 2 + 0.984375,
+    )
+
+
+def _elastic_in(t: numpy.ndarray) -> numpy.ndarray:
+    eased = -(2.0 ** (10 * t - 10)) * numpy.sin((10 * t - 10.75) * math.tau / 3)
+    return numpy.where((t == 0) | (t == 1), t, eased)
+
+
+def _back_in(overshoot: float) -> Callable[[numpy.ndarray], numpy.ndarray]:
+    return lambda t: (overshoot + 1) * t**3 - overshoot * t**2
+
+
+def _elastic_in_out(t: numpy.ndarray) -> numpy.ndarray:
+    wave = numpy.sin((20 * t - 11.125) * math.tau / 4.5) / 2
+    eased = numpy.where(
+        t < 0.5, -(2.0 ** (20 * t - 10)) * wave, 2.0 ** (10 - 20 * t) * wave + 1
+    )
+    return numpy.where((t == 0) | (t == 1), t, eased)
+
+
+# Ease-in shapes from easings.net, the out and in-out variants are derived
+# except where easings.net uses other constants for in-out.
+EASE_IN: Mapping[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
+    "Sine": lambda t: 1 - numpy.cos(t * math.pi / 2),
+    "Quad": lambda t: t**2,
+    "Cubic": lambda t: t**3,
+    "Quart": lambda t: t**4,
+    "Quint": lambda t: t**5,
+    "Expo": lambda t: numpy.where(t == 0, 0.0, 2.0 ** (10 * t - 10)),
+    "Circ": lambda t: 1 - numpy.sqrt(numpy.maximum(1 - t * t, 0.0)),
+    "Back": _back_in(_BACK),
+    "Elastic": _elastic_in,
+    "Bounce": lambda t: 1 - _bounce_out(1 - t),
+}
+
+
+def _ease_out(ease_in: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda t: 1 - ease_in(1 - t)
+
+
+def _ease_in_out(ease_in: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda t: numpy.where(
+        t < 0.5,
+        ease_in(numpy.minimum(2 * t, 1.0)) / 2,
+        1 - ease_in(numpy.minimum(2 - 2 * t, 1.0)) / 2,
+    )
+
+
+EASE_IN_OUT: Mapping[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
+    **{name: _ease_in_out(func) for name, func in EASE_IN.items()},
+    "Back": _ease_in_out(_back_in(_BACK_IN_OUT)),
+    "Elastic": _elastic_in_out,
+}
+
+EASINGS: Mapping[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
+    **{f"EaseIn{name}": func for name, func in EASE_IN.items()},
+    **{f"EaseOut{name}": _ease_out(func) for name, func in EASE_IN.items()},
+    **{f"EaseInOut{name}": func for name, func in EASE_IN_OUT.items()},
+}
+
+INTERPOLATIONS = (
+    "Linear",
+    "Step",
+    "Smoothstep",
+    "CatmullRom",
+    "Bezier",
+    *EASINGS,
+)
+
+
+class Interpolation(NamedTuple):
+    name: str
+    bezier: tuple[float, ...] = DEFAULT_BEZIER
+
+
+class Keyframes(NamedTuple):
+    frames: tuple[float, ...]
+    values: tuple[tuple[float, ...], ...]
+    interpolations: tuple[Optional[Interpolation], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _lut_x() -> numpy.ndarray:
+    return numpy.linspace(0.0, 1.0, EASING_LUT_SIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def easing_lut(name: str) -> numpy.ndarray:
+    lut = EASINGS[name](_lut_x())
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=CURVE_CACHE_SIZE)
+def bezier_lut(bezier: tuple[float, ...]) -> tuple[numpy.ndarray, numpy.ndarray]:
+    x1, y1, x2, y2 = bezier
+    s = _lut_x()
+    r = 1 - s
+    x = 3 * r * r * s * x1 + 3 * r * s * s * x2 + s**3
+    y = 3 * r * r * s * y1 + 3 * r * s * s * y2 + s**3
+    return x, y
+
+
+def ease(interpolation: Interpolation, t: numpy.ndarray) -> numpy.ndarray:
+    name = interpolation.name
+    if name == "Linear":
+        return t
+    if name == "Step":
+        return numpy.where(t >= 1, 1.0, 0.0)
+    if name == "Smoothstep":
+        return t * t * (3 - 2 * t)
+    if name == "Bezier":
+        return numpy.interp(t, *bezier_lut(interpolation.bezier))
+    return numpy.interp(t, _lut_x(), easing_lut(name))
+
+
+def _catmull_rom(
+    values: numpy.ndarray, segment: numpy.ndarray, t: numpy.ndarray
+) -> numpy.ndarray:
+    last = len(values) - 1
+    p0 = values[numpy.maximum(segment - 1, 0)]
+    p1 = values[segment]
+    p2 = values[segment + 1]
+    p3 = values[numpy.minimum(segment + 2, last)]
+    t = t[:, None]
+    return 0.5 * (
+        2 * p1
+        + (p2 - p0) * t
+        + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t**2
+        + (3 * p1 - p0 - 3 * p2 + p3) * t**3
+    )
+
+
+_INTERPOLATION_NAMES = {name.lower(): name for name in INTERPOLATIONS}
+_BEZIER = re.compile(r"^bezier\((.*)\)$", re.IGNORECASE)
+_KEYFRAME = re.compile(r"^([^:]+):\s*(\(.*?\)|\[.*?\]|\S+)\s*(.*)$")
+
+
+def parse_interpolation(text: str) -> Interpolation:
+    text = text.replace(" ", "")
+    match = _BEZIER.match(text)
+    if match:
+        try:
+            bezier = tuple(float(x) for x in match.group(1).split(","))
+        except ValueError:
+            bezier = ()
+        if len(bezier) != 4 or not all(0 <= x <= 1 for x in bezier[::2]):
+            raise ValueError(
+                f"Invalid {text!r}, expected bezier(x1, y1, x2, y2) with x1 and x2"
+                " between 0 and 1"
+            )
+        return Interpolation("Bezier", bezier)
+    name = _INTERPOLATION_NAMES.get(text.lower())
+    if name is None:
+        raise ValueError(f"Unknown interpolation {text!r}")
+    return Interpolation(name)
+
+
+def _parse_value(text: str, dimensions: int) -> tuple[float, ...]:
+    values = tuple(float(x) for x in text.strip("()[]").split(","))
+    if len(values) != dimensions:
+        raise ValueError(f"Expected {dimensions} values, got {text!r}")
+    return values
+
+
+@functools.lru_cache(maxsize=CURVE_CACHE_SIZE)
+def parse_keyframes(spec: str, dimensions: int) -> Keyframes:
+    keyframes: dict[float, tuple[tuple[float, ...], Optional[Interpolation]]] = {}
+    for line in re.split(r"[\n;]", spec):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        match = _KEYFRAME.match(line)
+        if match is None:
+            raise ValueError(f"Invalid keyframe {line!r}, expected 'frame: value'")
+        try:
+            frame = float(match.group(1))
+            value = _parse_value(match.group(2), dimensions)
+        except ValueError as e:
+            raise ValueError(f"Invalid keyframe {line!r}: {e}") from None
+        if not math.isfinite(frame) or not all(math.isfinite(x) for x in value):
+            raise ValueError(f"Invalid keyframe {line!r}: values must be finite")
+        if frame in keyframes:
+            raise ValueError(f"Frame {frame:g} has more than one keyframe")
+        interpolation = match.group(3)
+        keyframes[frame] = (
+            value,
+            parse_interpolation(interpolation) if interpolation else None,
+        )
+    if not keyframes:
+        raise ValueError("Curve needs at least one keyframe")
+    frames = sorted(keyframes)
+    return Keyframes(
+        tuple(frames),
+        tuple(keyframes[frame][0] for frame in frames),
+        tuple(keyframes[frame][1] for frame in frames),
+    )
+
+
+def curve_frame_count(keyframes: Keyframes, start_frame: int, frame_count: int) -> int:
+    if frame_count <= 0:
+        frame_count = max(math.floor(keyframes.frames[-1]) - start_frame + 1, 1)
+    if frame_count > MAX_CHUNK_SIZE:
+        raise ValueError(f"Curves are limited to {MAX_CHUNK_SIZE} frames")
+    return frame_count
+
+
+@functools.lru_cache(maxsize=CURVE_CACHE_SIZE)
+def sample_curve(
+    spec: str, dimensions: int, interpolation: str, start_frame: int, frame_count: int
+) -> numpy.ndarray:
+    keyframes = parse_keyframes(spec, dimensions)
+    count = curve_frame_count(keyframes, start_frame, frame_count)
+    frames = numpy.arange(start_frame, start_frame + count, dtype=numpy.float64)
+    keys = numpy.array(keyframes.frames)
+    values = numpy.array(keyframes.values, dtype=numpy.float64)
+    if len(keys) == 1:
+        result = numpy.repeat(values, count, axis=0)
+        result.flags.writeable = False
+        return result
+
+    segment = numpy.searchsorted(keys, frames, side="right") - 1
+    segment = numpy.clip(segment, 0, len(keys) - 2)
+    start, stop = keys[segment], keys[segment + 1]
+    t = numpy.clip((frames - start) / (stop - start), 0.0, 1.0)
+
+    default = parse_interpolation(interpolation)
+    kinds = [kind or default for kind in keyframes.interpolations[:-1]]
+    unique = list(dict.fromkeys(kinds))
+    frame_kinds = numpy.array([unique.index(kind) for kind in kinds])[segment]
+
+    result = numpy.empty((count, dimensions))
+    for index, kind in enumerate(unique):
+        mask = frame_kinds == index
+        if not mask.any():
+            continue
+        s, u = segment[mask], t[mask]
+        if kind.name == "CatmullRom":
+            result[mask] = _catmull_rom(values, s, u)
+        else:
+            a = values[s]
+            result[mask] = a + (values[s + 1] - a) * ease(kind, u)[:, None]
+    result.flags.writeable = False
+    return result
+
+
+CURVE_INPUTS: Mapping[str, Any] = {
+    "keyframes": ("STRING", {"default": DEFAULT_KEYFRAMES, "multiline": True}),
+    "interpolation": (list(INTERPOLATIONS),),
+    "start_frame": ("INT", {"default": 0}),
+    "frame_count": ("INT", {"default": 0, "min": 0, "max": MAX_CHUNK_SIZE}),
+}
+
+
+class FloatCurve:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": CURVE_INPUTS}
+
+    RETURN_TYPES = ("FLOAT", "INT")
+    RETURN_NAMES = ("values", "count")
+    OUTPUT_IS_LIST = (True, False)
+    FUNCTION = "op"
+    CATEGORY = "math/curve"
+
+    def op(
+        self, keyframes: str, interpolation: str, start_frame: int, frame_count: int
+    ) -> tuple[list[float], int]:
+        curve = sample_curve(keyframes, 1, interpolation, start_frame, frame_count)
+        return (curve[:, 0].tolist(), len(curve))
+
+
+class VecCurve:
+    DIMENSIONS = 0
+
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        zero = ", ".join(["0.0"] * cls.DIMENSIONS)
+        one = ", ".join(["1.0"] * cls.DIMENSIONS)
+        return {
+            "required": {
+                **CURVE_INPUTS,
+                "keyframes": (
+                    "STRING",
+                    {"default": f"0: ({zero})\n24: ({one})", "multiline": True},
+                ),
+            }
+        }
+
+    RETURN_NAMES = ("values", "array", "count")
+    OUTPUT_IS_LIST = (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/curve"
+
+    def op(
+        self, keyframes: str, interpolation: str, start_frame: int, frame_count: int
+    ) -> tuple[list[tuple[float, ...]], numpy.ndarray, int]:
+        curve = sample_curve(
+            keyframes, self.DIMENSIONS, interpolation, start_frame, frame_count
+        )
+        return ([tuple(row) for row in curve.tolist()], curve, len(curve))
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_FloatCurve": FloatCurve,
+    **{
+        f"CM_Vec{dimensions}Curve": type(
+            f"Vec{dimensions}Curve",
+            (VecCurve,),
+            {
+                "DIMENSIONS": dimensions,
+                "RETURN_TYPES": (
+                    f"VEC{dimensions}",
+                    f"VEC{dimensions}_ARRAY",
+                    "INT",
+                ),
+            },
+        )
+        for dimensions in (2, 3, 4)
+    },
+}
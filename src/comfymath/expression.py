@@ -0,0 +1,174 @@
+import ast
+import functools
+import math
+import operator
+
+from typing import Any, Callable, Mapping
+
+from .cost import bounded
+from .float import (
+    DEFAULT_FLOAT,
+    FLOAT_BINARY_CONDITIONS,
+    FLOAT_BINARY_OPERATIONS,
+    FLOAT_UNARY_OPERATIONS,
+)
+from .int import INT_BINARY_OPERATIONS, INT_UNARY_OPERATIONS
+
+EXPRESSION_INPUTS = ("a", "b", "c", "d")
+EXPRESSION_CACHE_SIZE = 256
+
+EXPRESSION_CONSTANTS: Mapping[str, float] = {
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+}
+
+Compiled = Callable[[Mapping[str, Any]], Any]
+
+
+def _int_operation(func: Callable[..., int]) -> Callable[..., int]:
+    return lambda *args: func(*(int(arg) for arg in args))
+
+
+_BINARY_OPERATORS: Mapping[type, Callable[[Any, Any], Any]] = {
+    ast.Add: FLOAT_BINARY_OPERATIONS["Add"],
+    ast.Sub: FLOAT_BINARY_OPERATIONS["Sub"],
+    ast.Mult: bounded("Mul", FLOAT_BINARY_OPERATIONS["Mul"]),
+    ast.Div: FLOAT_BINARY_OPERATIONS["Div"],
+    ast.Mod: bounded("Mod", FLOAT_BINARY_OPERATIONS["Mod"]),
+    ast.Pow: bounded("Pow", FLOAT_BINARY_OPERATIONS["Pow"]),
+    ast.FloorDiv: bounded("FloorDiv", FLOAT_BINARY_OPERATIONS["FloorDiv"]),
+    ast.LShift: _int_operation(bounded("Shl", INT_BINARY_OPERATIONS["Shl"])),
+    ast.RShift: _int_operation(INT_BINARY_OPERATIONS["Shr"]),
+    ast.BitAnd: _int_operation(INT_BINARY_OPERATIONS["And"]),
+    ast.BitOr: _int_operation(INT_BINARY_OPERATIONS["Or"]),
+    ast.BitXor: _int_operation(INT_BINARY_OPERATIONS["Xor"]),
+}
+
+_UNARY_OPERATORS: Mapping[type, Callable[[Any], Any]] = {
+    ast.USub: FLOAT_UNARY_OPERATIONS["Neg"],
+    ast.UAdd: lambda a: a,
+    ast.Invert: _int_operation(INT_UNARY_OPERATIONS["Not"]),
+}
+
+_COMPARISONS: Mapping[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: FLOAT_BINARY_CONDITIONS["Eq"],
+    ast.NotEq: FLOAT_BINARY_CONDITIONS["Neq"],
+    ast.Gt: FLOAT_BINARY_CONDITIONS["Gt"],
+    ast.GtE: FLOAT_BINARY_CONDITIONS["Gte"],
+    ast.Lt: FLOAT_BINARY_CONDITIONS["Lt"],
+    ast.LtE: FLOAT_BINARY_CONDITIONS["Lte"],
+}
+
+
+def _functions() -> Mapping[str, tuple[int, Callable[..., Any]]]:
+    functions: dict[str, tuple[int, Callable[..., Any]]] = {}
+    for name, func in INT_UNARY_OPERATIONS.items():
+        functions[name.lower()] = (1, _int_operation(bounded(name, func)))
+    for name, func in INT_BINARY_OPERATIONS.items():
+        functions[name.lower()] = (2, _int_operation(bounded(name, func)))
+    for name, func in FLOAT_UNARY_OPERATIONS.items():
+        functions[name.lower()] = (1, bounded(name, func))
+    for name, func in FLOAT_BINARY_OPERATIONS.items():
+        functions[name.lower()] = (2, bounded(name, func))
+    return functions
+
+
+EXPRESSION_FUNCTIONS = _functions()
+
+
+def _compile(node: ast.AST) -> Compiled:
+    if isinstance(node, ast.Expression):
+        return _compile(node.body)
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+        value = node.value
+        return lambda env: value
+    if isinstance(node, ast.Name):
+        if node.id in EXPRESSION_INPUTS:
+            return operator.itemgetter(node.id)
+        if node.id in EXPRESSION_CONSTANTS:
+            constant = EXPRESSION_CONSTANTS[node.id]
+            return lambda env: constant
+        raise ValueError(f"Unknown name: {node.id}")
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        binary = _BINARY_OPERATORS[type(node.op)]
+        left, right = _compile(node.left), _compile(node.right)
+        return lambda env: binary(left(env), right(env))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        unary = _UNARY_OPERATORS[type(node.op)]
+        operand = _compile(node.operand)
+        return lambda env: unary(operand(env))
+    if isinstance(node, ast.Compare) and all(
+        type(op) in _COMPARISONS for op in node.ops
+    ):
+        operands = [_compile(node.left)] + [_compile(c) for c in node.comparators]
+        comparisons = [_COMPARISONS[type(op)] for op in node.ops]
+
+        def compare(env: Mapping[str, Any]) -> bool:
+            left = operands[0](env)
+            for comparison, right_operand in zip(comparisons, operands[1:]):
+                right = right_operand(env)
+                if not comparison(left, right):
+                    return False
+                left = right
+            return True
+
+        return compare
+    if isinstance(node, ast.IfExp):
+        test, body, orelse = (
+            _compile(node.test),
+            _compile(node.body),
+            _compile(node.orelse),
+        )
+        return lambda env: body(env) if test(env) else orelse(env)
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ValueError("Only plain function calls are supported")
+        if node.func.id not in EXPRESSION_FUNCTIONS:
+            raise ValueError(f"Unknown function: {node.func.id}")
+        arity, func = EXPRESSION_FUNCTIONS[node.func.id]
+        if len(node.args) != arity:
+            raise ValueError(
+                f"{node.func.id}() takes {arity} argument(s), got {len(node.args)}"
+            )
+        args = [_compile(arg) for arg in node.args]
+        if arity == 1:
+            (arg,) = args
+            return lambda env: func(arg(env))
+        first, second = args
+        return lambda env: func(first(env), second(env))
+    raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(source: str) -> Compiled:
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {source!r}: {e.msg}") from e
+    return _compile(tree)
+
+
+class Expression:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "expression": ("STRING", {"default": "a + b", "multiline": False}),
+                **{name: DEFAULT_FLOAT for name in EXPRESSION_INPUTS},
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT",)
+    FUNCTION = "op"
+    CATEGORY = "math/expression"
+
+    def op(self, expression: str, **inputs: float) -> tuple[float]:
+        return (float(compile_expression(expression)(inputs)),)
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_Expression": Expression,
+}
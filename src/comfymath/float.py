@@ -1,80 +1,273 @@
+from __future__ import annotations
+
 import math
 
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Optional, Union
+
+from .lazy import lazy_import
+from .memo import memoized
+from .registry import (
+    COST_EXPENSIVE,
+    Domain,
+    Operation,
+    OperationTable,
+    input_domain,
+    register,
+    validate_operation,
+    validate_operation_list,
+)
+from .vectorize import map_binary, map_unary
+
+numpy = lazy_import("numpy")
 
 DEFAULT_FLOAT = ("FLOAT", {"default": 0.0, "step": 0.001, "round": False})
 
-FLOAT_UNARY_OPERATIONS: Mapping[str, Callable[[float], float]] = {
-    "Neg": lambda a: -a,
-    "Inc": lambda a: a + 1,
-    "Dec": lambda a: a - 1,
-    "Abs": lambda a: abs(a),
-    "Sqr": lambda a: a * a,
-    "Cube": lambda a: a * a * a,
-    "Sqrt": lambda a: math.sqrt(a),
-    "Exp": lambda a: math.exp(a),
-    "Ln": lambda a: math.log(a),
-    "Log10": lambda a: math.log10(a),
-    "Log2": lambda a: math.log2(a),
-    "Sin": lambda a: math.sin(a),
-    "Cos": lambda a: math.cos(a),
-    "Tan": lambda a: math.tan(a),
-    "Asin": lambda a: math.asin(a),
-    "Acos": lambda a: math.acos(a),
-    "Atan": lambda a: math.atan(a),
-    "Sinh": lambda a: math.sinh(a),
-    "Cosh": lambda a: math.cosh(a),
-    "Tanh": lambda a: math.tanh(a),
-    "Asinh": lambda a: math.asinh(a),
-    "Acosh": lambda a: math.acosh(a),
-    "Atanh": lambda a: math.atanh(a),
-    "Round": lambda a: round(a),
-    "Floor": lambda a: math.floor(a),
-    "Ceil": lambda a: math.ceil(a),
-    "Trunc": lambda a: math.trunc(a),
-    "Erf": lambda a: math.erf(a),
-    "Erfc": lambda a: math.erfc(a),
-    "Gamma": lambda a: math.gamma(a),
-    "Radians": lambda a: math.radians(a),
-    "Degrees": lambda a: math.degrees(a),
-}
+# Only ops whose ufunc is bit-identical to the scalar lambda are vectorized. The
+# rest, and inputs that raise a floating point error, use the scalar tables.
 
-FLOAT_UNARY_CONDITIONS: Mapping[str, Callable[[float], bool]] = {
-    "IsZero": lambda a: a == 0.0,
-    "IsPositive": lambda a: a > 0.0,
-    "IsNegative": lambda a: a < 0.0,
-    "IsNonZero": lambda a: a != 0.0,
-    "IsPositiveInfinity": lambda a: math.isinf(a) and a > 0.0,
-    "IsNegativeInfinity": lambda a: math.isinf(a) and a < 0.0,
-    "IsNaN": lambda a: math.isnan(a),
-    "IsFinite": lambda a: math.isfinite(a),
-    "IsInfinite": lambda a: math.isinf(a),
-    "IsEven": lambda a: a % 2 == 0.0,
-    "IsOdd": lambda a: a % 2 != 0.0,
-}
 
-FLOAT_BINARY_OPERATIONS: Mapping[str, Callable[[float, float], float]] = {
-    "Add": lambda a, b: a + b,
-    "Sub": lambda a, b: a - b,
-    "Mul": lambda a, b: a * b,
-    "Div": lambda a, b: a / b,
-    "Mod": lambda a, b: a % b,
-    "Pow": lambda a, b: a**b,
-    "FloorDiv": lambda a, b: a // b,
-    "Max": lambda a, b: max(a, b),
-    "Min": lambda a, b: min(a, b),
-    "Log": lambda a, b: math.log(a, b),
-    "Atan2": lambda a, b: math.atan2(a, b),
-}
+def _to_int(a: numpy.ndarray) -> list[int]:
+    return [int(x) for x in a.tolist()]
+
+
+def _nonzero_divisor(
+    func: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]
+) -> Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]:
+    def divide(a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        if not numpy.all(b):
+            raise FloatingPointError("division by zero")
+        return func(a, b)
+
+    return divide
+
+
+POSITIVE = Domain(lambda a: not a <= 0.0, "a > 0")
+NON_NEGATIVE = Domain(lambda a: not a < 0.0, "a >= 0")
+UNIT_INTERVAL = Domain(lambda a: not abs(a) > 1.0, "-1 <= a <= 1")
+FINITE = Domain(lambda a: math.isfinite(a), "a is finite")
+NOT_INFINITE = Domain(lambda a: not math.isinf(a), "a is not infinite")
+NONZERO_DIVISOR = input_domain("b != 0", None, lambda b: b != 0)
 
-FLOAT_BINARY_CONDITIONS: Mapping[str, Callable[[float, float], bool]] = {
-    "Eq": lambda a, b: a == b,
-    "Neq": lambda a, b: a != b,
-    "Gt": lambda a, b: a > b,
-    "Gte": lambda a, b: a >= b,
-    "Lt": lambda a, b: a < b,
-    "Lte": lambda a, b: a <= b,
-}
+
+def _is_real_power(a: float, b: float) -> bool:
+    if not (math.isfinite(a) and math.isfinite(b)):
+        return True
+    if a == 0:
+        return b >= 0
+    return a > 0 or float(b).is_integer()
+
+
+REAL_POWER = Domain(
+    _is_real_power,
+    "no 0 to a negative power or negative number to a fractional power",
+)
+
+FLOAT_UNARY_OPERATIONS = register(
+    OperationTable(
+        "float_unary",
+        1,
+        "FLOAT",
+        "FLOAT",
+        [
+            Operation("Neg", lambda a: -a, lambda a: numpy.negative(a)),
+            Operation("Inc", lambda a: a + 1, lambda a: a + 1),
+            Operation("Dec", lambda a: a - 1, lambda a: a - 1),
+            Operation("Abs", lambda a: abs(a), lambda a: numpy.abs(a)),
+            Operation("Sqr", lambda a: a * a, lambda a: a * a),
+            Operation("Cube", lambda a: a * a * a, lambda a: a * a * a),
+            Operation(
+                "Sqrt",
+                lambda a: math.sqrt(a),
+                lambda a: numpy.sqrt(a),
+                domain=NON_NEGATIVE,
+            ),
+            Operation("Exp", lambda a: math.exp(a)),
+            Operation("Ln", lambda a: math.log(a), domain=POSITIVE),
+            Operation("Log10", lambda a: math.log10(a), domain=POSITIVE),
+            Operation("Log2", lambda a: math.log2(a), domain=POSITIVE),
+            Operation("Sin", lambda a: math.sin(a), domain=NOT_INFINITE),
+            Operation("Cos", lambda a: math.cos(a), domain=NOT_INFINITE),
+            Operation("Tan", lambda a: math.tan(a), domain=NOT_INFINITE),
+            Operation("Asin", lambda a: math.asin(a), domain=UNIT_INTERVAL),
+            Operation("Acos", lambda a: math.acos(a), domain=UNIT_INTERVAL),
+            Operation("Atan", lambda a: math.atan(a)),
+            Operation("Sinh", lambda a: math.sinh(a)),
+            Operation("Cosh", lambda a: math.cosh(a)),
+            Operation("Tanh", lambda a: math.tanh(a)),
+            Operation("Asinh", lambda a: math.asinh(a)),
+            Operation(
+                "Acosh",
+                lambda a: math.acosh(a),
+                domain=Domain(lambda a: not a < 1.0, "a >= 1"),
+            ),
+            Operation(
+                "Atanh",
+                lambda a: math.atanh(a),
+                domain=Domain(lambda a: not abs(a) >= 1.0, "-1 < a < 1"),
+            ),
+            Operation(
+                "Round",
+                lambda a: round(a),
+                lambda a: _to_int(numpy.rint(a)),
+                domain=FINITE,
+                output_type="INT",
+            ),
+            Operation(
+                "Floor",
+                lambda a: math.floor(a),
+                lambda a: _to_int(numpy.floor(a)),
+                domain=FINITE,
+                output_type="INT",
+            ),
+            Operation(
+                "Ceil",
+                lambda a: math.ceil(a),
+                lambda a: _to_int(numpy.ceil(a)),
+                domain=FINITE,
+                output_type="INT",
+            ),
+            Operation(
+                "Trunc",
+                lambda a: math.trunc(a),
+                lambda a: _to_int(numpy.trunc(a)),
+                domain=FINITE,
+                output_type="INT",
+            ),
+            Operation("Erf", lambda a: math.erf(a)),
+            Operation("Erfc", lambda a: math.erfc(a)),
+            Operation(
+                "Gamma",
+                lambda a: math.gamma(a),
+                domain=Domain(
+                    lambda a: not (
+                        a <= 0.0 and (float(a).is_integer() or math.isinf(a))
+                    ),
+                    "a is not zero or a negative integer",
+                ),
+                cost=COST_EXPENSIVE,
+            ),
+            Operation("Radians", lambda a: math.radians(a), lambda a: numpy.radians(a)),
+            Operation("Degrees", lambda a: math.degrees(a), lambda a: numpy.degrees(a)),
+        ],
+    )
+)
+
+FLOAT_UNARY_CONDITIONS = register(
+    OperationTable(
+        "float_unary_condition",
+        1,
+        "FLOAT",
+        "BOOLEAN",
+        [
+            Operation("IsZero", lambda a: a == 0.0, lambda a: a == 0.0),
+            Operation("IsPositive", lambda a: a > 0.0, lambda a: a > 0.0),
+            Operation("IsNegative", lambda a: a < 0.0, lambda a: a < 0.0),
+            Operation("IsNonZero", lambda a: a != 0.0, lambda a: a != 0.0),
+            Operation(
+                "IsPositiveInfinity",
+                lambda a: math.isinf(a) and a > 0.0,
+                lambda a: numpy.isinf(a) & (a > 0.0),
+            ),
+            Operation(
+                "IsNegativeInfinity",
+                lambda a: math.isinf(a) and a < 0.0,
+                lambda a: numpy.isinf(a) & (a < 0.0),
+            ),
+            Operation("IsNaN", lambda a: math.isnan(a), lambda a: numpy.isnan(a)),
+            Operation(
+                "IsFinite", lambda a: math.isfinite(a), lambda a: numpy.isfinite(a)
+            ),
+            Operation("IsInfinite", lambda a: math.isinf(a), lambda a: numpy.isinf(a)),
+            Operation(
+                "IsEven",
+                lambda a: a % 2 == 0.0,
+                lambda a: numpy.remainder(a, 2) == 0.0,
+            ),
+            Operation(
+                "IsOdd",
+                lambda a: a % 2 != 0.0,
+                lambda a: numpy.remainder(a, 2) != 0.0,
+            ),
+        ],
+    )
+)
+
+FLOAT_BINARY_OPERATIONS = register(
+    OperationTable(
+        "float_binary",
+        2,
+        "FLOAT",
+        "FLOAT",
+        [
+            Operation("Add", lambda a, b: a + b, lambda a, b: a + b),
+            Operation("Sub", lambda a, b: a - b, lambda a, b: a - b),
+            Operation("Mul", lambda a, b: a * b, lambda a, b: a * b),
+            Operation(
+                "Div",
+                lambda a, b: a / b,
+                _nonzero_divisor(lambda a, b: a / b),
+                domain=NONZERO_DIVISOR,
+            ),
+            Operation(
+                "Mod",
+                lambda a, b: a % b,
+                _nonzero_divisor(lambda a, b: numpy.remainder(a, b)),
+                domain=NONZERO_DIVISOR,
+            ),
+            Operation(
+                "Pow",
+                lambda a, b: a**b,
+                domain=REAL_POWER,
+            ),
+            Operation(
+                "FloorDiv",
+                lambda a, b: a // b,
+                _nonzero_divisor(lambda a, b: numpy.floor_divide(a, b)),
+                domain=NONZERO_DIVISOR,
+            ),
+            Operation(
+                "Max", lambda a, b: max(a, b), lambda a, b: numpy.where(b > a, b, a)
+            ),
+            Operation(
+                "Min", lambda a, b: min(a, b), lambda a, b: numpy.where(b < a, b, a)
+            ),
+            Operation(
+                "Log",
+                lambda a, b: math.log(a, b),
+                domain=input_domain(
+                    "a > 0, b > 0, b != 1",
+                    lambda a: not a <= 0,
+                    lambda b: not (b <= 0 or b == 1),
+                ),
+            ),
+            Operation("Atan2", lambda a, b: math.atan2(a, b)),
+        ],
+    )
+)
+
+FLOAT_BINARY_CONDITIONS = register(
+    OperationTable(
+        "float_binary_condition",
+        2,
+        "FLOAT",
+        "BOOLEAN",
+        [
+            Operation("Eq", lambda a, b: a == b, lambda a, b: a == b),
+            Operation("Neq", lambda a, b: a != b, lambda a, b: a != b),
+            Operation("Gt", lambda a, b: a > b, lambda a, b: a > b),
+            Operation("Gte", lambda a, b: a >= b, lambda a, b: a >= b),
+            Operation("Lt", lambda a, b: a < b, lambda a, b: a < b),
+            Operation("Lte", lambda a, b: a <= b, lambda a, b: a <= b),
+        ],
+    )
+)
+
+FLOAT_UNARY_EXPENSIVE_OPERATIONS = FLOAT_UNARY_OPERATIONS.with_cost(COST_EXPENSIVE)
+
+FLOAT_UNARY_UFUNCS = FLOAT_UNARY_OPERATIONS.vectorized()
+FLOAT_UNARY_CONDITION_UFUNCS = FLOAT_UNARY_CONDITIONS.vectorized()
+FLOAT_BINARY_UFUNCS = FLOAT_BINARY_OPERATIONS.vectorized()
+FLOAT_BINARY_CONDITION_UFUNCS = FLOAT_BINARY_CONDITIONS.vectorized()
 
 
 class FloatUnaryOperation:
@@ -91,7 +284,15 @@ class FloatUnaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/float"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls, op: Optional[str] = None, a: Optional[float] = None
+    ) -> Union[bool, str]:
+        return validate_operation(FLOAT_UNARY_OPERATIONS, op, a=a)
+
     def op(self, op: str, a: float) -> tuple[float]:
+        if op in FLOAT_UNARY_EXPENSIVE_OPERATIONS:
+            return (memoized("float_unary", op, FLOAT_UNARY_OPERATIONS[op], a),)
         return (FLOAT_UNARY_OPERATIONS[op](a),)
 
 
@@ -128,6 +329,15 @@ class FloatBinaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/float"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls,
+        op: Optional[str] = None,
+        a: Optional[float] = None,
+        b: Optional[float] = None,
+    ) -> Union[bool, str]:
+        return validate_operation(FLOAT_BINARY_OPERATIONS, op, a=a, b=b)
+
     def op(self, op: str, a: float, b: float) -> tuple[float]:
         return (FLOAT_BINARY_OPERATIONS[op](a, b),)
 
@@ -151,9 +361,116 @@ class FloatBinaryCondition:
         return (FLOAT_BINARY_CONDITIONS[op](a, b),)
 
 
+class FloatUnaryOperationList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_UNARY_OPERATIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("FLOAT",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls, op: Optional[list[str]] = None, a: Optional[list[float]] = None
+    ) -> Union[bool, str]:
+        return validate_operation_list(FLOAT_UNARY_OPERATIONS, op, a=a)
+
+    def op(self, op: list[str], a: list[float]) -> tuple[list[float]]:
+        return (map_unary(op[0], FLOAT_UNARY_UFUNCS, FLOAT_UNARY_OPERATIONS, a),)
+
+
+class FloatUnaryConditionList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_UNARY_CONDITIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("BOOLEAN",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    def op(self, op: list[str], a: list[float]) -> tuple[list[bool]]:
+        return (
+            map_unary(op[0], FLOAT_UNARY_CONDITION_UFUNCS, FLOAT_UNARY_CONDITIONS, a),
+        )
+
+
+class FloatBinaryOperationList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_BINARY_OPERATIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+                "b": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("FLOAT",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls,
+        op: Optional[list[str]] = None,
+        a: Optional[list[float]] = None,
+        b: Optional[list[float]] = None,
+    ) -> Union[bool, str]:
+        return validate_operation_list(FLOAT_BINARY_OPERATIONS, op, a=a, b=b)
+
+    def op(self, op: list[str], a: list[float], b: list[float]) -> tuple[list[float]]:
+        return (map_binary(op[0], FLOAT_BINARY_UFUNCS, FLOAT_BINARY_OPERATIONS, a, b),)
+
+
+class FloatBinaryConditionList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_BINARY_CONDITIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+                "b": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("BOOLEAN",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    def op(self, op: list[str], a: list[float], b: list[float]) -> tuple[list[bool]]:
+        return (
+            map_binary(
+                op[0], FLOAT_BINARY_CONDITION_UFUNCS, FLOAT_BINARY_CONDITIONS, a, b
+            ),
+        )
+
+
 NODE_CLASS_MAPPINGS = {
     "CM_FloatUnaryOperation": FloatUnaryOperation,
     "CM_FloatUnaryCondition": FloatUnaryCondition,
     "CM_FloatBinaryOperation": FloatBinaryOperation,
     "CM_FloatBinaryCondition": FloatBinaryCondition,
+    "CM_FloatUnaryOperationList": FloatUnaryOperationList,
+    "CM_FloatUnaryConditionList": FloatUnaryConditionList,
+    "CM_FloatBinaryOperationList": FloatBinaryOperationList,
+    "CM_FloatBinaryConditionList": FloatBinaryConditionList,
 }
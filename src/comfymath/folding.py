@@ -0,0 +1,170 @@
+import copy
+import logging
+
+from typing import Any, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+CONSTANT_FOLDING_ENV = "COMFYMATH_CONSTANT_FOLDING"
+
+Prompt = dict[str, dict[str, Any]]
+
+
+def is_link(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], str)
+        and isinstance(value[1], int)
+    )
+
+
+def _input_spec(node_class: Any, name: str) -> Optional[tuple]:
+    input_types = node_class.INPUT_TYPES()
+    for section in ("required", "optional"):
+        spec = input_types.get(section, {}).get(name)
+        if spec is not None:
+            return spec
+    return None
+
+
+def is_foldable(class_type: str, node_class_mappings: Mapping[str, Any]) -> bool:
+    node_class = node_class_mappings.get(class_type)
+    if not class_type.startswith("CM_") or node_class is None:
+        return False
+    if (
+        getattr(node_class, "OUTPUT_NODE", False)
+        or getattr(node_class, "NOT_IDEMPOTENT", False)
+        or getattr(node_class, "INPUT_IS_LIST", False)
+        or any(getattr(node_class, "OUTPUT_IS_LIST", ()))
+        or hasattr(node_class, "IS_CHANGED")
+    ):
+        return False
+    input_types = node_class.INPUT_TYPES()
+    if input_types.get("hidden"):
+        return False
+    for section in ("required", "optional"):
+        for spec in input_types.get(section, {}).values():
+            if len(spec) > 1 and isinstance(spec[1], dict) and spec[1].get("lazy"):
+                return False
+    return True
+
+
+def _accepts_literal(node_class: Any, name: str, value: Any) -> bool:
+    if node_class is None:
+        return True
+    spec = _input_spec(node_class, name)
+    if spec is None:
+        return True
+    if spec[0] not in ("INT", "FLOAT"):
+        return True
+    options = spec[1] if len(spec) > 1 and isinstance(spec[1], dict) else {}
+    if not isinstance(value, (int, float)):
+        return False
+    if "min" in options and value < options["min"]:
+        return False
+    if "max" in options and value > options["max"]:
+        return False
+    return True
+
+
+def _topological_order(prompt: Mapping[str, Mapping[str, Any]]) -> list[str]:
+    dependents: dict[str, list[str]] = {node_id: [] for node_id in prompt}
+    pending: dict[str, int] = {node_id: 0 for node_id in prompt}
+    for node_id, node in prompt.items():
+        for value in node.get("inputs", {}).values():
+            if is_link(value) and value[0] in prompt:
+                dependents[value[0]].append(node_id)
+                pending[node_id] += 1
+    order = [node_id for node_id, count in pending.items() if count == 0]
+    for node_id in order:
+        for dependent in dependents[node_id]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                order.append(dependent)
+    return order
+
+
+def _evaluate(node_class: Any, inputs: Mapping[str, Any]) -> Optional[tuple]:
+    try:
+        result = getattr(node_class(), node_class.FUNCTION)(**inputs)
+    except Exception as e:
+        logger.debug("Not folding %s: %s", node_class.__name__, e)
+        return None
+    if not isinstance(result, tuple):
+        return None
+    return result
+
+
+def fold_constants(
+    prompt: Mapping[str, Mapping[str, Any]], node_class_mappings: Mapping[str, Any]
+) -> Prompt:
+    folded: dict[str, tuple] = {}
+    for node_id in _topological_order(prompt):
+        node = prompt[node_id]
+        class_type = node.get("class_type", "")
+        if not is_foldable(class_type, node_class_mappings):
+            continue
+        inputs = {}
+        for name, value in node.get("inputs", {}).items():
+            if is_link(value):
+                if value[0] not in folded or value[1] >= len(folded[value[0]]):
+                    break
+                value = folded[value[0]][value[1]]
+            inputs[name] = value
+        else:
+            result = _evaluate(node_class_mappings[class_type], inputs)
+            if result is not None:
+                folded[node_id] = result
+
+    result_prompt: Prompt = copy.deepcopy(dict(prompt))
+    referenced: set[str] = set()
+    for node_id, node in result_prompt.items():
+        if node_id in folded:
+            continue
+        node_class = node_class_mappings.get(node.get("class_type", ""))
+        inputs = node.get("inputs", {})
+        for name, value in inputs.items():
+            if not is_link(value):
+                continue
+            if value[0] in folded:
+                literal = folded[value[0]][value[1]]
+                if _accepts_literal(node_class, name, literal):
+                    inputs[name] = literal
+                    continue
+            referenced.add(value[0])
+
+    # Folded nodes that still feed a link keep their own inputs linked to other
+    # folded nodes, so they have to stay in the prompt along with those.
+    keep = set(referenced & folded.keys())
+    stack = list(keep)
+    while stack:
+        for value in result_prompt[stack.pop()].get("inputs", {}).values():
+            if is_link(value) and value[0] in folded and value[0] not in keep:
+                keep.add(value[0])
+                stack.append(value[0])
+    for node_id in folded.keys() - keep:
+        del result_prompt[node_id]
+    logger.debug("Folded %d constant nodes", len(folded) - len(keep))
+    return result_prompt
+
+
+def install_prompt_hook() -> bool:
+    try:
+        import nodes
+        from server import PromptServer
+    except ImportError:
+        logger.warning("Constant folding needs to run inside ComfyUI, not installed")
+        return False
+
+    def on_prompt(json_data: dict[str, Any]) -> dict[str, Any]:
+        prompt = json_data.get("prompt")
+        if isinstance(prompt, dict):
+            try:
+                json_data["prompt"] = fold_constants(prompt, nodes.NODE_CLASS_MAPPINGS)
+            except Exception:
+                logger.exception("Constant folding failed, using the prompt as is")
+        return json_data
+
+    PromptServer.instance.add_on_prompt_handler(on_prompt)
+    return True
@@ -1,61 +1,18 @@
+from __future__ import annotations
+
+import functools
+import logging
+
 from abc import ABC, abstractmethod
 from typing import Any, Mapping, Sequence, Tuple
 
+from .resolution_registry import RESOLUTION_FAMILIES, ResolutionFamily, ResolutionIndex
+
+logger = logging.getLogger(__name__)
+
 
-SDXL_SUPPORTED_RESOLUTIONS = [
-    (1024, 1024, 1.0),
-    (1152, 896, 1.2857142857142858),
-    (896, 1152, 0.7777777777777778),
-    (1216, 832, 1.4615384615384615),
-    (832, 1216, 0.6842105263157895),
-    (1344, 768, 1.75),
-    (768, 1344, 0.5714285714285714),
-    (1536, 640, 2.4),
-    (640, 1536, 0.4166666666666667),
-]
-
-SDXL_EXTENDED_RESOLUTIONS = [
-    (512, 2048, 0.25),
-    (512, 1984, 0.26),
-    (512, 1920, 0.27),
-    (512, 1856, 0.28),
-    (576, 1792, 0.32),
-    (576, 1728, 0.33),
-    (576, 1664, 0.35),
-    (640, 1600, 0.4),
-    (640, 1536, 0.42),
-    (704, 1472, 0.48),
-    (704, 1408, 0.5),
-    (704, 1344, 0.52),
-    (768, 1344, 0.57),
-    (768, 1280, 0.6),
-    (832, 1216, 0.68),
-    (832, 1152, 0.72),
-    (896, 1152, 0.78),
-    (896, 1088, 0.82),
-    (960, 1088, 0.88),
-    (960, 1024, 0.94),
-    (1024, 1024, 1.0),
-    (1024, 960, 1.8),
-    (1088, 960, 1.14),
-    (1088, 896, 1.22),
-    (1152, 896, 1.30),
-    (1152, 832, 1.39),
-    (1216, 832, 1.47),
-    (1280, 768, 1.68),
-    (1344, 768, 1.76),
-    (1408, 704, 2.0),
-    (1472, 704, 2.10),
-    (1536, 640, 2.4),
-    (1600, 640, 2.5),
-    (1664, 576, 2.90),
-    (1728, 576, 3.0),
-    (1792, 576, 3.12),
-    (1856, 512, 3.63),
-    (1920, 512, 3.76),
-    (1984, 512, 3.89),
-    (2048, 512, 4.0),
-]
+SDXL_SUPPORTED_RESOLUTIONS = list(RESOLUTION_FAMILIES["SDXL"].resolutions)
+SDXL_EXTENDED_RESOLUTIONS = list(RESOLUTION_FAMILIES["SDXLExtended"].resolutions)
 
 
 class Resolution(ABC):
@@ -95,59 +52,67 @@ class NearestResolution(ABC):
     FUNCTION = "op"
     CATEGORY = "math/graphics"
 
+    @classmethod
+    @functools.cache
+    def index(cls) -> ResolutionIndex:
+        return ResolutionIndex(cls.resolutions())
+
     def op(self, image) -> tuple[int, int]:
         image_width = image.size()[2]
         image_height = image.size()[1]
-        print(f"Input image resolution: {image_width}x{image_height}")
-        image_ratio = image_width / image_height
-        differences = [
-            (abs(image_ratio - resolution[2]), resolution)
-            for resolution in self.resolutions()
-        ]
-        smallest = None
-        for difference in differences:
-            if smallest is None:
-                smallest = difference
-            else:
-                if difference[0] < smallest[0]:
-                    smallest = difference
-        if smallest is not None:
-            width = smallest[1][0]
-            height = smallest[1][1]
+        nearest = self.index().nearest(image_width / image_height)
+        if nearest is not None:
+            width, height = nearest[0], nearest[1]
         else:
-            width = 1024
-            height = 1024
-        print(f"Selected resolution: {width}x{height}")
+            width, height = 1024, 1024
+        logger.debug(
+            "Selected resolution %dx%d for %dx%d input",
+            width,
+            height,
+            image_width,
+            image_height,
+        )
         return (width, height)
 
 
-class SDXLResolution(Resolution):
-    @classmethod
-    def resolutions(cls):
-        return SDXL_SUPPORTED_RESOLUTIONS
-
-
-class SDXLExtendedResolution(Resolution):
-    @classmethod
-    def resolutions(cls):
-        return SDXL_EXTENDED_RESOLUTIONS
-
-
-class NearestSDXLResolution(NearestResolution):
-    @classmethod
-    def resolutions(cls):
-        return SDXL_SUPPORTED_RESOLUTIONS
-
-
-class NearestSDXLExtendedResolution(NearestResolution):
-    @classmethod
-    def resolutions(cls):
-        return SDXL_EXTENDED_RESOLUTIONS
+class NearestResolutionList(NearestResolution):
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True, True)
+
+    def op(self, image) -> tuple[list[int], list[int]]:
+        sizes = [item.size() for item in image]
+        nearest = self.index().nearest_many([size[2] / size[1] for size in sizes])
+        if not nearest:
+            return ([1024] * len(sizes), [1024] * len(sizes))
+        return ([res[0] for res in nearest], [res[1] for res in nearest])
+
+
+def family_node_classes(family: ResolutionFamily) -> dict[str, type]:
+    attributes = {
+        "resolutions": classmethod(lambda cls: family.resolutions),
+        "FAMILY": family.name,
+    }
+    nearest_attributes = {
+        **attributes,
+        "index": classmethod(lambda cls: family.index),
+    }
+    return {
+        f"CM_{family.name}Resolution": type(
+            f"{family.name}Resolution", (Resolution,), attributes
+        ),
+        f"CM_Nearest{family.name}Resolution": type(
+            f"Nearest{family.name}Resolution", (NearestResolution,), nearest_attributes
+        ),
+        f"CM_Nearest{family.name}ResolutionList": type(
+            f"Nearest{family.name}ResolutionList",
+            (NearestResolutionList,),
+            nearest_attributes,
+        ),
+    }
 
 
 NODE_CLASS_MAPPINGS = {
-    "CM_SDXLResolution": SDXLResolution,
-    "CM_NearestSDXLResolution": NearestSDXLResolution,
-    "CM_SDXLExtendedResolution": SDXLExtendedResolution,
-    "CM_NearestSDXLExtendedResolution": NearestSDXLExtendedResolution,
+    name: node_class
+    for family in RESOLUTION_FAMILIES.values()
+    for name, node_class in family_node_classes(family).items()
 }
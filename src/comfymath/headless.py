@@ -0,0 +1,376 @@
+"""Evaluate ComfyUI API-format prompts of ComfyMath nodes without a server.
+
+Run from the repository root:
+
+    python -m src.comfymath.headless prompt.json --set 3.a=2.5
+    python -m src.comfymath.headless prompt.json --sweep 3.a=[1,2,3] --workers 8
+"""
+
+import argparse
+import copy
+import importlib.util
+import itertools
+import json
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence
+
+from .folding import Prompt, is_link
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+PACKAGE = "comfymath_nodes"
+ANY_TYPE = "*"
+DEFAULT_CHUNKSIZE = 64
+
+Outputs = tuple[list[Any], ...]
+
+
+def load_node_class_mappings() -> Mapping[str, Any]:
+    # Inside ComfyUI this module is part of the loaded node package, otherwise
+    # the package is loaded from the repository root.
+    package, _, _ = (__package__ or "").rpartition(".src.comfymath")
+    module = sys.modules.get(package) if package else None
+    if module is None or not hasattr(module, "NODE_CLASS_MAPPINGS"):
+        module = sys.modules.get(PACKAGE)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE, ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE] = module
+        spec.loader.exec_module(module)
+    return module.NODE_CLASS_MAPPINGS
+
+
+def types_match(output_type: str, input_type: str) -> bool:
+    # ComfyUI's rule: "*" matches anything and comma separated types are
+    # unions, every type the output may have must be accepted.
+    if ANY_TYPE in (output_type, input_type) or output_type == input_type:
+        return True
+    return set(output_type.split(",")) <= set(input_type.split(","))
+
+
+def check_links(
+    prompt: Mapping[str, Any], node_class_mappings: Mapping[str, Any]
+) -> None:
+    for node_id, node in prompt.items():
+        input_types = node_class_mappings[node["class_type"]].INPUT_TYPES()
+        specs = {**input_types.get("required", {}), **input_types.get("optional", {})}
+        for name, value in node.get("inputs", {}).items():
+            if not is_link(value) or name not in specs:
+                continue
+            input_type = specs[name][0]
+            source = prompt.get(value[0])
+            if not isinstance(input_type, str) or source is None:
+                continue
+            return_types = node_class_mappings[source["class_type"]].RETURN_TYPES
+            if value[1] >= len(return_types):
+                raise ValueError(f"Node {value[0]} has no output {value[1]}")
+            output_type = return_types[value[1]]
+            if not types_match(output_type, input_type):
+                raise ValueError(
+                    f"Node {node_id} input {name} takes {input_type}, but node"
+                    f" {value[0]} output {value[1]} is {output_type}"
+                )
+
+
+def _lazy_inputs(input_types: Mapping[str, Any]) -> set[str]:
+    return {
+        name
+        for section in ("required", "optional")
+        for name, spec in input_types.get(section, {}).items()
+        if len(spec) > 1 and isinstance(spec[1], dict) and spec[1].get("lazy")
+    }
+
+
+class Evaluator:
+    def __init__(
+        self, prompt: Mapping[str, Any], node_class_mappings: Mapping[str, Any]
+    ) -> None:
+        for node_id, node in prompt.items():
+            class_type = node.get("class_type", "")
+            if (
+                not class_type.startswith("CM_")
+                or class_type not in node_class_mappings
+            ):
+                raise ValueError(
+                    f"Node {node_id} is {class_type!r}, only ComfyMath nodes can be"
+                    " evaluated headless"
+                )
+        check_links(prompt, node_class_mappings)
+        self.prompt = prompt
+        self.node_class_mappings = node_class_mappings
+        self.outputs: dict[str, Outputs] = {}
+        self._evaluating: set[str] = set()
+
+    def output(self, node_id: str) -> Outputs:
+        if node_id not in self.outputs:
+            if node_id not in self.prompt:
+                raise ValueError(f"Link to missing node {node_id}")
+            if node_id in self._evaluating:
+                raise ValueError(f"Node {node_id} depends on itself")
+            self._evaluating.add(node_id)
+            try:
+                self.outputs[node_id] = self._evaluate(node_id)
+            finally:
+                self._evaluating.discard(node_id)
+        return self.outputs[node_id]
+
+    def _input(self, value: Any) -> list[Any]:
+        if is_link(value):
+            return self.output(value[0])[value[1]]
+        return [value]
+
+    def _calls(
+        self, node_class: Any, inputs: Mapping[str, list[Any]]
+    ) -> Iterator[dict[str, Any]]:
+        # The same list semantics as ComfyUI: list inputs are mapped over, the
+        # shorter ones repeating their last value, unless INPUT_IS_LIST.
+        if getattr(node_class, "INPUT_IS_LIST", False):
+            yield dict(inputs)
+            return
+        if any(not values for values in inputs.values()):
+            return
+        length = max((len(values) for values in inputs.values()), default=1)
+        for i in range(length):
+            yield {
+                name: values[min(i, len(values) - 1)] for name, values in inputs.items()
+            }
+
+    def _evaluate(self, node_id: str) -> Outputs:
+        node = self.prompt[node_id]
+        node_class = self.node_class_mappings[node["class_type"]]
+        input_types = node_class.INPUT_TYPES()
+        raw_inputs = node.get("inputs", {})
+        lazy = _lazy_inputs(input_types) & raw_inputs.keys()
+        inputs = {
+            name: self._input(value)
+            for name, value in raw_inputs.items()
+            if name not in lazy
+        }
+        for name, kind in input_types.get("hidden", {}).items():
+            if kind == "UNIQUE_ID":
+                inputs[name] = [node_id]
+        for name in lazy:
+            inputs[name] = [None]
+
+        instance = node_class()
+        check_lazy_status = getattr(instance, "check_lazy_status", None)
+        while lazy:
+            if check_lazy_status is None:
+                requested = set(lazy)
+            else:
+                requested = {
+                    name
+                    for call in self._calls(node_class, inputs)
+                    for name in check_lazy_status(**call) or ()
+                } & lazy
+            if not requested:
+                break
+            for name in requested:
+                inputs[name] = self._input(raw_inputs[name])
+            lazy -= requested
+
+        func = getattr(instance, node_class.FUNCTION)
+        results = []
+        for call in self._calls(node_class, inputs):
+            result = func(**call)
+            if isinstance(result, dict):
+                if "expand" in result:
+                    raise ValueError(
+                        f"Node {node_id} ({node['class_type']}) expands its graph,"
+                        " which needs ComfyUI"
+                    )
+                result = result.get("result", ())
+            results.append(result)
+
+        output_is_list = getattr(node_class, "OUTPUT_IS_LIST", ())
+        outputs: list[list[Any]] = []
+        for i in range(len(node_class.RETURN_TYPES)):
+            if i < len(output_is_list) and output_is_list[i]:
+                outputs.append([value for result in results for value in result[i]])
+            else:
+                outputs.append([result[i] for result in results])
+        return tuple(outputs)
+
+
+def sink_nodes(prompt: Mapping[str, Any]) -> list[str]:
+    linked = {
+        value[0]
+        for node in prompt.values()
+        for value in node.get("inputs", {}).values()
+        if is_link(value)
+    }
+    return [node_id for node_id in prompt if node_id not in linked]
+
+
+def evaluate_prompt(
+    prompt: Mapping[str, Any],
+    outputs: Optional[Sequence[str]] = None,
+    node_class_mappings: Optional[Mapping[str, Any]] = None,
+) -> dict[str, Outputs]:
+    if node_class_mappings is None:
+        node_class_mappings = load_node_class_mappings()
+    evaluator = Evaluator(prompt, node_class_mappings)
+    return {
+        node_id: evaluator.output(node_id)
+        for node_id in (outputs or sink_nodes(prompt))
+    }
+
+
+def apply_overrides(prompt: Mapping[str, Any], overrides: Mapping[str, Any]) -> Prompt:
+    result: Prompt = dict(prompt)
+    for key, value in overrides.items():
+        node_id, _, name = key.rpartition(".")
+        if node_id not in result:
+            raise ValueError(f"Override {key!r} names a missing node")
+        node = copy.copy(result[node_id])
+        node["inputs"] = {**node.get("inputs", {}), name: value}
+        result[node_id] = node
+    return result
+
+
+def sweep_grid(axes: Mapping[str, Sequence[Any]]) -> Iterator[dict[str, Any]]:
+    names = list(axes)
+    for values in itertools.product(*(axes[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+class SweepResult(NamedTuple):
+    index: int
+    overrides: Mapping[str, Any]
+    outputs: Optional[dict[str, Outputs]]
+    error: Optional[str]
+
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(prompt: Mapping[str, Any], outputs: Optional[Sequence[str]]) -> None:
+    _WORKER.update(
+        prompt=prompt,
+        outputs=outputs,
+        node_class_mappings=load_node_class_mappings(),
+    )
+
+
+def _run_job(job: tuple[int, Mapping[str, Any]]) -> SweepResult:
+    index, overrides = job
+    try:
+        prompt = apply_overrides(_WORKER["prompt"], overrides)
+        outputs = evaluate_prompt(
+            prompt, _WORKER["outputs"], _WORKER["node_class_mappings"]
+        )
+    except Exception as e:
+        return SweepResult(index, overrides, None, f"{type(e).__name__}: {e}")
+    return SweepResult(index, overrides, outputs, None)
+
+
+def run_sweep(
+    prompt: Mapping[str, Any],
+    jobs: Iterable[Mapping[str, Any]],
+    outputs: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[SweepResult]:
+    workers = workers or os.cpu_count() or 1
+    numbered = enumerate(jobs)
+    if workers == 1:
+        _init_worker(prompt, outputs)
+        yield from map(_run_job, numbered)
+        return
+    # Jobs are submitted a few chunks per worker at a time, so sweeps far
+    # larger than memory can be streamed.
+    batch_size = chunksize * workers * 4
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(prompt, outputs)
+    ) as executor:
+        while batch := list(itertools.islice(numbered, batch_size)):
+            yield from executor.map(_run_job, batch, chunksize=chunksize)
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+def _parse_assignment(text: str) -> tuple[str, Any]:
+    key, sep, value = text.partition("=")
+    if not sep or "." not in key:
+        raise argparse.ArgumentTypeError(f"Expected NODE_ID.INPUT=VALUE, got {text!r}")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def load_prompt(path: Path) -> Prompt:
+    data = json.loads(path.read_text())
+    return data["prompt"] if "prompt" in data else data
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.comfymath.headless",
+        description="Evaluate a ComfyUI API-format prompt of ComfyMath nodes without"
+        " a server, optionally as a parameter sweep across a process pool.",
+    )
+    parser.add_argument("prompt", type=Path, help="API-format prompt JSON")
+    parser.add_argument(
+        "--output",
+        action="append",
+        dest="outputs",
+        metavar="NODE_ID",
+        help="node to report, repeatable (default: nodes no other node reads)",
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        type=_parse_assignment,
+        metavar="NODE_ID.INPUT=VALUE",
+        help="override an input with a JSON value",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        default=[],
+        type=_parse_assignment,
+        metavar="NODE_ID.INPUT=[V1,V2,...]",
+        help="sweep an input over a JSON list, repeated sweeps form a grid",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    prompt = apply_overrides(load_prompt(args.prompt), dict(args.set))
+    if not args.sweep:
+        outputs = evaluate_prompt(prompt, args.outputs)
+        print(json.dumps(outputs, default=_json_default))
+        return 0
+
+    axes = dict(args.sweep)
+    for key, values in axes.items():
+        if not isinstance(values, list):
+            parser.error(f"--sweep {key} needs a JSON list of values")
+    failed = 0
+    for result in run_sweep(
+        prompt, sweep_grid(axes), args.outputs, args.workers, args.chunksize
+    ):
+        line = {"index": result.index, "overrides": result.overrides}
+        if result.error is None:
+            line["outputs"] = result.outputs
+        else:
+            line["error"] = result.error
+            failed += 1
+        print(json.dumps(line, default=_json_default))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
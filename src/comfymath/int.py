@@ -1,56 +1,119 @@
 import math
 
-from typing import Any, Callable, Mapping
+from typing import Any, Mapping, Optional, Union
+
+from .cost import IntCostExceeded, check_int_cost
+from .memo import memoized
+from .registry import (
+    COST_EXPENSIVE,
+    Domain,
+    Operation,
+    OperationTable,
+    input_domain,
+    register,
+    validate_operation,
+)
 
 DEFAULT_INT = ("INT", {"default": 0})
 
-INT_UNARY_OPERATIONS: Mapping[str, Callable[[int], int]] = {
-    "Abs": lambda a: abs(a),
-    "Neg": lambda a: -a,
-    "Inc": lambda a: a + 1,
-    "Dec": lambda a: a - 1,
-    "Sqr": lambda a: a * a,
-    "Cube": lambda a: a * a * a,
-    "Not": lambda a: ~a,
-    "Factorial": lambda a: math.factorial(a),
-}
-
-INT_UNARY_CONDITIONS: Mapping[str, Callable[[int], bool]] = {
-    "IsZero": lambda a: a == 0,
-    "IsNonZero": lambda a: a != 0,
-    "IsPositive": lambda a: a > 0,
-    "IsNegative": lambda a: a < 0,
-    "IsEven": lambda a: a % 2 == 0,
-    "IsOdd": lambda a: a % 2 == 1,
-}
-
-INT_BINARY_OPERATIONS: Mapping[str, Callable[[int, int], int]] = {
-    "Add": lambda a, b: a + b,
-    "Sub": lambda a, b: a - b,
-    "Mul": lambda a, b: a * b,
-    "Div": lambda a, b: a // b,
-    "Mod": lambda a, b: a % b,
-    "Pow": lambda a, b: a**b,
-    "And": lambda a, b: a & b,
-    "Nand": lambda a, b: ~a & b,
-    "Or": lambda a, b: a | b,
-    "Nor": lambda a, b: ~a & b,
-    "Xor": lambda a, b: a ^ b,
-    "Xnor": lambda a, b: ~a ^ b,
-    "Shl": lambda a, b: a << b,
-    "Shr": lambda a, b: a >> b,
-    "Max": lambda a, b: max(a, b),
-    "Min": lambda a, b: min(a, b),
-}
-
-INT_BINARY_CONDITIONS: Mapping[str, Callable[[int, int], bool]] = {
-    "Eq": lambda a, b: a == b,
-    "Neq": lambda a, b: a != b,
-    "Gt": lambda a, b: a > b,
-    "Lt": lambda a, b: a < b,
-    "Geq": lambda a, b: a >= b,
-    "Leq": lambda a, b: a <= b,
-}
+NONZERO_DIVISOR = input_domain("b != 0", None, lambda b: b != 0)
+NON_NEGATIVE_SHIFT = input_domain("b >= 0", None, lambda b: b >= 0)
+
+INT_UNARY_OPERATIONS = register(
+    OperationTable(
+        "int_unary",
+        1,
+        "INT",
+        "INT",
+        [
+            Operation("Abs", lambda a: abs(a)),
+            Operation("Neg", lambda a: -a),
+            Operation("Inc", lambda a: a + 1),
+            Operation("Dec", lambda a: a - 1),
+            Operation("Sqr", lambda a: a * a),
+            Operation("Cube", lambda a: a * a * a),
+            Operation("Not", lambda a: ~a),
+            Operation(
+                "Factorial",
+                lambda a: math.factorial(a),
+                domain=Domain(lambda a: a >= 0, "a >= 0"),
+                cost=COST_EXPENSIVE,
+            ),
+        ],
+    )
+)
+
+INT_UNARY_CONDITIONS = register(
+    OperationTable(
+        "int_unary_condition",
+        1,
+        "INT",
+        "BOOL",
+        [
+            Operation("IsZero", lambda a: a == 0),
+            Operation("IsNonZero", lambda a: a != 0),
+            Operation("IsPositive", lambda a: a > 0),
+            Operation("IsNegative", lambda a: a < 0),
+            Operation("IsEven", lambda a: a % 2 == 0),
+            Operation("IsOdd", lambda a: a % 2 == 1),
+        ],
+    )
+)
+
+INT_BINARY_OPERATIONS = register(
+    OperationTable(
+        "int_binary",
+        2,
+        "INT",
+        "INT",
+        [
+            Operation("Add", lambda a, b: a + b),
+            Operation("Sub", lambda a, b: a - b),
+            Operation("Mul", lambda a, b: a * b),
+            Operation("Div", lambda a, b: a // b, domain=NONZERO_DIVISOR),
+            Operation("Mod", lambda a, b: a % b, domain=NONZERO_DIVISOR),
+            Operation(
+                "Pow",
+                lambda a, b: a**b,
+                domain=Domain(
+                    lambda a, b: not (a == 0 and b < 0), "not 0 to a negative power"
+                ),
+                cost=COST_EXPENSIVE,
+            ),
+            Operation("And", lambda a, b: a & b),
+            Operation("Nand", lambda a, b: ~a & b),
+            Operation("Or", lambda a, b: a | b),
+            Operation("Nor", lambda a, b: ~a & b),
+            Operation("Xor", lambda a, b: a ^ b),
+            Operation("Xnor", lambda a, b: ~a ^ b),
+            Operation("Shl", lambda a, b: a << b, domain=NON_NEGATIVE_SHIFT),
+            Operation("Shr", lambda a, b: a >> b, domain=NON_NEGATIVE_SHIFT),
+            Operation("Max", lambda a, b: max(a, b)),
+            Operation("Min", lambda a, b: min(a, b)),
+        ],
+    )
+)
+
+INT_BINARY_CONDITIONS = register(
+    OperationTable(
+        "int_binary_condition",
+        2,
+        "INT",
+        "BOOL",
+        [
+            Operation("Eq", lambda a, b: a == b),
+            Operation("Neq", lambda a, b: a != b),
+            Operation("Gt", lambda a, b: a > b),
+            Operation("Lt", lambda a, b: a < b),
+            Operation("Geq", lambda a, b: a >= b),
+            Operation("Leq", lambda a, b: a <= b),
+        ],
+    )
+)
+
+INT_UNARY_EXPENSIVE_OPERATIONS = INT_UNARY_OPERATIONS.with_cost(COST_EXPENSIVE)
+
+INT_BINARY_EXPENSIVE_OPERATIONS = INT_BINARY_OPERATIONS.with_cost(COST_EXPENSIVE)
 
 
 class IntUnaryOperation:
@@ -64,7 +127,22 @@ class IntUnaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/int"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls, op: Optional[str] = None, a: Optional[int] = None
+    ) -> Union[bool, str]:
+        result = validate_operation(INT_UNARY_OPERATIONS, op, a=a)
+        if result is True and op is not None and a is not None:
+            try:
+                check_int_cost(op, a)
+            except IntCostExceeded as e:
+                return str(e)
+        return result
+
     def op(self, op: str, a: int) -> tuple[int]:
+        check_int_cost(op, a)
+        if op in INT_UNARY_EXPENSIVE_OPERATIONS:
+            return (memoized("int_unary", op, INT_UNARY_OPERATIONS[op], a),)
         return (INT_UNARY_OPERATIONS[op](a),)
 
 
@@ -98,7 +176,25 @@ class IntBinaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/int"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls,
+        op: Optional[str] = None,
+        a: Optional[int] = None,
+        b: Optional[int] = None,
+    ) -> Union[bool, str]:
+        result = validate_operation(INT_BINARY_OPERATIONS, op, a=a, b=b)
+        if result is True and op is not None and a is not None and b is not None:
+            try:
+                check_int_cost(op, a, b)
+            except IntCostExceeded as e:
+                return str(e)
+        return result
+
     def op(self, op: str, a: int, b: int) -> tuple[int]:
+        check_int_cost(op, a, b)
+        if op in INT_BINARY_EXPENSIVE_OPERATIONS:
+            return (memoized("int_binary", op, INT_BINARY_OPERATIONS[op], a, b),)
         return (INT_BINARY_OPERATIONS[op](a, b),)
 
 
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import os
+import struct
+import zipfile
+
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+from .lazy import lazy_import
+from .sequence import MAX_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+numpy = lazy_import("numpy")
+
+ARRAY_DIRS_ENV = "COMFYMATH_ARRAY_DIRS"
+ARRAY_CACHE_SIZE = 16
+ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+ARRAY_INPUTS: Mapping[str, Any] = {
+    "path": ("STRING", {"default": ""}),
+    "key": ("STRING", {"default": ""}),
+    "start": ("INT", {"default": 0, "min": 0}),
+    "count": ("INT", {"default": 0, "min": 0, "max": MAX_CHUNK_SIZE}),
+}
+
+
+def input_directory() -> Path:
+    try:
+        import folder_paths
+    except ImportError:
+        return Path.cwd().resolve()
+    return Path(folder_paths.get_input_directory()).resolve()
+
+
+def array_directories() -> list[Path]:
+    extra = os.environ.get(ARRAY_DIRS_ENV, "").split(os.pathsep)
+    return [input_directory(), *(Path(d).resolve() for d in extra if d.strip())]
+
+
+def resolve_path(path: str) -> Path:
+    # Prompts can come from anyone who can reach the server, so like LoadImage
+    # only files inside the input directory, or the directories listed in
+    # COMFYMATH_ARRAY_DIRS, can be read.
+    directories = array_directories()
+    resolved = (directories[0] / path.strip()).resolve()
+    if not any(resolved.is_relative_to(directory) for directory in directories):
+        raise ValueError(
+            f"{path} is outside the input directory, add its directory to"
+            f" {ARRAY_DIRS_ENV} to read it"
+        )
+    if not resolved.is_file():
+        raise FileNotFoundError(f"No array file at {resolved}")
+    return resolved
+
+
+def _file_version(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _memmap_member(path: Path, info: zipfile.ZipInfo) -> numpy.ndarray:
+    # A stored .npz member is a plain .npy file inside the archive, so it can
+    # be mapped once the local header and the .npy header are skipped.
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        header = ZIP_LOCAL_HEADER.unpack(f.read(ZIP_LOCAL_HEADER.size))
+        if header[0] != ZIP_LOCAL_HEADER_SIGNATURE:
+            raise ValueError(f"Corrupt zip entry {info.filename}")
+        name_length, extra_length = header[-2:]
+        f.seek(info.header_offset + ZIP_LOCAL_HEADER.size + name_length + extra_length)
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(f)
+        else:
+            raise ValueError(f"Cannot map .npy format {version}")
+        offset = f.tell()
+    if dtype.hasobject:
+        raise ValueError(f"{info.filename} holds Python objects")
+    if math.prod(shape) == 0:
+        return numpy.empty(shape, dtype=dtype)
+    return numpy.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def _open_npz(path: Path, key: str) -> numpy.ndarray:
+    with zipfile.ZipFile(path) as archive:
+        members = {name.removesuffix(".npy"): name for name in archive.namelist()}
+        if not key and len(members) == 1:
+            key = next(iter(members))
+        if key not in members:
+            problem = f"has no array {key!r}" if key else "holds several arrays"
+            raise ValueError(
+                f"{path.name} {problem}, set key to one of {', '.join(members)}"
+            )
+        info = archive.getinfo(members[key])
+        if info.compress_type == zipfile.ZIP_STORED:
+            return _memmap_member(path, info)
+        logger.info("%s in %s is compressed, reading it into memory", key, path)
+        with archive.open(info) as f:
+            return numpy.lib.format.read_array(f, allow_pickle=False)
+
+
+@functools.lru_cache(maxsize=ARRAY_CACHE_SIZE)
+def _open_array(path: Path, key: str, version: tuple[int, int]) -> numpy.ndarray:
+    if zipfile.is_zipfile(path):
+        array = _open_npz(path, key)
+    else:
+        array = numpy.load(path, mmap_mode="r", allow_pickle=False)
+    if array.ndim == 0:
+        raise ValueError(f"{path.name} holds a scalar, not an array")
+    return array
+
+
+def open_array(path: str, key: str = "") -> numpy.ndarray:
+    resolved = resolve_path(path)
+    return _open_array(resolved, key.strip(), _file_version(resolved))
+
+
+def array_rows(array: numpy.ndarray, start: int, count: int) -> numpy.ndarray:
+    length = len(array)
+    if start > length or (start == length and length > 0):
+        raise ValueError(f"start {start} is past the end of {length} rows")
+    stop = length if count <= 0 else min(start + count, length)
+    if stop - start > MAX_CHUNK_SIZE:
+        raise ValueError(
+            f"Reading {stop - start} rows, set count to read at most {MAX_CHUNK_SIZE}"
+        )
+    return array[start:stop]
+
+
+class ArrayLoader:
+    FUNCTION = "op"
+    CATEGORY = "math/io"
+
+    @classmethod
+    def IS_CHANGED(cls, path: str, **kwargs: Any) -> Union[str, float]:
+        try:
+            mtime, size = _file_version(resolve_path(path))
+        except (OSError, ValueError):
+            return math.nan
+        return f"{mtime}:{size}"
+
+
+class LoadNumberArray(ArrayLoader):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {**ARRAY_INPUTS, "column": ("INT", {"default": 0, "min": 0})}
+        }
+
+    RETURN_TYPES = ("FLOAT", "INT")
+    RETURN_NAMES = ("values", "length")
+    OUTPUT_IS_LIST = (True, False)
+
+    def op(
+        self, path: str, key: str, start: int, count: int, column: int
+    ) -> tuple[list[float], int]:
+        array = open_array(path, key)
+        if array.ndim > 2:
+            raise ValueError(f"Expected a 1 or 2 dimensional array, got {array.shape}")
+        if array.ndim == 2 and column >= array.shape[1]:
+            raise ValueError(f"column {column} is out of range for {array.shape}")
+        rows = array_rows(array, start, count)
+        if rows.ndim == 2:
+            rows = rows[:, column]
+        return (rows.astype(numpy.float64).tolist(), len(array))
+
+
+class LoadVecArray(ArrayLoader):
+    DIMENSIONS = 0
+
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": ARRAY_INPUTS}
+
+    RETURN_NAMES = ("values", "array", "length")
+    OUTPUT_IS_LIST = (True, False, False)
+
+    def op(
+        self, path: str, key: str, start: int, count: int
+    ) -> tuple[list[tuple[float, ...]], numpy.ndarray, int]:
+        array = open_array(path, key)
+        if array.ndim != 2 or array.shape[1] != self.DIMENSIONS:
+            raise ValueError(
+                f"Expected an array of shape (N, {self.DIMENSIONS}), got {array.shape}"
+            )
+        rows = numpy.ascontiguousarray(
+            array_rows(array, start, count), dtype=numpy.float64
+        )
+        return ([tuple(row) for row in rows.tolist()], rows, len(array))
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_LoadNumberArray": LoadNumberArray,
+    **{
+        f"CM_LoadVec{dimensions}Array": type(
+            f"LoadVec{dimensions}Array",
+            (LoadVecArray,),
+            {
+                "DIMENSIONS": dimensions,
+                "RETURN_TYPES": (f"VEC{dimensions}", f"VEC{dimensions}_ARRAY", "INT"),
+            },
+        )
+        for dimensions in (2, 3, 4)
+    },
+}
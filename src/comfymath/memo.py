@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Mapping
+
+MEMO_MAX_BYTES_ENV = "COMFYMATH_MEMO_MAX_BYTES"
+DEFAULT_MEMO_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_sizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class MemoCache:
+    def __init__(self, max_bytes: int = DEFAULT_MEMO_MAX_BYTES) -> None:
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def call(self, table: str, op: str, func: Callable[..., Any], *args: Any) -> Any:
+        key = (table, op, tuple((type(arg), arg) for arg in args))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        result = func(*args)
+        size = _sizeof(args) + _sizeof(result)
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (result, size)
+                self.size_bytes += size
+                self._evict()
+        return result
+
+    def configure(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Mapping[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _evict(self) -> None:
+        while self.size_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size_bytes -= size
+
+
+MEMO_CACHE = MemoCache(int(os.environ.get(MEMO_MAX_BYTES_ENV, DEFAULT_MEMO_MAX_BYTES)))
+
+
+def memoized(table: str, op: str, func: Callable[..., Any], *args: Any) -> Any:
+    return MEMO_CACHE.call(table, op, func, *args)
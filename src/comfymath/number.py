@@ -1,13 +1,20 @@
-from dataclasses import dataclass
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Optional, Union
 
 from .float import (
     FLOAT_UNARY_OPERATIONS,
     FLOAT_UNARY_CONDITIONS,
     FLOAT_BINARY_OPERATIONS,
     FLOAT_BINARY_CONDITIONS,
+    FLOAT_UNARY_UFUNCS,
+    FLOAT_UNARY_CONDITION_UFUNCS,
+    FLOAT_BINARY_UFUNCS,
+    FLOAT_BINARY_CONDITION_UFUNCS,
+    FLOAT_UNARY_EXPENSIVE_OPERATIONS,
 )
+from .memo import memoized
+from .registry import validate_operation, validate_operation_list
 from .types import Number
+from .vectorize import map_binary, map_unary
 
 DEFAULT_NUMBER = ("NUMBER", {"default": 0.0})
 
@@ -26,7 +33,15 @@ class NumberUnaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/number"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls, op: Optional[str] = None, a: Optional[float] = None
+    ) -> Union[bool, str]:
+        return validate_operation(FLOAT_UNARY_OPERATIONS, op, a=a)
+
     def op(self, op: str, a: Number) -> tuple[float]:
+        if op in FLOAT_UNARY_EXPENSIVE_OPERATIONS:
+            return (memoized("float_unary", op, FLOAT_UNARY_OPERATIONS[op], float(a)),)
         return (FLOAT_UNARY_OPERATIONS[op](float(a)),)
 
 
@@ -63,6 +78,15 @@ class NumberBinaryOperation:
     FUNCTION = "op"
     CATEGORY = "math/number"
 
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls,
+        op: Optional[str] = None,
+        a: Optional[float] = None,
+        b: Optional[float] = None,
+    ) -> Union[bool, str]:
+        return validate_operation(FLOAT_BINARY_OPERATIONS, op, a=a, b=b)
+
     def op(self, op: str, a: Number, b: Number) -> tuple[float]:
         return (FLOAT_BINARY_OPERATIONS[op](float(a), float(b)),)
 
@@ -86,9 +110,116 @@ class NumberBinaryCondition:
         return (FLOAT_BINARY_CONDITIONS[op](float(a), float(b)),)
 
 
+class NumberUnaryOperationList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_UNARY_OPERATIONS.keys()),),
+                "a": DEFAULT_NUMBER,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("NUMBER",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/number"
+
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls, op: Optional[list[str]] = None, a: Optional[list[float]] = None
+    ) -> Union[bool, str]:
+        return validate_operation_list(FLOAT_UNARY_OPERATIONS, op, a=a)
+
+    def op(self, op: list[str], a: list[Number]) -> tuple[list[float]]:
+        return (map_unary(op[0], FLOAT_UNARY_UFUNCS, FLOAT_UNARY_OPERATIONS, a),)
+
+
+class NumberUnaryConditionList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_UNARY_CONDITIONS.keys()),),
+                "a": DEFAULT_NUMBER,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("BOOL",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/number"
+
+    def op(self, op: list[str], a: list[Number]) -> tuple[list[bool]]:
+        return (
+            map_unary(op[0], FLOAT_UNARY_CONDITION_UFUNCS, FLOAT_UNARY_CONDITIONS, a),
+        )
+
+
+class NumberBinaryOperationList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_BINARY_OPERATIONS.keys()),),
+                "a": DEFAULT_NUMBER,
+                "b": DEFAULT_NUMBER,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("NUMBER",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/number"
+
+    @classmethod
+    def VALIDATE_INPUTS(
+        cls,
+        op: Optional[list[str]] = None,
+        a: Optional[list[float]] = None,
+        b: Optional[list[float]] = None,
+    ) -> Union[bool, str]:
+        return validate_operation_list(FLOAT_BINARY_OPERATIONS, op, a=a, b=b)
+
+    def op(self, op: list[str], a: list[Number], b: list[Number]) -> tuple[list[float]]:
+        return (map_binary(op[0], FLOAT_BINARY_UFUNCS, FLOAT_BINARY_OPERATIONS, a, b),)
+
+
+class NumberBinaryConditionList:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_BINARY_CONDITIONS.keys()),),
+                "a": DEFAULT_NUMBER,
+                "b": DEFAULT_NUMBER,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("BOOL",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/number"
+
+    def op(self, op: list[str], a: list[Number], b: list[Number]) -> tuple[list[bool]]:
+        return (
+            map_binary(
+                op[0], FLOAT_BINARY_CONDITION_UFUNCS, FLOAT_BINARY_CONDITIONS, a, b
+            ),
+        )
+
+
 NODE_CLASS_MAPPINGS = {
     "CM_NumberUnaryOperation": NumberUnaryOperation,
     "CM_NumberUnaryCondition": NumberUnaryCondition,
     "CM_NumberBinaryOperation": NumberBinaryOperation,
     "CM_NumberBinaryCondition": NumberBinaryCondition,
+    "CM_NumberUnaryOperationList": NumberUnaryOperationList,
+    "CM_NumberUnaryConditionList": NumberUnaryConditionList,
+    "CM_NumberBinaryOperationList": NumberBinaryOperationList,
+    "CM_NumberBinaryConditionList": NumberBinaryConditionList,
 }
@@ -0,0 +1,186 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ENV = "COMFYMATH_PROFILE"
+PROFILE_OUTPUT_ENV = "COMFYMATH_PROFILE_OUTPUT"
+MAX_SAMPLES = 10_000
+MAX_TRACE_EVENTS = 100_000
+PERCENTILES = (50, 90, 99)
+
+
+def _percentile(samples: list[int], percentile: int) -> int:
+    index = max(-(-len(samples) * percentile // 100) - 1, 0)
+    return samples[index]
+
+
+class NodeStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples: deque[int] = deque(maxlen=MAX_SAMPLES)
+
+    def add(self, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        self.samples.append(duration_ns)
+
+    def summary(self) -> dict[str, float]:
+        samples = sorted(self.samples)
+        summary = {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}_us"] = _percentile(samples, percentile) / 1e3
+        return summary
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], NodeStats] = {}
+        self._events: deque[dict[str, Any]] = deque(maxlen=MAX_TRACE_EVENTS)
+        self._origin_ns = time.perf_counter_ns()
+
+    def record(self, node: str, op: str, start_ns: int, end_ns: int) -> None:
+        name = f"{node}/{op}" if op else node
+        event = {
+            "name": name,
+            "cat": node,
+            "ph": "X",
+            "ts": (start_ns - self._origin_ns) / 1e3,
+            "dur": (end_ns - start_ns) / 1e3,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            stats = self._stats.get((node, op))
+            if stats is None:
+                stats = self._stats[(node, op)] = NodeStats()
+            stats.add(end_ns - start_ns)
+            self._events.append(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
+            self._origin_ns = time.perf_counter_ns()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            items = sorted(
+                self._stats.items(), key=lambda item: item[1].total_ns, reverse=True
+            )
+            return {
+                f"{node}/{op}" if op else node: stats.summary()
+                for (node, op), stats in items
+            }
+
+    def chrome_trace(self) -> dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.stats(), indent=2))
+
+    def export_chrome_trace(self, path: Path) -> None:
+        path.write_text(json.dumps(self.chrome_trace()))
+
+
+PROFILER = Profiler()
+
+
+def _op_name(kwargs: Mapping[str, Any]) -> str:
+    op = kwargs.get("op", "")
+    if isinstance(op, list):
+        op = op[0] if op else ""
+    return op if isinstance(op, str) else ""
+
+
+def _profiled(
+    node: str, func: Callable[..., Any], profiler: Profiler
+) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def call(*args: Any, **kwargs: Any) -> Any:
+        start_ns = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.record(node, _op_name(kwargs), start_ns, time.perf_counter_ns())
+
+    call.__comfymath_profiled__ = True  # type: ignore[attr-defined]
+    return call
+
+
+def instrument(
+    node_class_mappings: Mapping[str, Any], profiler: Profiler = PROFILER
+) -> int:
+    count = 0
+    for node, node_class in node_class_mappings.items():
+        func = getattr(node_class, node_class.FUNCTION, None)
+        if func is None:
+            continue
+        if getattr(func, "__comfymath_profiled__", False):
+            if node_class.FUNCTION in vars(node_class):
+                continue
+            func = func.__wrapped__
+        setattr(node_class, node_class.FUNCTION, _profiled(node, func, profiler))
+        count += 1
+    return count
+
+
+def export(directory: Path, profiler: Profiler = PROFILER) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    profiler.export_json(directory / "comfymath_profile.json")
+    profiler.export_chrome_trace(directory / "comfymath_trace.json")
+    logger.info("Wrote ComfyMath profile to %s", directory)
+
+
+def install_routes(profiler: Profiler = PROFILER) -> bool:
+    try:
+        from aiohttp import web
+        from server import PromptServer
+    except ImportError:
+        return False
+
+    routes = PromptServer.instance.routes
+
+    @routes.get("/comfymath/profile")
+    async def profile(request: Any) -> Any:
+        return web.json_response(profiler.stats())
+
+    @routes.get("/comfymath/profile/trace")
+    async def trace(request: Any) -> Any:
+        return web.json_response(profiler.chrome_trace())
+
+    @routes.post("/comfymath/profile/reset")
+    async def reset(request: Any) -> Any:
+        profiler.reset()
+        return web.json_response({})
+
+    return True
+
+
+def enable_profiling(node_class_mappings: Mapping[str, Any]) -> None:
+    count = instrument(node_class_mappings)
+    logger.info("Profiling %d ComfyMath node classes", count)
+    install_routes()
+    output: Optional[str] = os.environ.get(PROFILE_OUTPUT_ENV)
+    if output:
+        atexit.register(export, Path(output))
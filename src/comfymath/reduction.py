@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+
+from typing import Any, Callable, Mapping, Sequence
+
+from .cost import check_int_cost
+from .float import DEFAULT_FLOAT
+from .int import DEFAULT_INT
+from .lazy import lazy_import
+from .registry import Operation, OperationTable, register
+
+numpy = lazy_import("numpy")
+
+
+def _sum(a: Sequence[float]) -> float:
+    # fsum raises on overflow and inf - inf, where the Add node gives inf or nan.
+    try:
+        return math.fsum(a)
+    except (OverflowError, ValueError):
+        return float(sum(a))
+
+
+def _mean(a: Sequence[float]) -> float:
+    if not a:
+        raise ValueError("Mean of an empty list")
+    return _sum(a) / len(a)
+
+
+def _variance(a: Sequence[float], ddof: int) -> float:
+    if len(a) <= ddof:
+        raise ValueError(f"Variance needs more than {ddof} values")
+    values = numpy.asarray(a, dtype=numpy.float64)
+    deviations = values - _mean(a)
+    return _sum((deviations * deviations).tolist()) / (len(a) - ddof)
+
+
+def _extremum(a: Sequence[Any], arg: Callable[[numpy.ndarray], Any]) -> tuple[Any, int]:
+    if not a:
+        raise ValueError("Min/Max of an empty list")
+    index = int(arg(numpy.asarray(a)))
+    return a[index], index
+
+
+FLOAT_REDUCTIONS = register(
+    OperationTable(
+        "float_reduction",
+        1,
+        "FLOAT",
+        "FLOAT",
+        [
+            Operation("Sum", _sum),
+            Operation("Mean", _mean),
+            Operation("Prod", lambda a: float(math.prod(a))),
+            Operation("Min", lambda a: float(_extremum(a, numpy.argmin)[0])),
+            Operation("Max", lambda a: float(_extremum(a, numpy.argmax)[0])),
+            Operation("Variance", lambda a: _variance(a, 0)),
+            Operation("Std", lambda a: math.sqrt(_variance(a, 0))),
+            Operation("SampleVariance", lambda a: _variance(a, 1)),
+            Operation("SampleStd", lambda a: math.sqrt(_variance(a, 1))),
+        ],
+    )
+)
+
+INT_REDUCTIONS = register(
+    OperationTable(
+        "int_reduction",
+        1,
+        "INT",
+        "INT",
+        [
+            Operation("Sum", lambda a: sum(a)),
+            Operation("Prod", lambda a: math.prod(a)),
+            Operation("Min", lambda a: _extremum(a, numpy.argmin)[0]),
+            Operation("Max", lambda a: _extremum(a, numpy.argmax)[0]),
+        ],
+    )
+)
+
+EXTREMA: Mapping[str, Callable[[Sequence[Any]], tuple[Any, int]]] = {
+    "Min": lambda a: _extremum(a, numpy.argmin),
+    "Max": lambda a: _extremum(a, numpy.argmax),
+}
+
+
+class FloatListReduction:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(FLOAT_REDUCTIONS.keys()),),
+                "a": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("FLOAT",)
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    def op(self, op: list[str], a: list[float]) -> tuple[float]:
+        return (FLOAT_REDUCTIONS[op[0]]([float(x) for x in a]),)
+
+
+class FloatListExtremum:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(EXTREMA.keys()),),
+                "a": DEFAULT_FLOAT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("FLOAT", "INT")
+    RETURN_NAMES = ("value", "index")
+    FUNCTION = "op"
+    CATEGORY = "math/float"
+
+    def op(self, op: list[str], a: list[float]) -> tuple[float, int]:
+        value, index = EXTREMA[op[0]]([float(x) for x in a])
+        return (value, index)
+
+
+class IntListReduction:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(INT_REDUCTIONS.keys()),),
+                "a": DEFAULT_INT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("INT",)
+    FUNCTION = "op"
+    CATEGORY = "math/int"
+
+    def op(self, op: list[str], a: list[int]) -> tuple[int]:
+        check_int_cost(op[0], a)
+        return (INT_REDUCTIONS[op[0]](a),)
+
+
+class IntListExtremum:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(EXTREMA.keys()),),
+                "a": DEFAULT_INT,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("INT", "INT")
+    RETURN_NAMES = ("value", "index")
+    FUNCTION = "op"
+    CATEGORY = "math/int"
+
+    def op(self, op: list[str], a: list[int]) -> tuple[int, int]:
+        value, index = EXTREMA[op[0]](a)
+        return (value, index)
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_FloatListReduction": FloatListReduction,
+    "CM_FloatListExtremum": FloatListExtremum,
+    "CM_IntListReduction": IntListReduction,
+    "CM_IntListExtremum": IntListExtremum,
+}
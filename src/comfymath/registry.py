@@ -0,0 +1,167 @@
+import dataclasses
+
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from .vectorize import broadcast_lists
+
+COST_CHEAP = "cheap"
+COST_EXPENSIVE = "expensive"
+
+
+class Domain(NamedTuple):
+    check: Callable[..., bool]
+    description: str
+    # Per input conditions that hold whatever the other inputs are, checked
+    # when some inputs are linked and so unknown before execution.
+    inputs: tuple[Optional[Callable[[Any], bool]], ...] = ()
+
+
+def input_domain(description: str, *checks: Optional[Callable[[Any], bool]]) -> Domain:
+    return Domain(
+        lambda *args: all(
+            check is None or check(arg) for check, arg in zip(checks, args)
+        ),
+        description,
+        checks,
+    )
+
+
+@dataclass(frozen=True)
+class Operation:
+    name: str
+    func: Callable[..., Any]
+    vectorized: Optional[Callable[..., Any]] = None
+    domain: Optional[Domain] = None
+    cost: str = COST_CHEAP
+    arity: int = 0
+    input_type: str = ""
+    output_type: str = ""
+
+    def in_domain(self, *args: Any) -> bool:
+        return self.domain is None or self.domain.check(*args)
+
+
+class OperationTable(Mapping[str, Callable[..., Any]]):
+    def __init__(
+        self,
+        name: str,
+        arity: int,
+        input_type: str,
+        output_type: str,
+        operations: Iterable[Operation],
+    ) -> None:
+        self.name = name
+        self.input_type = input_type
+        self._operations = {
+            operation.name: dataclasses.replace(
+                operation,
+                arity=operation.arity or arity,
+                input_type=operation.input_type or input_type,
+                output_type=operation.output_type or output_type,
+            )
+            for operation in operations
+        }
+
+    def __getitem__(self, op: str) -> Callable[..., Any]:
+        return self._operations[op].func
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._operations)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def __repr__(self) -> str:
+        return f"OperationTable({self.name!r}, {list(self._operations)!r})"
+
+    def operation(self, op: str) -> Operation:
+        return self._operations[op]
+
+    def operations(self) -> Iterable[Operation]:
+        return self._operations.values()
+
+    def accepting(self, input_type: str) -> list[str]:
+        return [
+            name
+            for name, operation in self._operations.items()
+            if operation.input_type in (self.input_type, input_type)
+        ]
+
+    def vectorized(self) -> Mapping[str, Callable[..., Any]]:
+        return {
+            name: operation.vectorized
+            for name, operation in self._operations.items()
+            if operation.vectorized is not None
+        }
+
+    def domains(self) -> Mapping[str, Domain]:
+        return {
+            name: operation.domain
+            for name, operation in self._operations.items()
+            if operation.domain is not None
+        }
+
+    def with_cost(self, cost: str) -> frozenset[str]:
+        return frozenset(
+            name
+            for name, operation in self._operations.items()
+            if operation.cost == cost
+        )
+
+
+OPERATION_TABLES: dict[str, OperationTable] = {}
+
+
+def register(table: OperationTable) -> OperationTable:
+    OPERATION_TABLES[table.name] = table
+    return table
+
+
+def validate_operation(
+    table: OperationTable, op: Any, **inputs: Any
+) -> Union[bool, str]:
+    if op is None:
+        return True
+    if op not in table:
+        return f"Unknown op {op!r}"
+    operation = table.operation(op)
+    if operation.domain is None:
+        return True
+    args = list(inputs.values())
+    if all(arg is not None for arg in args):
+        valid = operation.domain.check(*args)
+    else:
+        valid = all(
+            check(arg)
+            for check, arg in zip(operation.domain.inputs, args)
+            if check is not None and arg is not None
+        )
+    if valid:
+        return True
+    values = ", ".join(
+        f"{name}={value!r}" for name, value in inputs.items() if value is not None
+    )
+    return f"{op} is undefined for {values}, it needs {operation.domain.description}"
+
+
+def validate_operation_list(
+    table: OperationTable, op: Optional[list[Any]], **inputs: Optional[list[Any]]
+) -> Union[bool, str]:
+    if not op:
+        return True
+    columns = broadcast_lists(*(values or [None] for values in inputs.values()))
+    for row in zip(*columns):
+        result = validate_operation(table, op[0], **dict(zip(inputs, row)))
+        if result is not True:
+            return result
+    return True
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple
+
+from .lazy import lazy_import
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
+numpy = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+RESOLUTION_PATH_ENV = "COMFYMATH_RESOLUTION_PATH"
+BUILTIN_RESOLUTION_DIR = Path(__file__).resolve().parent / "resolutions"
+RESOLUTION_FILE_SUFFIXES = (".json", ".toml")
+
+Resolution = Tuple[int, int, float]
+
+
+class ResolutionIndex:
+    def __init__(self, resolutions: Sequence[Resolution]) -> None:
+        self.resolutions = list(resolutions)
+        first_index: dict[float, int] = {}
+        for index, resolution in enumerate(self.resolutions):
+            first_index.setdefault(resolution[2], index)
+        self.ratios = sorted(first_index)
+        self.indices = [first_index[ratio] for ratio in self.ratios]
+        self._ratio_array: Optional[numpy.ndarray] = None
+
+    def nearest(self, ratio: float) -> Optional[Resolution]:
+        if not self.ratios:
+            return None
+        position = bisect.bisect_left(self.ratios, ratio)
+        candidates = self.indices[max(position - 1, 0) : position + 1]
+        index = min(
+            candidates,
+            key=lambda index: (abs(ratio - self.resolutions[index][2]), index),
+        )
+        return self.resolutions[index]
+
+    def nearest_many(self, ratios: Sequence[float]) -> list[Resolution]:
+        if not self.resolutions or not ratios:
+            return []
+        if self._ratio_array is None:
+            self._ratio_array = numpy.array([res[2] for res in self.resolutions])
+        differences = numpy.abs(
+            numpy.asarray(ratios, dtype=numpy.float64)[:, None]
+            - self._ratio_array[None, :]
+        )
+        return [self.resolutions[index] for index in differences.argmin(axis=1)]
+
+
+@dataclass(frozen=True)
+class ResolutionFamily:
+    name: str
+    resolutions: Tuple[Resolution, ...]
+    source: Optional[Path] = None
+    index: ResolutionIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "index", ResolutionIndex(self.resolutions))
+
+
+def parse_family(
+    data: Mapping[str, Any], source: Optional[Path] = None
+) -> ResolutionFamily:
+    name = data.get("name")
+    if not isinstance(name, str) or not name.isidentifier():
+        raise ValueError(f"Resolution family name must be an identifier, got {name!r}")
+    entries = data.get("resolutions")
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Resolution family {name} has no resolutions")
+    resolutions = []
+    for entry in entries:
+        if (
+            not isinstance(entry, (list, tuple))
+            or len(entry) != 2
+            or not all(isinstance(v, int) and not isinstance(v, bool) for v in entry)
+            or min(entry) <= 0
+        ):
+            raise ValueError(f"Invalid resolution {entry!r} in family {name}")
+        width, height = entry
+        resolutions.append((width, height, width / height))
+    return ResolutionFamily(name, tuple(resolutions), source)
+
+
+def load_family(path: Path) -> ResolutionFamily:
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError(f"Cannot read {path}: TOML support needs tomli")
+        with path.open("rb") as f:
+            data = tomllib.load(f)
+    else:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} does not contain a resolution family")
+    return parse_family(data, path)
+
+
+def resolution_directories() -> list[Path]:
+    extra = os.environ.get(RESOLUTION_PATH_ENV, "")
+    return [BUILTIN_RESOLUTION_DIR] + [
+        Path(directory) for directory in extra.split(os.pathsep) if directory
+    ]
+
+
+def load_families(directories: Iterable[Path]) -> dict[str, ResolutionFamily]:
+    families: dict[str, ResolutionFamily] = {}
+    for directory in directories:
+        if not directory.is_dir():
+            logger.warning("Resolution directory %s does not exist", directory)
+            continue
+        for path in sorted(directory.iterdir()):
+            if path.suffix not in RESOLUTION_FILE_SUFFIXES:
+                continue
+            try:
+                family = load_family(path)
+            except (OSError, ValueError) as e:
+                logger.warning("Skipping resolution file %s: %s", path, e)
+                continue
+            if family.name in families:
+                logger.info(
+                    "Resolution family %s from %s replaces %s",
+                    family.name,
+                    path,
+                    families[family.name].source,
+                )
+            families[family.name] = family
+    return families
+
+
+RESOLUTION_FAMILIES = load_families(resolution_directories())
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+
+from typing import Any, Callable, Mapping, Sequence
+
+from .lazy import lazy_import
+from .sequence import MAX_CHUNK_SIZE
+
+numpy = lazy_import("numpy")
+
+MAX_SEED = 0xFFFFFFFFFFFFFFFF
+PHILOX_BLOCK = 4
+
+# Every node draws from its own stream, stored in the top word of the Philox
+# counter, so e.g. a RandomInt and a RandomFloat with one seed are unrelated.
+STREAM_UNIFORM = 0
+STREAM_NORMAL = 1
+STREAM_INT = 2
+STREAM_CHOICE = 3
+STREAM_SHUFFLE = 4
+
+SEED_INPUT = ("INT", {"default": 0, "min": 0, "max": MAX_SEED})
+BATCH_INPUTS: Mapping[str, Any] = {
+    "index": ("INT", {"default": 0, "min": 0}),
+    "count": ("INT", {"default": 1, "min": 1, "max": MAX_CHUNK_SIZE}),
+}
+
+
+def philox_raw(seed: int, stream: int, start: int, count: int) -> numpy.ndarray:
+    # Philox produces 4 words per counter value, so draw n of the sequence is
+    # word n % 4 of counter n // 4 and any slice can be generated directly.
+    block, offset = divmod(start, PHILOX_BLOCK)
+    generator = numpy.random.Philox(key=seed, counter=block + (stream << 192))
+    blocks = -(-(offset + count) // PHILOX_BLOCK)
+    return generator.random_raw(blocks * PHILOX_BLOCK)[offset : offset + count]
+
+
+def _unit(raw: numpy.ndarray) -> numpy.ndarray:
+    return (raw >> numpy.uint64(11)).astype(numpy.float64) * 2.0**-53
+
+
+def uniform(seed: int, index: int, count: int, dimensions: int = 1) -> numpy.ndarray:
+    raw = philox_raw(seed, STREAM_UNIFORM, index * dimensions, count * dimensions)
+    return _unit(raw).reshape(count, dimensions)
+
+
+def normal(seed: int, index: int, count: int, dimensions: int = 1) -> numpy.ndarray:
+    # Box-Muller from two draws per value, only the cosine half is used so
+    # each value depends on its own draws alone.
+    raw = philox_raw(
+        seed, STREAM_NORMAL, 2 * index * dimensions, 2 * count * dimensions
+    ).reshape(-1, 2)
+    radius = numpy.sqrt(-2.0 * numpy.log(1.0 - _unit(raw[:, 0])))
+    values = radius * numpy.cos(math.tau * _unit(raw[:, 1]))
+    return values.reshape(count, dimensions)
+
+
+def integers(seed: int, index: int, count: int, low: int, high: int) -> list[int]:
+    if high < low:
+        raise ValueError(f"RandomInt max {high} is below min {low}")
+    span = high - low + 1
+    if span > 1 << 128:
+        raise ValueError(f"RandomInt range {low}..{high} is wider than 2**128")
+    if span > 1 << 64:
+        # Two draws per value make a 128 bit word.
+        words = philox_raw(seed, STREAM_INT, 2 * index, 2 * count).tolist()
+        return [
+            low + ((high_word << 64 | low_word) % span)
+            for high_word, low_word in zip(words[::2], words[1::2])
+        ]
+    raw = philox_raw(seed, STREAM_INT, index, count)
+    if span <= MAX_SEED:
+        raw %= numpy.uint64(span)
+    return [low + offset for offset in raw.tolist()]
+
+
+def permutation(seed: int, length: int) -> numpy.ndarray:
+    return numpy.argsort(philox_raw(seed, STREAM_SHUFFLE, 0, length), kind="stable")
+
+
+RANDOM_DISTRIBUTIONS: Mapping[str, Callable[..., numpy.ndarray]] = {
+    "Uniform": lambda seed, index, count, dimensions, a, b: (
+        a + (b - a) * uniform(seed, index, count, dimensions)
+    ),
+    "Normal": lambda seed, index, count, dimensions, a, b: (
+        a + b * normal(seed, index, count, dimensions)
+    ),
+}
+
+DISTRIBUTION_INPUTS: Mapping[str, Any] = {
+    "distribution": (list(RANDOM_DISTRIBUTIONS.keys()),),
+    "a": ("FLOAT", {"default": 0.0, "step": 0.001, "round": False}),
+    "b": ("FLOAT", {"default": 1.0, "step": 0.001, "round": False}),
+}
+
+
+class RandomFloat:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"seed": SEED_INPUT, **DISTRIBUTION_INPUTS, **BATCH_INPUTS}}
+
+    RETURN_TYPES = ("FLOAT",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/random"
+
+    def op(
+        self,
+        seed: int,
+        distribution: str,
+        a: float,
+        b: float,
+        index: int,
+        count: int,
+    ) -> tuple[list[float]]:
+        values = RANDOM_DISTRIBUTIONS[distribution](seed, index, count, 1, a, b)
+        return (values[:, 0].tolist(),)
+
+
+class RandomInt:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "seed": SEED_INPUT,
+                "min": ("INT", {"default": 0}),
+                "max": ("INT", {"default": 100}),
+                **BATCH_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("INT",)
+    OUTPUT_IS_LIST = (True,)
+    FUNCTION = "op"
+    CATEGORY = "math/random"
+
+    def op(
+        self, seed: int, min: int, max: int, index: int, count: int
+    ) -> tuple[list[int]]:
+        return (integers(seed, index, count, min, max),)
+
+
+class RandomVec:
+    DIMENSIONS = 0
+
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"seed": SEED_INPUT, **DISTRIBUTION_INPUTS, **BATCH_INPUTS}}
+
+    RETURN_NAMES = ("values", "array")
+    OUTPUT_IS_LIST = (True, False)
+    FUNCTION = "op"
+    CATEGORY = "math/random"
+
+    def op(
+        self,
+        seed: int,
+        distribution: str,
+        a: float,
+        b: float,
+        index: int,
+        count: int,
+    ) -> tuple[list[tuple[float, ...]], numpy.ndarray]:
+        values = RANDOM_DISTRIBUTIONS[distribution](
+            seed, index, count, self.DIMENSIONS, a, b
+        )
+        return ([tuple(row) for row in values.tolist()], values)
+
+
+class RandomChoice:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "values": ("*",),
+                "seed": SEED_INPUT,
+                **BATCH_INPUTS,
+            }
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("*", "INT")
+    RETURN_NAMES = ("values", "indices")
+    OUTPUT_IS_LIST = (True, True)
+    FUNCTION = "op"
+    CATEGORY = "math/random"
+
+    def op(
+        self,
+        values: Sequence[Any],
+        seed: list[int],
+        index: list[int],
+        count: list[int],
+    ) -> tuple[list[Any], list[int]]:
+        if not values:
+            raise ValueError("RandomChoice needs at least one value")
+        raw = philox_raw(seed[0], STREAM_CHOICE, index[0], count[0])
+        indices = (raw % numpy.uint64(len(values))).tolist()
+        return ([values[i] for i in indices], indices)
+
+
+class Shuffle:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"values": ("*",), "seed": SEED_INPUT}}
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("*", "INT")
+    RETURN_NAMES = ("values", "indices")
+    OUTPUT_IS_LIST = (True, True)
+    FUNCTION = "op"
+    CATEGORY = "math/random"
+
+    def op(self, values: Sequence[Any], seed: list[int]) -> tuple[list[Any], list[int]]:
+        indices = permutation(seed[0], len(values)).tolist()
+        return ([values[i] for i in indices], indices)
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_RandomFloat": RandomFloat,
+    "CM_RandomInt": RandomInt,
+    **{
+        f"CM_RandomVec{dimensions}": type(
+            f"RandomVec{dimensions}",
+            (RandomVec,),
+            {
+                "DIMENSIONS": dimensions,
+                "RETURN_TYPES": (f"VEC{dimensions}", f"VEC{dimensions}_ARRAY"),
+            },
+        )
+        for dimensions in (2, 3, 4)
+    },
+    "CM_RandomChoice": RandomChoice,
+    "CM_Shuffle": Shuffle,
+}
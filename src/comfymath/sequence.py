@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import bisect
+import math
+
+from abc import ABC, abstractmethod
+from fractions import Fraction
+from typing import Any, Mapping, Optional, Sequence, Union, overload
+
+from .lazy import lazy_import
+
+numpy = lazy_import("numpy")
+
+MAX_CHUNK_SIZE = 1 << 24
+MAX_GRID_SIZE = (1 << 63) - 1
+GRID_AXES = ("x", "y", "z", "w")
+
+CHUNK_INPUTS: Mapping[str, Any] = {
+    "chunk_size": ("INT", {"default": 0, "min": 0, "max": MAX_CHUNK_SIZE}),
+    "chunk_index": ("INT", {"default": 0, "min": 0}),
+}
+
+
+def chunk_bounds(length: int, chunk_size: int, chunk_index: int) -> tuple[int, int]:
+    if chunk_size <= 0:
+        if length > MAX_CHUNK_SIZE:
+            raise ValueError(
+                f"Sequence has {length} elements, set chunk_size to process it in"
+                f" chunks of at most {MAX_CHUNK_SIZE}"
+            )
+        chunk_size = max(length, 1)
+    start = chunk_index * chunk_size
+    if chunk_index < 0 or (start >= length and chunk_index > 0):
+        raise ValueError(
+            f"chunk_index {chunk_index} is out of range for {length} elements in"
+            f" chunks of {chunk_size}"
+        )
+    return start, min(start + chunk_size, length)
+
+
+def chunk_count(length: int, chunk_size: int) -> int:
+    if chunk_size <= 0:
+        return 1
+    return max(-(-length // chunk_size), 1)
+
+
+class NumericSequence(Sequence[float], ABC):
+    def __init__(self, count: int) -> None:
+        self.count = max(count, 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[float]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, list[float]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step != 1:
+                return [self.value(i) for i in range(start, stop, step)]
+            return self.values(start, stop)
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("sequence index out of range")
+        return self.value(index)
+
+    @abstractmethod
+    def value(self, index: int) -> float: ...
+
+    def values(self, start: int, stop: int) -> list[float]:
+        return [self.value(i) for i in range(start, stop)]
+
+    def chunk(self, chunk_size: int, chunk_index: int) -> list[float]:
+        return self[slice(*chunk_bounds(self.count, chunk_size, chunk_index))]
+
+
+class ArithmeticSequence(NumericSequence):
+    def __init__(self, start: float, step: float, count: int) -> None:
+        super().__init__(count)
+        self.start = start
+        self.step = step
+
+    def value(self, index: int) -> float:
+        return self.start + index * self.step
+
+    def values(self, start: int, stop: int) -> list[float]:
+        indices = numpy.arange(start, max(start, stop), dtype=numpy.float64)
+        return (self.start + indices * self.step).tolist()
+
+
+class LinearSequence(NumericSequence):
+    def __init__(self, start: float, stop: float, count: int, endpoint: bool) -> None:
+        super().__init__(count)
+        self.start = start
+        self.stop = stop
+        self.endpoint = endpoint and count > 1
+        self.divisions = count - 1 if endpoint else count
+        self.step = (stop - start) / self.divisions if self.divisions > 0 else 0.0
+
+    def value(self, index: int) -> float:
+        if self.endpoint and index == self.count - 1:
+            return self.stop
+        return index * self.step + self.start
+
+    def values(self, start: int, stop: int) -> list[float]:
+        indices = numpy.arange(start, max(start, stop), dtype=numpy.float64)
+        result = indices * self.step + self.start
+        if self.endpoint and stop == self.count and len(result):
+            result[-1] = self.stop
+        return result.tolist()
+
+
+class GeometricSequence(NumericSequence):
+    def __init__(self, start: float, stop: float, count: int, endpoint: bool) -> None:
+        if start == 0 or stop == 0:
+            raise ValueError("Geometric sequence cannot start or stop at zero")
+        if (start < 0) != (stop < 0):
+            raise ValueError("Geometric sequence start and stop must have one sign")
+        super().__init__(count)
+        self.start = start
+        self.stop = stop
+        self.endpoint = endpoint and count > 1
+        self.sign = math.copysign(1.0, start)
+        self.log_start = math.log(abs(start))
+        divisions = count - 1 if endpoint else count
+        self.log_step = (
+            (math.log(abs(stop)) - self.log_start) / divisions if divisions > 0 else 0.0
+        )
+
+    def value(self, index: int) -> float:
+        return self.values(index, index + 1)[0]
+
+    def values(self, start: int, stop: int) -> list[float]:
+        indices = numpy.arange(start, max(start, stop), dtype=numpy.float64)
+        result = self.sign * numpy.exp(self.log_start + indices * self.log_step)
+        if start == 0 and len(result):
+            result[0] = self.start
+        if self.endpoint and stop == self.count and len(result):
+            result[-1] = self.stop
+        return result.tolist()
+
+
+def arange_count(start: float, stop: float, step: float) -> int:
+    if step == 0:
+        raise ValueError("Arange step cannot be zero")
+    if not all(math.isfinite(x) for x in (start, stop, step)):
+        raise ValueError("Arange start, stop and step must be finite")
+    # The count is taken on the decimal values as typed, so that e.g. 0.1 steps
+    # from 0 to 1 give 10 elements, then elements that round onto or past stop
+    # are dropped to keep the range half-open.
+    exact = [Fraction(repr(x)) for x in (start, stop, step)]
+    count = max(math.ceil((exact[1] - exact[0]) / exact[2]), 0)
+    if count > MAX_GRID_SIZE:
+        raise ValueError(f"Arange would have more than {MAX_GRID_SIZE} elements")
+    # The float values are monotonic, so the first one past stop is bisected.
+    return bisect.bisect_left(
+        range(count), True, key=lambda i: (start + i * step - stop) * step >= 0
+    )
+
+
+def _sequence_outputs(
+    values: Sequence[Any], chunk_size: int, chunk_index: int
+) -> tuple[list[Any], int, int]:
+    start, stop = chunk_bounds(len(values), chunk_size, chunk_index)
+    return (
+        list(values[start:stop]),
+        len(values),
+        chunk_count(len(values), chunk_size),
+    )
+
+
+class Range:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "start": ("INT", {"default": 0}),
+                "stop": ("INT", {"default": 10}),
+                "step": ("INT", {"default": 1}),
+                **CHUNK_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("INT", "INT", "INT")
+    RETURN_NAMES = ("values", "count", "chunks")
+    OUTPUT_IS_LIST = (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/sequence"
+
+    def op(
+        self, start: int, stop: int, step: int, chunk_size: int, chunk_index: int
+    ) -> tuple[list[int], int, int]:
+        if step == 0:
+            raise ValueError("Range step cannot be zero")
+        return _sequence_outputs(range(start, stop, step), chunk_size, chunk_index)
+
+
+class Arange:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "start": ("FLOAT", {"default": 0.0, "step": 0.001, "round": False}),
+                "stop": ("FLOAT", {"default": 1.0, "step": 0.001, "round": False}),
+                "step": ("FLOAT", {"default": 0.1, "step": 0.001, "round": False}),
+                **CHUNK_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT", "INT", "INT")
+    RETURN_NAMES = ("values", "count", "chunks")
+    OUTPUT_IS_LIST = (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/sequence"
+
+    def op(
+        self,
+        start: float,
+        stop: float,
+        step: float,
+        chunk_size: int,
+        chunk_index: int,
+    ) -> tuple[list[float], int, int]:
+        sequence = ArithmeticSequence(start, step, arange_count(start, stop, step))
+        return _sequence_outputs(sequence, chunk_size, chunk_index)
+
+
+class Linspace:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "start": ("FLOAT", {"default": 0.0, "step": 0.001, "round": False}),
+                "stop": ("FLOAT", {"default": 1.0, "step": 0.001, "round": False}),
+                "num": ("INT", {"default": 10, "min": 0}),
+                "endpoint": ("BOOLEAN", {"default": True}),
+                **CHUNK_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT", "INT", "INT")
+    RETURN_NAMES = ("values", "count", "chunks")
+    OUTPUT_IS_LIST = (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/sequence"
+
+    def op(
+        self,
+        start: float,
+        stop: float,
+        num: int,
+        endpoint: bool,
+        chunk_size: int,
+        chunk_index: int,
+    ) -> tuple[list[float], int, int]:
+        sequence = LinearSequence(start, stop, num, endpoint)
+        return _sequence_outputs(sequence, chunk_size, chunk_index)
+
+
+class Geomspace:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "start": ("FLOAT", {"default": 1.0, "step": 0.001, "round": False}),
+                "stop": ("FLOAT", {"default": 1000.0, "step": 0.001, "round": False}),
+                "num": ("INT", {"default": 4, "min": 0}),
+                "endpoint": ("BOOLEAN", {"default": True}),
+                **CHUNK_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT", "INT", "INT")
+    RETURN_NAMES = ("values", "count", "chunks")
+    OUTPUT_IS_LIST = (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/sequence"
+
+    def op(
+        self,
+        start: float,
+        stop: float,
+        num: int,
+        endpoint: bool,
+        chunk_size: int,
+        chunk_index: int,
+    ) -> tuple[list[float], int, int]:
+        sequence = GeometricSequence(start, stop, num, endpoint)
+        return _sequence_outputs(sequence, chunk_size, chunk_index)
+
+
+def parse_grid_axis(spec: str) -> Optional[Sequence[Any]]:
+    spec = spec.strip()
+    if not spec:
+        return None
+    try:
+        if ":" in spec:
+            parts = [part.strip() for part in spec.split(":")]
+            if len(parts) == 2:
+                parts.append("1")
+            if len(parts) != 3:
+                raise ValueError("expected start:stop or start:stop:step")
+            try:
+                start, stop, step = (int(part) for part in parts)
+            except ValueError:
+                start, stop, step = (float(part) for part in parts)
+                return ArithmeticSequence(start, step, arange_count(start, stop, step))
+            if step == 0:
+                raise ValueError("step cannot be zero")
+            return range(start, stop, step)
+        tokens = [token.strip() for token in spec.split(",") if token.strip()]
+        try:
+            return [int(token) for token in tokens]
+        except ValueError:
+            return [float(token) for token in tokens]
+    except ValueError as e:
+        raise ValueError(f"Invalid grid axis {spec!r}: {e}") from None
+
+
+def _take(values: Sequence[Any], indices: numpy.ndarray) -> list[Any]:
+    if isinstance(values, range) and max(abs(values.start), abs(values.stop)) < 1 << 62:
+        return (values.start + indices * values.step).tolist()
+    if isinstance(values, ArithmeticSequence):
+        return (values.start + indices.astype(numpy.float64) * values.step).tolist()
+    return [values[i] for i in indices.tolist()]
+
+
+class GridSweep:
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                **{
+                    name: ("STRING", {"default": "1, 2, 3" if name == "x" else ""})
+                    for name in GRID_AXES
+                },
+                **CHUNK_INPUTS,
+            }
+        }
+
+    RETURN_TYPES = ("*",) * len(GRID_AXES) + ("INT", "INT", "INT")
+    RETURN_NAMES = GRID_AXES + ("index", "count", "chunks")
+    OUTPUT_IS_LIST = (True,) * len(GRID_AXES) + (True, False, False)
+    FUNCTION = "op"
+    CATEGORY = "math/sequence"
+
+    def op(
+        self, chunk_size: int, chunk_index: int, **specs: str
+    ) -> tuple[list[Any], ...]:
+        axes = [(name, parse_grid_axis(specs[name])) for name in GRID_AXES]
+        used = [(name, values) for name, values in axes if values is not None]
+        count = math.prod(len(values) for _, values in used) if used else 0
+        if count > MAX_GRID_SIZE:
+            raise ValueError(f"Grid has {count} points, more than {MAX_GRID_SIZE}")
+        start, stop = chunk_bounds(count, chunk_size, chunk_index)
+        # Mixed-radix decoding of the flat indices, the last axis changes
+        # fastest as in itertools.product.
+        remainder = numpy.arange(start, stop, dtype=numpy.int64)
+        columns: dict[str, list[Any]] = {}
+        for name, values in reversed(used):
+            remainder, digits = numpy.divmod(remainder, len(values))
+            columns[name] = _take(values, digits)
+        return (
+            *(columns.get(name, []) for name in GRID_AXES),
+            list(range(start, stop)),
+            count,
+            chunk_count(count, chunk_size),
+        )
+
+
+NODE_CLASS_MAPPINGS = {
+    "CM_Range": Range,
+    "CM_Arange": Arange,
+    "CM_Linspace": Linspace,
+    "CM_Geomspace": Geomspace,
+    "CM_GridSweep": GridSweep,
+}
@@ -0,0 +1,181 @@
+import math
+
+from typing import Callable, Mapping
+
+from .types import Vec2, Vec3, Vec4
+
+
+def _div(a: float, b: float) -> float:
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0.0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def _isclose(a: float, b: float) -> bool:
+    return a == b or abs(a - b) <= 1e-08 + 1e-05 * abs(b) < math.inf
+
+
+def norm2(a: Vec2) -> float:
+    return math.sqrt(a[0] * a[0] + a[1] * a[1])
+
+
+def norm3(a: Vec3) -> float:
+    return math.sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2])
+
+
+def norm4(a: Vec4) -> float:
+    return math.sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2] + a[3] * a[3])
+
+
+def div2(a: Vec2, b: float) -> Vec2:
+    if b:
+        return (a[0] / b, a[1] / b)
+    return (_div(a[0], b), _div(a[1], b))
+
+
+def div3(a: Vec3, b: float) -> Vec3:
+    if b:
+        return (a[0] / b, a[1] / b, a[2] / b)
+    return (_div(a[0], b), _div(a[1], b), _div(a[2], b))
+
+
+def div4(a: Vec4, b: float) -> Vec4:
+    if b:
+        return (a[0] / b, a[1] / b, a[2] / b, a[3] / b)
+    return (_div(a[0], b), _div(a[1], b), _div(a[2], b), _div(a[3], b))
+
+
+def allclose2(a: Vec2, b: Vec2) -> bool:
+    return _isclose(a[0], b[0]) and _isclose(a[1], b[1])
+
+
+def allclose3(a: Vec3, b: Vec3) -> bool:
+    return _isclose(a[0], b[0]) and _isclose(a[1], b[1]) and _isclose(a[2], b[2])
+
+
+def allclose4(a: Vec4, b: Vec4) -> bool:
+    return (
+        _isclose(a[0], b[0])
+        and _isclose(a[1], b[1])
+        and _isclose(a[2], b[2])
+        and _isclose(a[3], b[3])
+    )
+
+
+VEC2_UNARY_KERNELS: Mapping[str, Callable[[Vec2], Vec2]] = {
+    "Neg": lambda a: (-a[0], -a[1]),
+    "Normalize": lambda a: div2(a, norm2(a)),
+}
+
+VEC3_UNARY_KERNELS: Mapping[str, Callable[[Vec3], Vec3]] = {
+    "Neg": lambda a: (-a[0], -a[1], -a[2]),
+    "Normalize": lambda a: div3(a, norm3(a)),
+}
+
+VEC4_UNARY_KERNELS: Mapping[str, Callable[[Vec4], Vec4]] = {
+    "Neg": lambda a: (-a[0], -a[1], -a[2], -a[3]),
+    "Normalize": lambda a: div4(a, norm4(a)),
+}
+
+VEC2_TO_SCALAR_UNARY_KERNELS: Mapping[str, Callable[[Vec2], float]] = {
+    "Norm": norm2,
+}
+
+VEC3_TO_SCALAR_UNARY_KERNELS: Mapping[str, Callable[[Vec3], float]] = {
+    "Norm": norm3,
+}
+
+VEC4_TO_SCALAR_UNARY_KERNELS: Mapping[str, Callable[[Vec4], float]] = {
+    "Norm": norm4,
+}
+
+VEC2_UNARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec2], bool]] = {
+    "IsZero": lambda a: a[0] == 0.0 and a[1] == 0.0,
+    "IsNotZero": lambda a: a[0] != 0.0 or a[1] != 0.0,
+    "IsNormalized": lambda a: allclose2(a, div2(a, norm2(a))),
+    "IsNotNormalized": lambda a: not allclose2(a, div2(a, norm2(a))),
+}
+
+VEC3_UNARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec3], bool]] = {
+    "IsZero": lambda a: a[0] == 0.0 and a[1] == 0.0 and a[2] == 0.0,
+    "IsNotZero": lambda a: a[0] != 0.0 or a[1] != 0.0 or a[2] != 0.0,
+    "IsNormalized": lambda a: allclose3(a, div3(a, norm3(a))),
+    "IsNotNormalized": lambda a: not allclose3(a, div3(a, norm3(a))),
+}
+
+VEC4_UNARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec4], bool]] = {
+    "IsZero": lambda a: a[0] == 0.0 and a[1] == 0.0 and a[2] == 0.0 and a[3] == 0.0,
+    "IsNotZero": lambda a: a[0] != 0.0 or a[1] != 0.0 or a[2] != 0.0 or a[3] != 0.0,
+    "IsNormalized": lambda a: allclose4(a, div4(a, norm4(a))),
+    "IsNotNormalized": lambda a: not allclose4(a, div4(a, norm4(a))),
+}
+
+VEC2_BINARY_KERNELS: Mapping[str, Callable[[Vec2, Vec2], Vec2]] = {
+    "Add": lambda a, b: (a[0] + b[0], a[1] + b[1]),
+    "Sub": lambda a, b: (a[0] - b[0], a[1] - b[1]),
+}
+
+VEC3_BINARY_KERNELS: Mapping[str, Callable[[Vec3, Vec3], Vec3]] = {
+    "Add": lambda a, b: (a[0] + b[0], a[1] + b[1], a[2] + b[2]),
+    "Sub": lambda a, b: (a[0] - b[0], a[1] - b[1], a[2] - b[2]),
+    "Cross": lambda a, b: (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ),
+}
+
+VEC4_BINARY_KERNELS: Mapping[str, Callable[[Vec4, Vec4], Vec4]] = {
+    "Add": lambda a, b: (a[0] + b[0], a[1] + b[1], a[2] + b[2], a[3] + b[3]),
+    "Sub": lambda a, b: (a[0] - b[0], a[1] - b[1], a[2] - b[2], a[3] - b[3]),
+}
+
+VEC2_TO_SCALAR_BINARY_KERNELS: Mapping[str, Callable[[Vec2, Vec2], float]] = {
+    "Dot": lambda a, b: a[0] * b[0] + a[1] * b[1],
+    "Distance": lambda a, b: norm2((a[0] - b[0], a[1] - b[1])),
+}
+
+VEC3_TO_SCALAR_BINARY_KERNELS: Mapping[str, Callable[[Vec3, Vec3], float]] = {
+    "Dot": lambda a, b: a[0] * b[0] + a[1] * b[1] + a[2] * b[2],
+    "Distance": lambda a, b: norm3((a[0] - b[0], a[1] - b[1], a[2] - b[2])),
+}
+
+VEC4_TO_SCALAR_BINARY_KERNELS: Mapping[str, Callable[[Vec4, Vec4], float]] = {
+    "Dot": lambda a, b: a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3],
+    "Distance": lambda a, b: norm4(
+        (a[0] - b[0], a[1] - b[1], a[2] - b[2], a[3] - b[3])
+    ),
+}
+
+VEC2_BINARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec2, Vec2], bool]] = {
+    "Eq": allclose2,
+    "Neq": lambda a, b: not allclose2(a, b),
+}
+
+VEC3_BINARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec3, Vec3], bool]] = {
+    "Eq": allclose3,
+    "Neq": lambda a, b: not allclose3(a, b),
+}
+
+VEC4_BINARY_CONDITION_KERNELS: Mapping[str, Callable[[Vec4, Vec4], bool]] = {
+    "Eq": allclose4,
+    "Neq": lambda a, b: not allclose4(a, b),
+}
+
+VEC2_SCALAR_KERNELS: Mapping[str, Callable[[Vec2, float], Vec2]] = {
+    "Mul": lambda a, b: (a[0] * b, a[1] * b),
+    "Div": div2,
+}
+
+VEC3_SCALAR_KERNELS: Mapping[str, Callable[[Vec3, float], Vec3]] = {
+    "Mul": lambda a, b: (a[0] * b, a[1] * b, a[2] * b),
+    "Div": div3,
+}
+
+VEC4_SCALAR_KERNELS: Mapping[str, Callable[[Vec4, float], Vec4]] = {
+    "Mul": lambda a, b: (a[0] * b, a[1] * b, a[2] * b, a[3] * b),
+    "Div": div4,
+}
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+
+from typing import Any, Callable, Mapping, Union
+
+from .float import DEFAULT_FLOAT
+from .lazy import lazy_import
+
+logger = logging.getLogger(__name__)
+
+try:
+    torch = lazy_import("torch")
+except ModuleNotFoundError:
+    torch = None
+
+TENSOR_TYPES = ("IMAGE", "MASK", "LATENT")
+
+Tensor = Any
+TensorInput = Union[Tensor, Mapping[str, Any]]
+
+
+# Ops made of several torch calls write into the first intermediate they
+# allocate. Inputs are never written, ComfyUI caches them as the outputs of
+# upstream nodes.
+
+
+def _gamma(a: Tensor) -> Tensor:
+    sign = torch.where(a > 0, 1.0, 1.0 - 2.0 * torch.remainder(torch.ceil(-a), 2.0))
+    return torch.lgamma(a).exp_().mul_(sign)
+
+
+def _cube(a: Tensor) -> Tensor:
+    return (a * a).mul_(a)
+
+
+def _log(a: Tensor, b: Tensor) -> Tensor:
+    result = torch.log(a)
+    if result.shape == torch.broadcast_shapes(a.shape, b.shape):
+        return result.div_(torch.log(b))
+    return result / torch.log(b)
+
+
+TENSOR_UNARY_OPERATIONS: Mapping[str, Callable[[Tensor], Tensor]] = {
+    "Neg": lambda a: torch.neg(a),
+    "Inc": lambda a: torch.add(a, 1),
+    "Dec": lambda a: torch.sub(a, 1),
+    "Abs": lambda a: torch.abs(a),
+    "Sqr": lambda a: torch.mul(a, a),
+    "Cube": _cube,
+    "Sqrt": lambda a: torch.sqrt(a),
+    "Exp": lambda a: torch.exp(a),
+    "Ln": lambda a: torch.log(a),
+    "Log10": lambda a: torch.log10(a),
+    "Log2": lambda a: torch.log2(a),
+    "Sin": lambda a: torch.sin(a),
+    "Cos": lambda a: torch.cos(a),
+    "Tan": lambda a: torch.tan(a),
+    "Asin": lambda a: torch.asin(a),
+    "Acos": lambda a: torch.acos(a),
+    "Atan": lambda a: torch.atan(a),
+    "Sinh": lambda a: torch.sinh(a),
+    "Cosh": lambda a: torch.cosh(a),
+    "Tanh": lambda a: torch.tanh(a),
+    "Asinh": lambda a: torch.asinh(a),
+    "Acosh": lambda a: torch.acosh(a),
+    "Atanh": lambda a: torch.atanh(a),
+    "Round": lambda a: torch.round(a),
+    "Floor": lambda a: torch.floor(a),
+    "Ceil": lambda a: torch.ceil(a),
+    "Trunc": lambda a: torch.trunc(a),
+    "Erf": lambda a: torch.erf(a),
+    "Erfc": lambda a: torch.erfc(a),
+    "Gamma": _gamma,
+    "Radians": lambda a: torch.deg2rad(a),
+    "Degrees": lambda a: torch.rad2deg(a),
+}
+
+TENSOR_BINARY_OPERATIONS: Mapping[str, Callable[[Tensor, Tensor], Tensor]] = {
+    "Add": lambda a, b: torch.add(a, b),
+    "Sub": lambda a, b: torch.sub(a, b),
+    "Mul": lambda a, b: torch.mul(a, b),
+    "Div": lambda a, b: torch.div(a, b),
+    "Mod": lambda a, b: torch.remainder(a, b),
+    "Pow": lambda a, b: torch.pow(a, b),
+    "FloorDiv": lambda a, b: torch.floor_divide(a, b),
+    # As max() and min() a NaN is only passed on from a, torch.maximum and
+    # torch.minimum would propagate it from either side.
+    "Max": lambda a, b: torch.where(b > a, b, a),
+    "Min": lambda a, b: torch.where(b < a, b, a),
+    "Log": _log,
+    "Atan2": lambda a, b: torch.atan2(a, b),
+}
+
+
+def _samples(value: TensorInput) -> Tensor:
+    if isinstance(value, Mapping):
+        return value["samples"]
+    return value
+
+
+def _like(template: TensorInput, samples: Tensor) -> TensorInput:
+    if isinstance(template, Mapping):
+        return {**template, "samples": samples}
+    return samples
+
+
+def _scalar(b: float, like: Tensor) -> Tensor:
+    return torch.as_tensor(b, dtype=like.dtype, device=like.device)
+
+
+class TensorNode:
+    TENSOR_TYPE = ""
+    FUNCTION = "op"
+    CATEGORY = "math/tensor"
+
+
+class TensorUnaryOperation(TensorNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(TENSOR_UNARY_OPERATIONS.keys()),),
+                "a": (cls.TENSOR_TYPE,),
+            }
+        }
+
+    def op(self, op: str, a: TensorInput) -> tuple[TensorInput]:
+        return (_like(a, TENSOR_UNARY_OPERATIONS[op](_samples(a))),)
+
+
+class TensorScalarOperation(TensorNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(TENSOR_BINARY_OPERATIONS.keys()),),
+                "a": (cls.TENSOR_TYPE,),
+                "b": DEFAULT_FLOAT,
+            }
+        }
+
+    def op(self, op: str, a: TensorInput, b: float) -> tuple[TensorInput]:
+        samples = _samples(a)
+        return (_like(a, TENSOR_BINARY_OPERATIONS[op](samples, _scalar(b, samples))),)
+
+
+class TensorBinaryOperation(TensorNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(TENSOR_BINARY_OPERATIONS.keys()),),
+                "a": (cls.TENSOR_TYPE,),
+                "b": (cls.TENSOR_TYPE,),
+            }
+        }
+
+    def op(self, op: str, a: TensorInput, b: TensorInput) -> tuple[TensorInput]:
+        a_samples, b_samples = _samples(a), _samples(b)
+        if b_samples.device != a_samples.device:
+            b_samples = b_samples.to(a_samples.device)
+        return (_like(a, TENSOR_BINARY_OPERATIONS[op](a_samples, b_samples)),)
+
+
+def tensor_node_classes(tensor_type: str) -> dict[str, type]:
+    name = tensor_type.capitalize()
+    return {
+        f"CM_{name}{suffix}": type(
+            f"{name}{suffix}",
+            (base,),
+            {"TENSOR_TYPE": tensor_type, "RETURN_TYPES": (tensor_type,)},
+        )
+        for suffix, base in (
+            ("UnaryOperation", TensorUnaryOperation),
+            ("ScalarOperation", TensorScalarOperation),
+            ("BinaryOperation", TensorBinaryOperation),
+        )
+    }
+
+
+NODE_CLASS_MAPPINGS: dict[str, type] = {}
+if torch is not None:
+    NODE_CLASS_MAPPINGS = {
+        name: node_class
+        for tensor_type in TENSOR_TYPES
+        for name, node_class in tensor_node_classes(tensor_type).items()
+    }
+else:
+    logger.info("torch is not installed, the tensor math nodes are disabled")
@@ -7,6 +7,8 @@ if sys.version_info[1] < 10:
     Vec2 = Tuple[float, float]
     Vec3 = Tuple[float, float, float]
     Vec4 = Tuple[float, float, float, float]
+    Mat3 = Tuple[Vec3, Vec3, Vec3]
+    Mat4 = Tuple[Vec4, Vec4, Vec4, Vec4]
 else:
     from typing import TypeAlias
 
@@ -14,3 +16,5 @@ else:
     Vec2: TypeAlias = tuple[float, float]
     Vec3: TypeAlias = tuple[float, float, float]
     Vec4: TypeAlias = tuple[float, float, float, float]
+    Mat3: TypeAlias = tuple[Vec3, Vec3, Vec3]
+    Mat4: TypeAlias = tuple[Vec4, Vec4, Vec4, Vec4]
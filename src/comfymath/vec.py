@@ -1,8 +1,37 @@
-import numpy
-
-from typing import Any, Callable, Mapping
-
-from .types import Vec2, Vec3, Vec4
+from __future__ import annotations
+
+import math
+
+from typing import Any, Mapping, Union
+
+from .lazy import lazy_import
+from .registry import Operation, OperationTable, register
+from .smallvec import (
+    VEC2_UNARY_KERNELS,
+    VEC2_TO_SCALAR_UNARY_KERNELS,
+    VEC2_UNARY_CONDITION_KERNELS,
+    VEC2_BINARY_KERNELS,
+    VEC2_TO_SCALAR_BINARY_KERNELS,
+    VEC2_BINARY_CONDITION_KERNELS,
+    VEC2_SCALAR_KERNELS,
+    VEC3_UNARY_KERNELS,
+    VEC3_TO_SCALAR_UNARY_KERNELS,
+    VEC3_UNARY_CONDITION_KERNELS,
+    VEC3_BINARY_KERNELS,
+    VEC3_TO_SCALAR_BINARY_KERNELS,
+    VEC3_BINARY_CONDITION_KERNELS,
+    VEC3_SCALAR_KERNELS,
+    VEC4_UNARY_KERNELS,
+    VEC4_TO_SCALAR_UNARY_KERNELS,
+    VEC4_UNARY_CONDITION_KERNELS,
+    VEC4_BINARY_KERNELS,
+    VEC4_TO_SCALAR_BINARY_KERNELS,
+    VEC4_BINARY_CONDITION_KERNELS,
+    VEC4_SCALAR_KERNELS,
+)
+from .types import Mat3, Mat4, Vec2, Vec3, Vec4
+
+numpy = lazy_import("numpy")
 
 VEC2_ZERO = (0.0, 0.0)
 DEFAULT_VEC2 = ("VEC2", {"default": VEC2_ZERO})
@@ -13,46 +42,158 @@ DEFAULT_VEC3 = ("VEC3", {"default": VEC3_ZERO})
 VEC4_ZERO = (0.0, 0.0, 0.0, 0.0)
 DEFAULT_VEC4 = ("VEC4", {"default": VEC4_ZERO})
 
-VEC_UNARY_OPERATIONS: Mapping[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
-    "Neg": lambda a: -a,
-    "Normalize": lambda a: a / numpy.linalg.norm(a),
-}
+MAT3_IDENTITY = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+DEFAULT_MAT3 = ("MAT3", {"default": MAT3_IDENTITY})
 
-VEC_TO_SCALAR_UNARY_OPERATION: Mapping[str, Callable[[numpy.ndarray], float]] = {
-    "Norm": lambda a: numpy.linalg.norm(a).astype(float),
-}
+MAT4_IDENTITY = (
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+DEFAULT_MAT4 = ("MAT4", {"default": MAT4_IDENTITY})
 
-VEC_UNARY_CONDITIONS: Mapping[str, Callable[[numpy.ndarray], bool]] = {
-    "IsZero": lambda a: not numpy.any(a).astype(bool),
-    "IsNotZero": lambda a: numpy.any(a).astype(bool),
-    "IsNormalized": lambda a: numpy.allclose(a, a / numpy.linalg.norm(a)),
-    "IsNotNormalized": lambda a: not numpy.allclose(a, a / numpy.linalg.norm(a)),
-}
+# The vectorized variants apply each op to every row of an (N, d) array.
 
-VEC_BINARY_OPERATIONS: Mapping[
-    str, Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]
-] = {
-    "Add": lambda a, b: a + b,
-    "Sub": lambda a, b: a - b,
-    "Cross": lambda a, b: numpy.cross(a, b),
-}
 
-VEC_TO_SCALAR_BINARY_OPERATION: Mapping[
-    str, Callable[[numpy.ndarray, numpy.ndarray], float]
-] = {
-    "Dot": lambda a, b: numpy.dot(a, b),
-    "Distance": lambda a, b: numpy.linalg.norm(a - b).astype(float),
-}
+def _row_norm(a: numpy.ndarray) -> numpy.ndarray:
+    return numpy.sqrt(numpy.einsum("ij,ij->i", a, a))
 
-VEC_BINARY_CONDITIONS: Mapping[str, Callable[[numpy.ndarray, numpy.ndarray], bool]] = {
-    "Eq": lambda a, b: numpy.allclose(a, b),
-    "Neq": lambda a, b: not numpy.allclose(a, b),
-}
 
-VEC_SCALAR_OPERATION: Mapping[str, Callable[[numpy.ndarray, float], numpy.ndarray]] = {
-    "Mul": lambda a, b: a * b,
-    "Div": lambda a, b: a / b,
-}
+def _row_normalize(a: numpy.ndarray) -> numpy.ndarray:
+    return a / _row_norm(a)[:, None]
+
+
+def _row_isclose(a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+    return numpy.isclose(a, b).all(axis=1)
+
+
+VEC_UNARY_OPERATIONS = register(
+    OperationTable(
+        "vec_unary",
+        1,
+        "VEC",
+        "VEC",
+        [
+            Operation("Neg", lambda a: -a, lambda a: -a),
+            Operation("Normalize", lambda a: a / numpy.linalg.norm(a), _row_normalize),
+        ],
+    )
+)
+
+VEC_TO_SCALAR_UNARY_OPERATION = register(
+    OperationTable(
+        "vec_to_scalar_unary",
+        1,
+        "VEC",
+        "FLOAT",
+        [
+            Operation("Norm", lambda a: numpy.linalg.norm(a).astype(float), _row_norm),
+        ],
+    )
+)
+
+VEC_UNARY_CONDITIONS = register(
+    OperationTable(
+        "vec_unary_condition",
+        1,
+        "VEC",
+        "BOOL",
+        [
+            Operation(
+                "IsZero",
+                lambda a: not numpy.any(a).astype(bool),
+                lambda a: ~a.any(axis=1),
+            ),
+            Operation(
+                "IsNotZero",
+                lambda a: numpy.any(a).astype(bool),
+                lambda a: a.any(axis=1),
+            ),
+            Operation(
+                "IsNormalized",
+                lambda a: numpy.allclose(a, a / numpy.linalg.norm(a)),
+                lambda a: _row_isclose(a, _row_normalize(a)),
+            ),
+            Operation(
+                "IsNotNormalized",
+                lambda a: not numpy.allclose(a, a / numpy.linalg.norm(a)),
+                lambda a: ~_row_isclose(a, _row_normalize(a)),
+            ),
+        ],
+    )
+)
+
+VEC_BINARY_OPERATIONS = register(
+    OperationTable(
+        "vec_binary",
+        2,
+        "VEC",
+        "VEC",
+        [
+            Operation("Add", lambda a, b: a + b, lambda a, b: a + b),
+            Operation("Sub", lambda a, b: a - b, lambda a, b: a - b),
+            Operation(
+                "Cross",
+                lambda a, b: numpy.cross(a, b),
+                lambda a, b: numpy.cross(a, b),
+                input_type="VEC3",
+                output_type="VEC3",
+            ),
+        ],
+    )
+)
+
+VEC_TO_SCALAR_BINARY_OPERATION = register(
+    OperationTable(
+        "vec_to_scalar_binary",
+        2,
+        "VEC",
+        "FLOAT",
+        [
+            Operation(
+                "Dot",
+                lambda a, b: numpy.dot(a, b),
+                lambda a, b: numpy.einsum("ij,ij->i", *numpy.broadcast_arrays(a, b)),
+            ),
+            Operation(
+                "Distance",
+                lambda a, b: numpy.linalg.norm(a - b).astype(float),
+                lambda a, b: _row_norm(a - b),
+            ),
+        ],
+    )
+)
+
+VEC_BINARY_CONDITIONS = register(
+    OperationTable(
+        "vec_binary_condition",
+        2,
+        "VEC",
+        "BOOL",
+        [
+            Operation("Eq", lambda a, b: numpy.allclose(a, b), _row_isclose),
+            Operation(
+                "Neq",
+                lambda a, b: not numpy.allclose(a, b),
+                lambda a, b: ~_row_isclose(a, b),
+            ),
+        ],
+    )
+)
+
+VEC_SCALAR_OPERATION = register(
+    OperationTable(
+        "vec_scalar",
+        2,
+        "VEC",
+        "VEC",
+        [
+            Operation("Mul", lambda a, b: a * b, lambda a, b: a * b),
+            Operation("Div", lambda a, b: a / b, lambda a, b: a / b),
+        ],
+    )
+)
 
 
 def _vec2_from_numpy(a: numpy.ndarray) -> Vec2:
@@ -94,6 +235,9 @@ class Vec2UnaryOperation:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2) -> tuple[Vec2]:
+        kernel = VEC2_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (_vec2_from_numpy(VEC_UNARY_OPERATIONS[op](numpy.array(a))),)
 
 
@@ -112,6 +256,9 @@ class Vec2ToScalarUnaryOperation:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2) -> tuple[float]:
+        kernel = VEC2_TO_SCALAR_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_TO_SCALAR_UNARY_OPERATION[op](numpy.array(a)),)
 
 
@@ -130,6 +277,9 @@ class Vec2UnaryCondition:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2) -> tuple[bool]:
+        kernel = VEC2_UNARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_UNARY_CONDITIONS[op](numpy.array(a)),)
 
 
@@ -138,7 +288,7 @@ class Vec2BinaryOperation:
     def INPUT_TYPES(cls) -> Mapping[str, Any]:
         return {
             "required": {
-                "op": (list(VEC_BINARY_OPERATIONS.keys()),),
+                "op": (VEC_BINARY_OPERATIONS.accepting("VEC2"),),
                 "a": DEFAULT_VEC2,
                 "b": DEFAULT_VEC2,
             }
@@ -149,6 +299,9 @@ class Vec2BinaryOperation:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2, b: Vec2) -> tuple[Vec2]:
+        kernel = VEC2_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (
             _vec2_from_numpy(VEC_BINARY_OPERATIONS[op](numpy.array(a), numpy.array(b))),
         )
@@ -170,6 +323,9 @@ class Vec2ToScalarBinaryOperation:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2, b: Vec2) -> tuple[float]:
+        kernel = VEC2_TO_SCALAR_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_TO_SCALAR_BINARY_OPERATION[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -189,6 +345,9 @@ class Vec2BinaryCondition:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2, b: Vec2) -> tuple[bool]:
+        kernel = VEC2_BINARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_BINARY_CONDITIONS[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -208,6 +367,9 @@ class Vec2ScalarOperation:
     CATEGORY = "math/vec2"
 
     def op(self, op: str, a: Vec2, b: float) -> tuple[Vec2]:
+        kernel = VEC2_SCALAR_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (_vec2_from_numpy(VEC_SCALAR_OPERATION[op](numpy.array(a), b)),)
 
 
@@ -226,6 +388,9 @@ class Vec3UnaryOperation:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3) -> tuple[Vec3]:
+        kernel = VEC3_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (_vec3_from_numpy(VEC_UNARY_OPERATIONS[op](numpy.array(a))),)
 
 
@@ -244,6 +409,9 @@ class Vec3ToScalarUnaryOperation:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3) -> tuple[float]:
+        kernel = VEC3_TO_SCALAR_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_TO_SCALAR_UNARY_OPERATION[op](numpy.array(a)),)
 
 
@@ -262,6 +430,9 @@ class Vec3UnaryCondition:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3) -> tuple[bool]:
+        kernel = VEC3_UNARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_UNARY_CONDITIONS[op](numpy.array(a)),)
 
 
@@ -270,7 +441,7 @@ class Vec3BinaryOperation:
     def INPUT_TYPES(cls) -> Mapping[str, Any]:
         return {
             "required": {
-                "op": (list(VEC_BINARY_OPERATIONS.keys()),),
+                "op": (VEC_BINARY_OPERATIONS.accepting("VEC3"),),
                 "a": DEFAULT_VEC3,
                 "b": DEFAULT_VEC3,
             }
@@ -281,6 +452,9 @@ class Vec3BinaryOperation:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3, b: Vec3) -> tuple[Vec3]:
+        kernel = VEC3_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (
             _vec3_from_numpy(VEC_BINARY_OPERATIONS[op](numpy.array(a), numpy.array(b))),
         )
@@ -302,6 +476,9 @@ class Vec3ToScalarBinaryOperation:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3, b: Vec3) -> tuple[float]:
+        kernel = VEC3_TO_SCALAR_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_TO_SCALAR_BINARY_OPERATION[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -321,6 +498,9 @@ class Vec3BinaryCondition:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3, b: Vec3) -> tuple[bool]:
+        kernel = VEC3_BINARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_BINARY_CONDITIONS[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -340,6 +520,9 @@ class Vec3ScalarOperation:
     CATEGORY = "math/vec3"
 
     def op(self, op: str, a: Vec3, b: float) -> tuple[Vec3]:
+        kernel = VEC3_SCALAR_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (_vec3_from_numpy(VEC_SCALAR_OPERATION[op](numpy.array(a), b)),)
 
 
@@ -358,6 +541,9 @@ class Vec4UnaryOperation:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4) -> tuple[Vec4]:
+        kernel = VEC4_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (_vec4_from_numpy(VEC_UNARY_OPERATIONS[op](numpy.array(a))),)
 
 
@@ -376,6 +562,9 @@ class Vec4ToScalarUnaryOperation:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4) -> tuple[float]:
+        kernel = VEC4_TO_SCALAR_UNARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_TO_SCALAR_UNARY_OPERATION[op](numpy.array(a)),)
 
 
@@ -394,6 +583,9 @@ class Vec4UnaryCondition:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4) -> tuple[bool]:
+        kernel = VEC4_UNARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a),)
         return (VEC_UNARY_CONDITIONS[op](numpy.array(a)),)
 
 
@@ -402,7 +594,7 @@ class Vec4BinaryOperation:
     def INPUT_TYPES(cls) -> Mapping[str, Any]:
         return {
             "required": {
-                "op": (list(VEC_BINARY_OPERATIONS.keys()),),
+                "op": (VEC_BINARY_OPERATIONS.accepting("VEC4"),),
                 "a": DEFAULT_VEC4,
                 "b": DEFAULT_VEC4,
             }
@@ -413,6 +605,9 @@ class Vec4BinaryOperation:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4, b: Vec4) -> tuple[Vec4]:
+        kernel = VEC4_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (
             _vec4_from_numpy(VEC_BINARY_OPERATIONS[op](numpy.array(a), numpy.array(b))),
         )
@@ -434,6 +629,9 @@ class Vec4ToScalarBinaryOperation:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4, b: Vec4) -> tuple[float]:
+        kernel = VEC4_TO_SCALAR_BINARY_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_TO_SCALAR_BINARY_OPERATION[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -453,6 +651,9 @@ class Vec4BinaryCondition:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4, b: Vec4) -> tuple[bool]:
+        kernel = VEC4_BINARY_CONDITION_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (VEC_BINARY_CONDITIONS[op](numpy.array(a), numpy.array(b)),)
 
 
@@ -472,9 +673,316 @@ class Vec4ScalarOperation:
     CATEGORY = "math/vec4"
 
     def op(self, op: str, a: Vec4, b: float) -> tuple[Vec4]:
+        kernel = VEC4_SCALAR_KERNELS.get(op)
+        if kernel is not None:
+            return (kernel(a, b),)
         return (_vec4_from_numpy(VEC_SCALAR_OPERATION[op](numpy.array(a), b)),)
 
 
+def as_matrix(a: Any, dimensions: int) -> numpy.ndarray:
+    matrix = numpy.asarray(a, dtype=numpy.float64)
+    if matrix.shape != (dimensions, dimensions):
+        raise ValueError(
+            f"Expected a {dimensions}x{dimensions} matrix, got shape {matrix.shape}"
+        )
+    return matrix
+
+
+def _mat_from_numpy(a: numpy.ndarray) -> Union[Mat3, Mat4]:
+    return tuple(tuple(row) for row in a.tolist())
+
+
+def _inverse(a: numpy.ndarray) -> numpy.ndarray:
+    try:
+        return numpy.linalg.inv(a)
+    except numpy.linalg.LinAlgError:
+        raise ValueError("Matrix is singular and has no inverse") from None
+
+
+MAT_UNARY_OPERATIONS = register(
+    OperationTable(
+        "mat_unary",
+        1,
+        "MAT",
+        "MAT",
+        [
+            Operation("Transpose", lambda a: a.T),
+            Operation("Inverse", _inverse),
+            Operation("Neg", lambda a: -a),
+        ],
+    )
+)
+
+MAT_TO_SCALAR_UNARY_OPERATION = register(
+    OperationTable(
+        "mat_to_scalar_unary",
+        1,
+        "MAT",
+        "FLOAT",
+        [
+            Operation("Determinant", lambda a: float(numpy.linalg.det(a))),
+            Operation("Trace", lambda a: float(numpy.trace(a))),
+        ],
+    )
+)
+
+MAT_BINARY_OPERATIONS = register(
+    OperationTable(
+        "mat_binary",
+        2,
+        "MAT",
+        "MAT",
+        [
+            Operation("Mul", lambda a, b: a @ b),
+            Operation("Add", lambda a, b: a + b),
+            Operation("Sub", lambda a, b: a - b),
+        ],
+    )
+)
+
+
+def _unit(a: numpy.ndarray, name: str) -> numpy.ndarray:
+    norm = numpy.linalg.norm(a)
+    if norm == 0 or not math.isfinite(norm):
+        raise ValueError(f"{name} must be a finite, non-zero vector")
+    return a / norm
+
+
+def _homogeneous(a: numpy.ndarray, dimensions: int) -> numpy.ndarray:
+    if dimensions == 3:
+        return a
+    matrix = numpy.eye(4)
+    matrix[:3, :3] = a
+    return matrix
+
+
+def rotation_matrix(axis: Vec3, degrees: float) -> numpy.ndarray:
+    x, y, z = _unit(numpy.asarray(axis, dtype=numpy.float64), "Rotation axis")
+    theta = math.radians(degrees)
+    c, s = math.cos(theta), math.sin(theta)
+    t = 1.0 - c
+    return numpy.array(
+        [
+            [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+        ]
+    )
+
+
+def translation_matrix(offset: Vec3) -> numpy.ndarray:
+    matrix = numpy.eye(4)
+    matrix[:3, 3] = offset
+    return matrix
+
+
+def look_at_matrix(eye: Vec3, target: Vec3, up: Vec3) -> numpy.ndarray:
+    position = numpy.asarray(eye, dtype=numpy.float64)
+    forward = _unit(
+        numpy.asarray(target, dtype=numpy.float64) - position, "target - eye"
+    )
+    side = _unit(numpy.cross(forward, up), "Up vector parallel to the view direction")
+    matrix = numpy.eye(4)
+    matrix[0, :3] = side
+    matrix[1, :3] = numpy.cross(side, forward)
+    matrix[2, :3] = -forward
+    matrix[:3, 3] = -matrix[:3, :3] @ position
+    return matrix
+
+
+# Both transforms take an (N, d) array of row vectors and apply the matrix to
+# all of them with a single matmul.
+
+
+def transform_vectors(matrix: numpy.ndarray, a: numpy.ndarray) -> numpy.ndarray:
+    return a @ matrix.T
+
+
+def transform_points(matrix: numpy.ndarray, a: numpy.ndarray) -> numpy.ndarray:
+    homogeneous = a @ matrix[:, :3].T + matrix[:, 3]
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return homogeneous[:, :3] / homogeneous[:, 3:]
+
+
+class MatNode:
+    DIMENSIONS = 0
+    FUNCTION = "op"
+
+    @classmethod
+    def default(cls) -> tuple[str, dict[str, Any]]:
+        return DEFAULT_MAT3 if cls.DIMENSIONS == 3 else DEFAULT_MAT4
+
+
+class MatUnaryOperation(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(MAT_UNARY_OPERATIONS.keys()),),
+                "a": cls.default(),
+            }
+        }
+
+    def op(self, op: str, a: Union[Mat3, Mat4]) -> tuple[Union[Mat3, Mat4]]:
+        a = as_matrix(a, self.DIMENSIONS)
+        return (_mat_from_numpy(MAT_UNARY_OPERATIONS[op](a)),)
+
+
+class MatToScalarUnaryOperation(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(MAT_TO_SCALAR_UNARY_OPERATION.keys()),),
+                "a": cls.default(),
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT",)
+
+    def op(self, op: str, a: Union[Mat3, Mat4]) -> tuple[float]:
+        a = as_matrix(a, self.DIMENSIONS)
+        return (MAT_TO_SCALAR_UNARY_OPERATION[op](a),)
+
+
+class MatBinaryOperation(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(MAT_BINARY_OPERATIONS.keys()),),
+                "a": cls.default(),
+                "b": cls.default(),
+            }
+        }
+
+    def op(
+        self, op: str, a: Union[Mat3, Mat4], b: Union[Mat3, Mat4]
+    ) -> tuple[Union[Mat3, Mat4]]:
+        a, b = as_matrix(a, self.DIMENSIONS), as_matrix(b, self.DIMENSIONS)
+        return (_mat_from_numpy(MAT_BINARY_OPERATIONS[op](a, b)),)
+
+
+class MatRotate(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "axis": ("VEC3", {"default": (0.0, 0.0, 1.0)}),
+                "degrees": ("FLOAT", {"default": 0.0, "step": 0.1, "round": False}),
+            }
+        }
+
+    def op(self, axis: Vec3, degrees: float) -> tuple[Union[Mat3, Mat4]]:
+        matrix = rotation_matrix(axis, degrees)
+        return (_mat_from_numpy(_homogeneous(matrix, self.DIMENSIONS)),)
+
+
+class MatScale(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"scale": ("VEC3", {"default": (1.0, 1.0, 1.0)})}}
+
+    def op(self, scale: Vec3) -> tuple[Union[Mat3, Mat4]]:
+        matrix = numpy.diag(numpy.asarray(scale, dtype=numpy.float64))
+        return (_mat_from_numpy(_homogeneous(matrix, self.DIMENSIONS)),)
+
+
+class MatTransformVec(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "a": cls.default(),
+                "v": (f"VEC{cls.DIMENSIONS}",),
+            }
+        }
+
+    def op(self, a: Union[Mat3, Mat4], v: Union[Vec3, Vec4]) -> tuple[Any]:
+        a = as_matrix(a, self.DIMENSIONS)
+        result = transform_vectors(a, numpy.asarray([v], dtype=numpy.float64))
+        return (tuple(result[0].tolist()),)
+
+
+class Mat4Translate(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"offset": DEFAULT_VEC3}}
+
+    DIMENSIONS = 4
+    RETURN_TYPES = ("MAT4",)
+    CATEGORY = "math/mat4"
+
+    def op(self, offset: Vec3) -> tuple[Mat4]:
+        return (_mat_from_numpy(translation_matrix(offset)),)
+
+
+class Mat4LookAt(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "eye": ("VEC3", {"default": (0.0, 0.0, 1.0)}),
+                "target": DEFAULT_VEC3,
+                "up": ("VEC3", {"default": (0.0, 1.0, 0.0)}),
+            }
+        }
+
+    DIMENSIONS = 4
+    RETURN_TYPES = ("MAT4",)
+    CATEGORY = "math/mat4"
+
+    def op(self, eye: Vec3, target: Vec3, up: Vec3) -> tuple[Mat4]:
+        return (_mat_from_numpy(look_at_matrix(eye, target, up)),)
+
+
+class Mat4TransformVec3(MatNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"a": DEFAULT_MAT4, "v": DEFAULT_VEC3}}
+
+    DIMENSIONS = 4
+    RETURN_TYPES = ("VEC3",)
+    CATEGORY = "math/mat4"
+
+    def op(self, a: Mat4, v: Vec3) -> tuple[Vec3]:
+        a = as_matrix(a, 4)
+        result = transform_points(a, numpy.asarray([v], dtype=numpy.float64))
+        return (_vec3_from_numpy(result[0]),)
+
+
+def matrix_node_classes(dimensions: int) -> dict[str, type]:
+    mat_type = f"MAT{dimensions}"
+    nodes: dict[str, tuple[type, dict[str, Any]]] = {
+        "UnaryOperation": (MatUnaryOperation, {"RETURN_TYPES": (mat_type,)}),
+        "ToScalarUnaryOperation": (MatToScalarUnaryOperation, {}),
+        "BinaryOperation": (MatBinaryOperation, {"RETURN_TYPES": (mat_type,)}),
+        "Rotate": (MatRotate, {"RETURN_TYPES": (mat_type,)}),
+        "Scale": (MatScale, {"RETURN_TYPES": (mat_type,)}),
+        f"TransformVec{dimensions}": (
+            MatTransformVec,
+            {"RETURN_TYPES": (f"VEC{dimensions}",)},
+        ),
+    }
+    classes = {
+        f"CM_Mat{dimensions}{suffix}": type(
+            f"Mat{dimensions}{suffix}",
+            (base,),
+            {
+                "DIMENSIONS": dimensions,
+                "CATEGORY": f"math/mat{dimensions}",
+                **attributes,
+            },
+        )
+        for suffix, (base, attributes) in nodes.items()
+    }
+    if dimensions == 4:
+        classes["CM_Mat4Translate"] = Mat4Translate
+        classes["CM_Mat4LookAt"] = Mat4LookAt
+        classes["CM_Mat4TransformVec3"] = Mat4TransformVec3
+    return classes
+
+
 NODE_CLASS_MAPPINGS = {
     "CM_Vec2UnaryOperation": Vec2UnaryOperation,
     "CM_Vec2UnaryCondition": Vec2UnaryCondition,
@@ -497,4 +1005,6 @@ NODE_CLASS_MAPPINGS = {
     "CM_Vec4BinaryCondition": Vec4BinaryCondition,
     "CM_Vec4ToScalarBinaryOperation": Vec4ToScalarBinaryOperation,
     "CM_Vec4ScalarOperation": Vec4ScalarOperation,
+    **matrix_node_classes(3),
+    **matrix_node_classes(4),
 }
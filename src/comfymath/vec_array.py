@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+from .float import DEFAULT_FLOAT
+from .lazy import lazy_import
+from .vec import (
+    VEC_BINARY_CONDITIONS,
+    VEC_BINARY_OPERATIONS,
+    VEC_SCALAR_OPERATION,
+    VEC_TO_SCALAR_BINARY_OPERATION,
+    VEC_TO_SCALAR_UNARY_OPERATION,
+    VEC_UNARY_CONDITIONS,
+    VEC_UNARY_OPERATIONS,
+    as_matrix,
+    transform_points,
+    transform_vectors,
+)
+from .vectorize import broadcast_lists
+
+numpy = lazy_import("numpy")
+
+VEC_ARRAY_COMPONENTS = ("x", "y", "z", "w")
+
+
+VEC_ARRAY_UNARY_OPERATIONS = VEC_UNARY_OPERATIONS.vectorized()
+VEC_ARRAY_TO_SCALAR_UNARY_OPERATION = VEC_TO_SCALAR_UNARY_OPERATION.vectorized()
+VEC_ARRAY_UNARY_CONDITIONS = VEC_UNARY_CONDITIONS.vectorized()
+VEC_ARRAY_BINARY_OPERATIONS = VEC_BINARY_OPERATIONS.vectorized()
+VEC_ARRAY_TO_SCALAR_BINARY_OPERATION = VEC_TO_SCALAR_BINARY_OPERATION.vectorized()
+VEC_ARRAY_BINARY_CONDITIONS = VEC_BINARY_CONDITIONS.vectorized()
+VEC_ARRAY_SCALAR_OPERATION = VEC_SCALAR_OPERATION.vectorized()
+
+
+def as_vec_array(a: Any, dimensions: int) -> numpy.ndarray:
+    array = numpy.ascontiguousarray(a, dtype=numpy.float64)
+    if array.ndim == 1 and array.size == dimensions:
+        array = array.reshape(1, dimensions)
+    if array.ndim != 2 or array.shape[1] != dimensions:
+        raise ValueError(
+            f"Expected an array of shape (N, {dimensions}), got {array.shape}"
+        )
+    return array
+
+
+def _check_rows(a: numpy.ndarray, b: numpy.ndarray) -> None:
+    if len(a) != len(b) and len(a) != 1 and len(b) != 1:
+        raise ValueError(f"Cannot combine arrays of {len(a)} and {len(b)} vectors")
+
+
+class VecArrayNode:
+    DIMENSIONS = 0
+    FUNCTION = "op"
+
+    @classmethod
+    def type_name(cls) -> str:
+        return f"VEC{cls.DIMENSIONS}_ARRAY"
+
+
+class VecArrayUnaryOperation(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_UNARY_OPERATIONS.keys()),),
+                "a": (cls.type_name(),),
+            }
+        }
+
+    def op(self, op: str, a: numpy.ndarray) -> tuple[numpy.ndarray]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return (VEC_ARRAY_UNARY_OPERATIONS[op](a),)
+
+
+class VecArrayToScalarUnaryOperation(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_TO_SCALAR_UNARY_OPERATION.keys()),),
+                "a": (cls.type_name(),),
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT",)
+    OUTPUT_IS_LIST = (True,)
+
+    def op(self, op: str, a: numpy.ndarray) -> tuple[list[float]]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        return (VEC_ARRAY_TO_SCALAR_UNARY_OPERATION[op](a).tolist(),)
+
+
+class VecArrayUnaryCondition(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_UNARY_CONDITIONS.keys()),),
+                "a": (cls.type_name(),),
+            }
+        }
+
+    RETURN_TYPES = ("BOOL",)
+    OUTPUT_IS_LIST = (True,)
+
+    def op(self, op: str, a: numpy.ndarray) -> tuple[list[bool]]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return (VEC_ARRAY_UNARY_CONDITIONS[op](a).tolist(),)
+
+
+class VecArrayBinaryOperation(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (VEC_BINARY_OPERATIONS.accepting(f"VEC{cls.DIMENSIONS}"),),
+                "a": (cls.type_name(),),
+                "b": (cls.type_name(),),
+            }
+        }
+
+    def op(self, op: str, a: numpy.ndarray, b: numpy.ndarray) -> tuple[numpy.ndarray]:
+        a, b = as_vec_array(a, self.DIMENSIONS), as_vec_array(b, self.DIMENSIONS)
+        _check_rows(a, b)
+        return (VEC_ARRAY_BINARY_OPERATIONS[op](a, b),)
+
+
+class VecArrayToScalarBinaryOperation(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_TO_SCALAR_BINARY_OPERATION.keys()),),
+                "a": (cls.type_name(),),
+                "b": (cls.type_name(),),
+            }
+        }
+
+    RETURN_TYPES = ("FLOAT",)
+    OUTPUT_IS_LIST = (True,)
+
+    def op(self, op: str, a: numpy.ndarray, b: numpy.ndarray) -> tuple[list[float]]:
+        a, b = as_vec_array(a, self.DIMENSIONS), as_vec_array(b, self.DIMENSIONS)
+        _check_rows(a, b)
+        return (VEC_ARRAY_TO_SCALAR_BINARY_OPERATION[op](a, b).tolist(),)
+
+
+class VecArrayBinaryCondition(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_BINARY_CONDITIONS.keys()),),
+                "a": (cls.type_name(),),
+                "b": (cls.type_name(),),
+            }
+        }
+
+    RETURN_TYPES = ("BOOL",)
+    OUTPUT_IS_LIST = (True,)
+
+    def op(self, op: str, a: numpy.ndarray, b: numpy.ndarray) -> tuple[list[bool]]:
+        a, b = as_vec_array(a, self.DIMENSIONS), as_vec_array(b, self.DIMENSIONS)
+        _check_rows(a, b)
+        return (VEC_ARRAY_BINARY_CONDITIONS[op](a, b).tolist(),)
+
+
+class VecArrayScalarOperation(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "op": (list(VEC_ARRAY_SCALAR_OPERATION.keys()),),
+                "a": (cls.type_name(),),
+                "b": ("FLOAT",),
+            }
+        }
+
+    def op(self, op: str, a: numpy.ndarray, b: float) -> tuple[numpy.ndarray]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return (VEC_ARRAY_SCALAR_OPERATION[op](a, b),)
+
+
+class VecListToArray(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"a": (f"VEC{cls.DIMENSIONS}",)}}
+
+    INPUT_IS_LIST = True
+
+    def op(self, a: Sequence[Sequence[float]]) -> tuple[numpy.ndarray]:
+        array = numpy.array(a, dtype=numpy.float64).reshape(-1, self.DIMENSIONS)
+        return (array,)
+
+
+class VecArrayToList(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"a": (cls.type_name(),)}}
+
+    OUTPUT_IS_LIST = (True,)
+
+    def op(self, a: numpy.ndarray) -> tuple[list[tuple[float, ...]]]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        return ([tuple(row) for row in a.tolist()],)
+
+
+class ComposeVecArray(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                name: DEFAULT_FLOAT for name in VEC_ARRAY_COMPONENTS[: cls.DIMENSIONS]
+            }
+        }
+
+    INPUT_IS_LIST = True
+
+    def op(self, **components: Sequence[float]) -> tuple[numpy.ndarray]:
+        columns = broadcast_lists(
+            *(components[name] for name in VEC_ARRAY_COMPONENTS[: self.DIMENSIONS])
+        )
+        array = numpy.array(columns, dtype=numpy.float64).T
+        return (numpy.ascontiguousarray(array).reshape(-1, self.DIMENSIONS),)
+
+
+class SplitVecArray(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"a": (cls.type_name(),)}}
+
+    def op(self, a: numpy.ndarray) -> tuple[list[float], ...]:
+        a = as_vec_array(a, self.DIMENSIONS)
+        return tuple(a[:, i].tolist() for i in range(self.DIMENSIONS))
+
+
+class MatTransformVecArray(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {
+            "required": {
+                "a": (f"MAT{cls.DIMENSIONS}",),
+                "v": (cls.type_name(),),
+            }
+        }
+
+    def op(self, a: Any, v: numpy.ndarray) -> tuple[numpy.ndarray]:
+        a = as_matrix(a, self.DIMENSIONS)
+        v = as_vec_array(v, self.DIMENSIONS)
+        return (numpy.ascontiguousarray(transform_vectors(a, v)),)
+
+
+class Mat4TransformVec3Array(VecArrayNode):
+    @classmethod
+    def INPUT_TYPES(cls) -> Mapping[str, Any]:
+        return {"required": {"a": ("MAT4",), "v": ("VEC3_ARRAY",)}}
+
+    DIMENSIONS = 3
+    RETURN_TYPES = ("VEC3_ARRAY",)
+    CATEGORY = "math/mat4"
+
+    def op(self, a: Any, v: numpy.ndarray) -> tuple[numpy.ndarray]:
+        a = as_matrix(a, 4)
+        v = as_vec_array(v, 3)
+        return (numpy.ascontiguousarray(transform_points(a, v)),)
+
+
+def dimension_node_classes(dimensions: int) -> dict[str, type]:
+    array_type = f"VEC{dimensions}_ARRAY"
+    components = VEC_ARRAY_COMPONENTS[:dimensions]
+    nodes: dict[str, tuple[type, dict[str, Any]]] = {
+        "UnaryOperation": (VecArrayUnaryOperation, {"RETURN_TYPES": (array_type,)}),
+        "UnaryCondition": (VecArrayUnaryCondition, {}),
+        "ToScalarUnaryOperation": (VecArrayToScalarUnaryOperation, {}),
+        "BinaryOperation": (VecArrayBinaryOperation, {"RETURN_TYPES": (array_type,)}),
+        "BinaryCondition": (VecArrayBinaryCondition, {}),
+        "ToScalarBinaryOperation": (VecArrayToScalarBinaryOperation, {}),
+        "ScalarOperation": (VecArrayScalarOperation, {"RETURN_TYPES": (array_type,)}),
+        "Compose": (ComposeVecArray, {"RETURN_TYPES": (array_type,)}),
+        "ToList": (VecArrayToList, {"RETURN_TYPES": (f"VEC{dimensions}",)}),
+        "Split": (
+            SplitVecArray,
+            {
+                "RETURN_TYPES": ("FLOAT",) * dimensions,
+                "RETURN_NAMES": components,
+                "OUTPUT_IS_LIST": (True,) * dimensions,
+            },
+        ),
+    }
+    classes = {
+        f"CM_Vec{dimensions}Array{suffix}": type(
+            f"Vec{dimensions}Array{suffix}",
+            (base,),
+            {
+                "DIMENSIONS": dimensions,
+                "CATEGORY": f"math/vec{dimensions}",
+                **attributes,
+            },
+        )
+        for suffix, (base, attributes) in nodes.items()
+    }
+    classes[f"CM_Vec{dimensions}ListToArray"] = type(
+        f"Vec{dimensions}ListToArray",
+        (VecListToArray,),
+        {
+            "DIMENSIONS": dimensions,
+            "CATEGORY": f"math/vec{dimensions}",
+            "RETURN_TYPES": (array_type,),
+        },
+    )
+    if dimensions in (3, 4):
+        classes[f"CM_Mat{dimensions}TransformVec{dimensions}Array"] = type(
+            f"Mat{dimensions}TransformVec{dimensions}Array",
+            (MatTransformVecArray,),
+            {
+                "DIMENSIONS": dimensions,
+                "CATEGORY": f"math/mat{dimensions}",
+                "RETURN_TYPES": (array_type,),
+            },
+        )
+    if dimensions == 3:
+        classes["CM_Mat4TransformVec3Array"] = Mat4TransformVec3Array
+    return classes
+
+
+NODE_CLASS_MAPPINGS = {
+    name: node_class
+    for dimensions in (2, 3, 4)
+    for name, node_class in dimension_node_classes(dimensions).items()
+}
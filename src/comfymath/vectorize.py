@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Sequence
+
+from .lazy import lazy_import
+
+numpy = lazy_import("numpy")
+
+
+def broadcast_lists(*lists: Sequence[Any]) -> list[list[Any]]:
+    if any(len(values) == 0 for values in lists):
+        return [[] for _ in lists]
+    length = max(len(values) for values in lists)
+    return [list(values) + [values[-1]] * (length - len(values)) for values in lists]
+
+
+def _to_list(result: Any) -> list[Any]:
+    if isinstance(result, numpy.ndarray):
+        return result.tolist()
+    return list(result)
+
+
+def map_unary(
+    op: str,
+    vectorized: Mapping[str, Callable[[numpy.ndarray], Any]],
+    scalar: Mapping[str, Callable[[float], Any]],
+    a: Sequence[float],
+) -> list[Any]:
+    values = numpy.asarray(a, dtype=numpy.float64)
+    func = vectorized.get(op)
+    if func is not None:
+        try:
+            with numpy.errstate(divide="raise", over="raise", invalid="raise"):
+                return _to_list(func(values))
+        except FloatingPointError:
+            pass
+    return [scalar[op](x) for x in values.tolist()]
+
+
+def map_binary(
+    op: str,
+    vectorized: Mapping[str, Callable[[numpy.ndarray, numpy.ndarray], Any]],
+    scalar: Mapping[str, Callable[[float, float], Any]],
+    a: Sequence[float],
+    b: Sequence[float],
+) -> list[Any]:
+    if len(a) == 1 or len(b) == 1 or len(a) == len(b):
+        a_values = numpy.asarray(a, dtype=numpy.float64)
+        b_values = numpy.asarray(b, dtype=numpy.float64)
+    else:
+        a_list, b_list = broadcast_lists(a, b)
+        a_values = numpy.asarray(a_list, dtype=numpy.float64)
+        b_values = numpy.asarray(b_list, dtype=numpy.float64)
+    if a_values.size == 0 or b_values.size == 0:
+        return []
+    func = vectorized.get(op)
+    if func is not None:
+        try:
+            with numpy.errstate(divide="raise", over="raise", invalid="raise"):
+                return _to_list(func(a_values, b_values))
+        except FloatingPointError:
+            pass
+    a_values, b_values = numpy.broadcast_arrays(a_values, b_values)
+    return [scalar[op](x, y) for x, y in zip(a_values.tolist(), b_values.tolist())]